@@ -1,544 +1,503 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
+import functools
+import hashlib
 
-# =========================================
-# 0. 기본 설정
-# =========================================
-st.set_page_config(
-    page_title="HR 인사이트 대시보드",
-    layout="wide"
-)
+import altair as alt
+import streamlit as st
 
-st.title("👥 HR 인사이트 대시보드")
+from hr_core import analysis as hr_analysis
+from hr_core import anomaly as hr_anomaly
+from hr_core import downsample as hr_downsample
+from hr_core import lru as hr_lru
+from hr_core import profiling as hr_profiling
+from hr_core import retention as hr_retention
+from hr_core import risk as hr_risk
+from hr_core import schema as hr_schema
+from hr_core import survival as hr_survival
+from hr_core import tables as hr_tables
+from hr_core import units as hr_units
+from hr_core import warmup as hr_warmup
 
 # =========================================
 # 1. 데이터 로딩 함수
 # =========================================
-@st.cache_data
-def load_data():
-    # 같은 폴더의 company_hr_data.xlsx 읽기
-    xls = pd.ExcelFile("company_hr_data.xlsx")
-    df_change = pd.read_excel(xls, "인원변동")
-    df_turnover = pd.read_excel(xls, "퇴사율")
-    df_retention = pd.read_excel(xls, "잔존율")
-    df_tenure = pd.read_excel(xls, "근속")
-    return df_change, df_turnover, df_retention, df_tenure
-
-# =========================================
-# 2. 유틸리티 함수들
-# =========================================
-def to_month_period(series):
-    """월 컬럼을 연-월 형태로 통일"""
-    return pd.to_datetime(series).dt.to_period("M").astype(str)
-
-# =========================================
-# 3. 인사이트 코멘트 생성 함수들
-# =========================================
-
-# 3-1. 인원 변동 / 입·퇴사 인사이트
-def analyze_headcount(df_change):
-    text_blocks = []
-
-    df = df_change.copy()
-    df["월"] = to_month_period(df["월"])
-    df = df.sort_values("월")
-
-    if len(df) < 3:
-        return "📌 인원변동 데이터가 3개월 미만이라, 추세 분석은 어렵습니다. (모르겠습니다)"
+DATA_PATH = "company_hr_data.xlsx"
 
-    recent_df = df.tail(6).copy()
-    recent_df_reset = recent_df.reset_index(drop=True)
+# 잔존율 차트에 기본으로 표시할 최근 입사연도 수
+DEFAULT_COHORTS = 10
 
-    last3 = recent_df_reset.tail(3)
-    prev3 = recent_df_reset.head(len(recent_df_reset) - 3)
+@st.cache_resource
+def workbook_watcher():
+    # 서버 프로세스당 하나 — 백그라운드 스레드가 워크북을 읽고 기본 분석을 모두 미리 계산해 두며,
+    # 파일이 바뀌면 요청과 무관하게 새 스냅샷을 만든 뒤 통째로 교체
+    return hr_warmup.WorkbookWatcher(DATA_PATH).start()
 
-    if len(prev3) == 0:
-        prev3 = last3  # 비교 불가 시 동일 기간으로 처리 (추측입니다)
+def current_snapshot():
+    # 완성된 스냅샷만 반환 (서버 시작 직후 첫 스냅샷이 만들어지기 전에만 대기)
+    return workbook_watcher().wait()
 
-    hire_last3 = last3["입사자"].sum()
-    hire_prev3 = prev3["입사자"].sum()
-    sep_last3 = last3["퇴사자"].sum()
-    sep_prev3 = prev3["퇴사자"].sum()
+@st.cache_resource
+def upload_cache():
+    # 업로드 워크북 스냅샷과 위젯 결과 — 서버 전체에서 하나, 내용 해시가 키라 같은 파일은 사용자 간 공유되며
+    # 메모리 예산(HR_UPLOAD_CACHE_MB)을 넘으면 가장 오래 안 쓴 항목부터 제거
+    return hr_lru.LRUCache(hr_lru.budget_from_settings())
 
-    total_last = df["총원"].iloc[-1]
-    total_first = df["총원"].iloc[0]
-    total_change = total_last - total_first
+def uploaded_snapshot(uploaded):
+    data = uploaded.getvalue()
+    key = hashlib.sha256(data).hexdigest()
+    return upload_cache().get_or_build(key, lambda: hr_warmup.build_upload_snapshot(data, key))
 
-    def pct_change(new, old):
-        if old == 0:
-            return np.nan
-        return (new - old) / old * 100
+# =========================================
+# 2. 위젯 값에 따라 달라지는 결과 캐시 (데이터 버전별로 한 번만 계산)
+# =========================================
+# 기본 설정의 분석 결과는 스냅샷에 이미 들어 있고, 여기서는 슬라이더·필터 등
+# 위젯 값이 들어가는 결과만 (함수, 데이터 버전, 위젯 값) 기준으로 캐싱합니다.
+# 마지막 인자인 스냅샷은 키에서 빠지고, 버전이 키 역할을 합니다.
+# (각 함수 첫 줄의 mark_miss()는 캐시 miss로 본문이 실행될 때만 호출되어 계측 패널에 표시됩니다)
+# 결과는 업로드 스냅샷과 같은 LRU에 넣어 실제 크기를 HR_UPLOAD_CACHE_MB 예산에 포함시키므로,
+# 업로드 워크북이 늘어나도 파생 표·차트 데이터가 예산 밖에서 쌓이지 않습니다.
+def view_cache(func):
+    @functools.wraps(func)
+    def wrapper(version, *args):
+        *widget_values, _ = args
+        key = (func.__name__, version, *widget_values)
+        return upload_cache().get_or_build(key, lambda: func(version, *args))
+    return wrapper
+
+@view_cache
+def headcount_chart_data(version, max_points, _snapshot):
+    hr_profiling.mark_miss()
+    # 시리즈마다 max_points개까지만 남겨 브라우저로 보내는 데이터 크기를 제한 (피크·급락은 유지)
+    return hr_downsample.downsample_frame(_snapshot.results["headcount_line_data"], max_points)
+
+@view_cache
+def unit_chart_data(version, unit, max_points, _snapshot):
+    hr_profiling.mark_miss()
+    # 선택한 단위의 월별 입·퇴사 (다운샘플링) + 이상 구간
+    df_units = _snapshot.sheets[hr_units.UNIT_SHEET]
+    unit_col = _snapshot.results["unit_summary"].index.name
+    line_df = hr_analysis.make_headcount_line_data(df_units[df_units[unit_col] == unit])
+    anomalies = _snapshot.results["unit_anomalies"]
+    return (
+        hr_downsample.downsample_frame(line_df, max_points),
+        anomalies[anomalies[unit_col] == unit].drop(columns=unit_col),
+    )
 
-    hire_chg = pct_change(hire_last3, hire_prev3)
-    sep_chg = pct_change(sep_last3, sep_prev3)
+@view_cache
+def risk_table_view(version, grades, sort_by, ascending, _snapshot):
+    hr_profiling.mark_miss()
+    # 등급 필터·정렬·반올림까지 끝낸 표 (화면에는 현재 페이지만 넘김)
+    _, risk_df = _snapshot.results["department"]
+    view = hr_tables.filter_sort(risk_df, {"리스크등급": list(grades)}, sort_by, ascending)
+    return hr_tables.round_columns(view, hr_tables.risk_table_decimals(risk_df))
+
+@view_cache
+def retention_chart_data(version, cohorts, max_points, _snapshot):
+    hr_profiling.mark_miss()
+    # 선택한 입사연도만 골라 코호트별로 다운샘플링한 long 프레임 [경과개월, 입사연도, 잔존율]
+    line_df = _snapshot.results["retention_line_data"]
+    return hr_downsample.downsample_long(line_df[list(cohorts)], max_points, value_name="잔존율")
+
+@view_cache
+def retention_result(version, drop_threshold, _snapshot):
+    hr_profiling.mark_miss()
+    if drop_threshold == hr_retention.DROP_THRESHOLD:
+        return _snapshot.results["retention"]
+    return hr_analysis.analyze_retention(_snapshot.sheets["잔존율"], drop_threshold)
+
+@view_cache
+def retention_drops_view(version, drop_threshold, sort_by, ascending, _snapshot):
+    hr_profiling.mark_miss()
+    _, drops_df, _ = retention_result(version, drop_threshold, _snapshot)
+    return hr_tables.filter_sort(drops_df, None, sort_by, ascending)
+
+@view_cache
+def survival_result(version, group_by, _snapshot):
+    hr_profiling.mark_miss()
+    if group_by is None:
+        return _snapshot.results["survival"]
+    return hr_survival.survival_curves(_snapshot.results["tenure_records"], group_by)
+
+@view_cache
+def unit_summary_view(version, overall, sort_by, ascending, _snapshot):
+    hr_profiling.mark_miss()
+    # 조직 단위 요약 표 (종합 판정 필터·정렬) — 단위 이름을 컬럼으로 꺼내 페이지 표에 표시
+    summary = _snapshot.results["unit_summary"].reset_index()
+    view = hr_tables.filter_sort(summary, {"종합": list(overall)}, sort_by, ascending)
+    return hr_tables.round_columns(view, {"입사자_변화율": 1, "퇴사자_변화율": 1})
 
-    # 1) 입사자 추세 (표현 다양화)
-    hire_comment = f"최근 3개월 입사자는 총 **{hire_last3}명**이며, 직전 3개월 대비 "
-    if pd.isna(hire_chg):
-        hire_comment += "비교 가능한 과거 데이터가 부족합니다. (확실하지 않음)"
-    elif hire_chg > 40:
-        hire_comment += (
-            f"**{hire_chg:.1f}% 급증**했습니다. 공격적으로 인력을 확장하는 국면으로 볼 수 있습니다. (추측입니다)"
-        )
-    elif hire_chg > 20:
-        hire_comment += (
-            f"**{hire_chg:.1f}% 증가**했습니다. 채용 강도가 이전보다 확실히 높아진 상태입니다."
-        )
-    elif hire_chg > 5:
-        hire_comment += (
-            f"**{hire_chg:.1f}% 소폭 증가**했습니다. 완만하게 인력을 확충하는 흐름입니다."
-        )
-    elif hire_chg < -40:
-        hire_comment += (
-            f"**{abs(hire_chg):.1f}% 급감**했습니다. 채용 축소 또는 채용 전략 변화가 있었을 가능성이 큽니다. (추측입니다)"
-        )
-    elif hire_chg < -20:
-        hire_comment += (
-            f"**{abs(hire_chg):.1f}% 감소**했습니다. 신규 충원이 눈에 띄게 줄어든 상태입니다."
-        )
-    elif hire_chg < -5:
-        hire_comment += (
-            f"**{abs(hire_chg):.1f}% 소폭 감소**했습니다. 당장은 큰 리스크는 아니지만, "
-            "채용 파이프라인을 점검해 보는 것이 좋습니다. (추측입니다)"
-        )
-    else:
-        hire_comment += (
-            f"{hire_chg:.1f}% 변동으로, 큰 변화 없이 **안정적인 채용 수준**이 유지되고 있습니다."
-        )
-    text_blocks.append("🔹 **입사자 추세 인사이트**\n" + hire_comment)
-
-    # 2) 퇴사자 추세 (표현 다양화)
-    sep_comment = f"최근 3개월 퇴사자는 총 **{sep_last3}명**이며, 직전 3개월 대비 "
-    if pd.isna(sep_chg):
-        sep_comment += "비교 가능한 과거 데이터가 부족합니다. (확실하지 않음)"
-    elif sep_chg > 40:
-        sep_comment += (
-            f"**{sep_chg:.1f}% 급증**했습니다. 단기간에 이탈이 몰리면서, "
-            "조직 안정성 측면에서 강한 경고 신호로 해석될 수 있습니다. (추측입니다)"
-        )
-    elif sep_chg > 20:
-        sep_comment += (
-            f"**{sep_chg:.1f}% 증가**했습니다. 이탈이 눈에 띄게 많아진 구간으로, "
-            "원인 분석과 조기 대응이 필요한 상태입니다. (추측입니다)"
-        )
-    elif sep_chg > 5:
-        sep_comment += (
-            f"**{sep_chg:.1f}% 소폭 증가**했습니다. 당장 심각한 수준은 아니지만, "
-            "특정 부서·직무에 편중되어 있는지 확인하는 것이 좋습니다. (추측입니다)"
-        )
-    elif sep_chg < -20:
-        sep_comment += (
-            f"**{abs(sep_chg):.1f}% 감소**했습니다. 이탈이 뚜렷하게 줄어든 안정 구간입니다."
-        )
-    elif sep_chg < -5:
-        sep_comment += (
-            f"**{abs(sep_chg):.1f}% 소폭 감소**했습니다. 이탈 관리가 비교적 잘 이뤄지고 있는 흐름입니다. (추측입니다)"
-        )
-    else:
-        sep_comment += (
-            f"{sep_chg:.1f}% 변동으로, 이탈 수준은 **크게 흔들림 없이 유지**되고 있습니다."
+# =========================================
+# 3. 화면 렌더링 함수
+# =========================================
+def render_profile(profiler, page):
+    if not profiler.enabled:
+        return
+    st.sidebar.markdown("---")
+    st.sidebar.markdown(f"**⏱️ 단계별 소요 시간** (총 {profiler.total_seconds() * 1000:.0f}ms)")
+    st.sidebar.dataframe(profiler.table(), use_container_width=True, hide_index=True)
+    if profiler.build is not None:
+        # 파싱·정규화·분석은 스냅샷을 만들 때 요청 밖에서 실행됨 — 이번 화면에 쓰인 스냅샷의 빌드 시간
+        build = profiler.build
+        st.sidebar.markdown(
+            f"**🏗️ 스냅샷 빌드** (총 {build['build_seconds'] * 1000:.0f}ms, {build['built_at']})"
         )
-    text_blocks.append("🔹 **퇴사자 추세 인사이트**\n" + sep_comment)
+        st.sidebar.dataframe(profiler.build_table(), use_container_width=True, hide_index=True)
+    profiler.write_log(page=page)
+
+def render_survival_chart(curves):
+    # 계단형 생존 곡선 + 95% 신뢰구간 음영
+    base = alt.Chart(curves).encode(
+        x=alt.X("근속개월:Q", title="근속개월"),
+        color=alt.Color("그룹:N", title=None),
+    )
+    band = base.mark_area(opacity=0.15, interpolate="step-after").encode(
+        y=alt.Y("하한:Q", title="생존율"), y2="상한:Q"
+    )
+    line = base.mark_line(interpolate="step-after").encode(
+        y=alt.Y("생존율:Q", scale=alt.Scale(domain=[0, 1])),
+        tooltip=["그룹:N", "근속개월:Q", "위험인원:Q", "퇴사인원:Q",
+                 alt.Tooltip("생존율:Q", format=".1%")],
+    )
+    st.altair_chart(band + line, use_container_width=True)
 
-    # 3) 총원 추세 (장기)
-    if total_change > 0:
-        total_comment = (
-            f"분석 기간 전체로 보면 총원은 **+{total_change}명** 증가했습니다. "
-            "장기적으로 조직을 키워가는 성장 전략이 유지되고 있는 모습입니다."
-        )
-    elif total_change < 0:
-        total_comment = (
-            f"분석 기간 전체로 보면 총원은 **{total_change}명** 감소했습니다. "
-            "채용 축소, 자연 이탈, 선택적 구조조정 등이 함께 영향을 준 결과일 수 있습니다. (추측입니다)"
-        )
-    else:
-        total_comment = (
-            "분석 기간 동안 총원은 거의 변동이 없었습니다. "
-            "채용과 퇴사가 거의 균형을 이루는, 안정적인 인력 유지 구간으로 볼 수 있습니다."
+def render_headcount_chart(chart_df, anomalies=None):
+    # 월별 입·퇴사 라인 + 3개월 vs 직전 3개월 ±20% 이상 구간 마커 (▲ 증가·급증, ▼ 감소·급감)
+    lines = chart_df[list(hr_anomaly.SERIES)].reset_index().melt(
+        "월", var_name="지표", value_name="인원"
+    )
+    color = alt.Color("지표:N", title=None, sort=list(hr_anomaly.SERIES))
+    chart = alt.Chart(lines).mark_line().encode(
+        x=alt.X("월:T", title=None), y=alt.Y("인원:Q", title=None), color=color
+    )
+    if anomalies is not None and len(anomalies):
+        marks = anomalies.assign(
+            월=anomalies["월"].astype(str),
+            방향=anomalies["변화율"].gt(0).map({True: "증가", False: "감소"}),
+            급변=anomalies["구간"].isin(["급증", "급감"]),
         )
-    text_blocks.append("🔹 **총원 장기 추세 인사이트**\n" + total_comment)
-
-    # 4) 종합 평가
-    net_last3 = hire_last3 - sep_last3
-    if net_last3 > 0 and (not pd.isna(sep_chg) and sep_chg < 20):
-        overall = (
-            "최근 3개월은 **순증가(입사 > 퇴사)** 구간으로, "
-            "단기 리스크는 낮고 성장을 지향하는 국면으로 해석할 수 있습니다. (추측입니다)"
+        points = alt.Chart(marks).mark_point(filled=True).encode(
+            x="월:T",
+            y="인원:Q",
+            color=color,
+            shape=alt.Shape(
+                "방향:N", scale=alt.Scale(domain=["증가", "감소"], range=["triangle-up", "triangle-down"]),
+                title="3개월 변화",
+            ),
+            size=alt.Size("급변:N", scale=alt.Scale(domain=[False, True], range=[50, 140]), legend=None),
+            tooltip=["월:N", "지표:N", "인원:Q", "최근3개월:Q", "직전3개월:Q",
+                     alt.Tooltip("변화율:Q", format=".1f"), "구간:N"],
         )
-    elif net_last3 < 0 and (not pd.isna(sep_chg) and sep_chg > 20):
-        overall = (
-            "최근 3개월은 **순감소(퇴사 > 입사)** 구간이며, "
-            "퇴사 증가까지 겹쳐 **조직 안정성 측면에서 주의 깊은 모니터링이 필요한 시기**입니다. (추측입니다)"
+        chart = chart + points
+    st.altair_chart(chart, use_container_width=True)
+
+def sort_controls(columns, key, default_sort, default_ascending=True):
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        sort_by = st.selectbox(
+            "정렬 기준", columns, index=columns.index(default_sort), key=f"{key}_sort"
         )
-    else:
-        overall = (
-            "입·퇴사와 총원 모두 큰 폭의 변화는 아니지만, "
-            "세부 부서·직무 단위에서의 변동 패턴을 함께 살펴보는 것이 좋습니다. (추측입니다)"
+    with col2:
+        ascending = st.toggle("오름차순", value=default_ascending, key=f"{key}_asc")
+    return sort_by, ascending
+
+def render_paged_table(view, key, decimals=None):
+    # 정렬·필터가 끝난 표에서 현재 페이지 행만 렌더링하고, 렌더링한 행 수를 반환
+    n_pages = hr_tables.page_count(len(view))
+    page = 1
+    if n_pages > 1:
+        page = st.number_input(
+            f"페이지 (총 {n_pages}쪽)", min_value=1, max_value=n_pages, value=1, step=1,
+            key=f"{key}_page"
         )
-    text_blocks.append("🔹 **종합 인사이트**\n" + overall)
-
-    return "\n\n".join(text_blocks)
-
-# 3-2. 부서별 퇴사 리스크 분석 (옵션 A: 전년 대비 + 절대 규모 혼합 스코어)
-def analyze_department_turnover(df_turnover, show_table=True):
-    text_blocks = []
-
-    df = df_turnover.copy()
-    df = df.sort_values("연도")
-
-    years = sorted(df["연도"].unique())
-    if len(years) < 2:
-        return "📌 전년 대비 분석을 할 수 있을 만큼 연도 데이터가 충분하지 않습니다. (모르겠습니다)", None
+    page_df = hr_tables.page_slice(view, page)
+    column_config = {
+        col: st.column_config.NumberColumn(format=f"%.{n}f") for col, n in (decimals or {}).items()
+    }
+    st.dataframe(page_df, use_container_width=True, hide_index=True, column_config=column_config)
+    if n_pages > 1:
+        first = (min(page, n_pages) - 1) * hr_tables.PAGE_SIZE + 1
+        st.caption(f"총 {len(view):,}행 중 {first:,}–{first + len(page_df) - 1:,}행")
+    return len(page_df)
 
-    last_year = years[-1]   # 최신 연도
-    prev_year = years[-2]   # 직전 연도
-
-    recent_df = df[df["연도"] == last_year]
-    prev_df = df[df["연도"] == prev_year]
-
-    dept_cols = [c for c in df.columns if c != "연도"]
-
-    # 올해 전체 부서 퇴사자수 평균 (절대 규모 기준)
-    total_this_year = []
-    for col in dept_cols:
-        total_this_year.append(recent_df[col].sum())
-    overall_avg_this_year = np.mean(total_this_year) if len(total_this_year) > 0 else np.nan
-
-    risk_rows = []
-    for col in dept_cols:
-        this_year_val = recent_df[col].sum()
-        prev_year_val = prev_df[col].sum()
-
-        # 1) 전년 대비 스코어
-        if prev_year_val == 0:
-            yoy_score = np.nan
-        else:
-            yoy_score = this_year_val / prev_year_val
+# =========================================
+# 4. 메인 화면 구성
+# =========================================
+# 모듈을 import할 때는 화면을 그리지 않고, streamlit run으로 실행될 때만 main()이 호출됨
+# (분석 함수만 필요하면 Streamlit 없이 hr_core 패키지를 바로 사용)
+def main():
+    st.set_page_config(
+        page_title="HR 인사이트 대시보드",
+        layout="wide"
+    )
 
-        # 2) 절대 규모 스코어 (올해 전체 평균 대비)
-        if overall_avg_this_year == 0 or np.isnan(overall_avg_this_year):
-            abs_score = np.nan
-        else:
-            abs_score = this_year_val / overall_avg_this_year
-
-        # 3) 최종 리스크 스코어 (혼합)
-        if np.isnan(yoy_score) and not np.isnan(abs_score):
-            final_score = abs_score
-        elif np.isnan(abs_score) and not np.isnan(yoy_score):
-            final_score = yoy_score
-        elif np.isnan(yoy_score) and np.isnan(abs_score):
-            final_score = np.nan
-        else:
-            final_score = 0.5 * yoy_score + 0.5 * abs_score
-
-        risk_rows.append((col, this_year_val, prev_year_val, yoy_score, abs_score, final_score))
-
-    risk_df = pd.DataFrame(
-        risk_rows,
-        columns=[
-            "부서",
-            f"{last_year}년_퇴사자수",
-            f"{prev_year}년_퇴사자수",
-            "전년대비스코어",
-            "절대규모스코어",
-            "최종리스크스코어"
-        ]
-    ).sort_values("최종리스크스코어", ascending=False)
-
-    # 기본 등급은 Low
-    risk_df["리스크등급"] = "Low"
-
-    # 최종 리스크 스코어가 1.2 이상인 부서들 중 상위 2개를 High로 설정
-    candidates = risk_df[risk_df["최종리스크스코어"] >= 1.2].copy()
-    top_high = candidates.head(2).index
-    risk_df.loc[top_high, "리스크등급"] = "High"
-
-    # 나머지 중에서 1.0 이상 1.2 미만은 Medium
-    medium_mask = (risk_df["리스크등급"] == "Low") & (risk_df["최종리스크스코어"] >= 1.0)
-    risk_df.loc[medium_mask, "리스크등급"] = "Medium"
-
-    # 표 표시 여부
-    if show_table:
-        st.dataframe(
-            risk_df.style.format(
-                {
-                    f"{last_year}년_퇴사자수": "{:.0f}",
-                    f"{prev_year}년_퇴사자수": "{:.0f}",
-                    "전년대비스코어": "{:.2f}",
-                    "절대규모스코어": "{:.2f}",
-                    "최종리스크스코어": "{:.2f}",
-                }
-            ),
-            use_container_width=True
-        )
+    st.title("👥 HR 인사이트 대시보드")
 
-    # 인사이트 코멘트
-    high_risk = risk_df[risk_df["리스크등급"] == "High"]
-    medium_risk = risk_df[risk_df["리스크등급"] == "Medium"]
-
-    if not high_risk.empty:
-        dept_list = ", ".join(
-            f"{row.부서}팀("
-            f"{last_year}년 {row[f'{last_year}년_퇴사자수']:.0f}명, "
-            f"{prev_year}년 대비 {row['전년대비스코어']:.2f}배, "
-            f"절대규모스코어 {row['절대규모스코어']:.2f}, "
-            f"최종 {row['최종리스크스코어']:.2f})"
-            for _, row in high_risk.iterrows()
-        )
-        text_blocks.append(
-            f"🔴 **High Risk 부서 인사이트 (전년 대비 + 절대 규모)**\n"
-            f"{dept_list} 에서 전년 대비 증가 폭과 절대 퇴사 규모가 모두 높은 편입니다. "
-            f"조직문화, 리더십, 역할적합성, 보상 등 원인 진단이 필요합니다. (추측입니다)"
-        )
-    else:
-        text_blocks.append(
-            "🔴 **High Risk 부서 인사이트 (전년 대비 + 절대 규모)**\n"
-            "현재 기준으로 전년 대비 증가 폭과 절대 규모를 함께 보았을 때, "
-            "강하게 경고가 필요한 부서는 없습니다."
-        )
+    # 👉 사이드바는 페이지 선택만 간결하게
+    menu = st.sidebar.radio(
+        "페이지 선택",
+        ["1. 조직 현황 스냅샷", "2. 리텐션 분석", "3. 액션 포인트"]
+    )
 
-    if not medium_risk.empty:
-        dept_list = ", ".join(
-            f"{row.부서}팀("
-            f"{last_year}년 {row[f'{last_year}년_퇴사자수']:.0f}명, "
-            f"{prev_year}년 대비 {row['전년대비스코어']:.2f}배, "
-            f"절대규모스코어 {row['절대규모스코어']:.2f}, "
-            f"최종 {row['최종리스크스코어']:.2f})"
-            for _, row in medium_risk.iterrows()
-        )
-        text_blocks.append(
-            f"🟠 **Medium Risk 부서 인사이트 (전년 대비 + 절대 규모)**\n"
-            f"{dept_list} 수준으로, 앞으로의 추이를 모니터링하면서 "
-            f"퇴사 사유와 패턴을 주기적으로 확인하는 것이 좋습니다. (추측입니다)"
-        )
-    else:
-        text_blocks.append(
-            "🟠 **Medium Risk 부서 인사이트 (전년 대비 + 절대 규모)**\n"
-            "전년 대비 증가 폭과 절대 규모를 함께 보았을 때, "
-            "중간 수준의 주의가 필요한 부서는 아직 뚜렷하지 않습니다."
-        )
+    # 기본 워크북(서버의 company_hr_data.xlsx) 또는 직접 올린 워크북
+    source = st.sidebar.radio("데이터 원본", ["기본 워크북", "워크북 업로드"])
+    uploaded = None
+    if source == "워크북 업로드":
+        uploaded = st.sidebar.file_uploader("HR 워크북 (.xlsx)", type=["xlsx"])
 
-    low_count = (risk_df["리스크등급"] == "Low").sum()
-    text_blocks.append(
-        f"🟢 **Low Risk 부서 인사이트**\n"
-        f"전년과 유사하거나 더 낮은 수준(또는 규모가 상대적으로 작은 수준)의 부서는 총 **{low_count}개**입니다."
+    # 차트 한 시리즈당 최대 점 수 (데이터가 이보다 짧으면 그대로 표시)
+    max_points = st.sidebar.slider(
+        "차트 해상도 (시리즈당 최대 점 수)", min_value=50, max_value=2000,
+        value=hr_downsample.DEFAULT_MAX_POINTS, step=50
     )
 
-    return "\n\n".join(text_blocks), risk_df
-
-# 3-3. 잔존율 분석 (입사연도별 그룹 관점, 표 표시 옵션)
-def analyze_retention(df_retention, show_table=True):
-    text_blocks = []
-
-    df = df_retention.copy()
-
-    pivot_12 = df[df["경과개월"] == 12].copy()
-    if pivot_12.empty:
-        text_blocks.append("📌 12개월 잔존율 데이터가 없어 입사연도별 그룹 비교는 어렵습니다. (모르겠습니다)")
-    else:
-        worst = pivot_12.sort_values("잔존율").iloc[0]
-        best = pivot_12.sort_values("잔존율", ascending=False).iloc[0]
-        text_blocks.append(
-            "🔹 **12개월 잔존율 기준 입사연도별 그룹 비교 인사이트**\n"
-            f"- 최저 잔존율: **{int(worst['입사연도'])}년 입사 그룹** ({worst['잔존율']:.1f}%)\n"
-            f"- 최고 잔존율: **{int(best['입사연도'])}년 입사 그룹** ({best['잔존율']:.1f}%)\n"
-            "→ 특정 입사연도 그룹에서 온보딩, 배치, 조직적합성 등 경험의 질이 달랐을 가능성이 있습니다. (추측입니다)"
+    # 단계별 계측 (?profile=1 또는 HR_PROFILE=1일 때만 켜짐)
+    profiler = hr_profiling.StageProfiler.from_settings(st.query_params.get("profile"))
+    stage = profiler.stage
+
+    if source == "워크북 업로드" and uploaded is None:
+        st.info("사이드바에서 분석할 워크북(.xlsx)을 업로드해주세요. 기본 워크북과 같은 시트 구성이어야 합니다.")
+        render_profile(profiler, menu)
+        st.stop()
+
+    # 기본 워크북은 백그라운드에서 미리 만들어 둔 스냅샷 사용 (요청 경로에서는 워크북을 파싱하지 않음)
+    # 업로드 워크북은 내용 해시별 LRU 캐시에서 찾고, 없을 때만 파싱·분석
+    try:
+        with stage("스냅샷 조회") as rec:
+            snapshot = current_snapshot() if uploaded is None else uploaded_snapshot(uploaded)
+            version = snapshot.version
+            rec["rows"] = sum(len(df) for df in snapshot.sheets.values() if df is not None)
+        profiler.record_build(version, snapshot.stages, snapshot.build_seconds, snapshot.built_at)
+        results = snapshot.results
+        data_loaded = True
+    except FileNotFoundError:
+        st.error("`company_hr_data.xlsx` 파일을 찾을 수 없습니다. app.py와 같은 폴더에 있는지 확인해주세요.")
+        data_loaded = False
+    except hr_schema.SchemaError as e:
+        st.error(f"워크북 형식이 올바르지 않습니다. {e}")
+        data_loaded = False
+    except Exception as e:
+        st.error(f"데이터를 불러오는 중 오류가 발생했습니다: {e}")
+        data_loaded = False
+
+    if not data_loaded:
+        render_profile(profiler, menu)
+        st.stop()
+
+    if uploaded is not None:
+        stats = upload_cache().stats()
+        st.sidebar.caption(
+            f"업로드 캐시: 워크북 {stats['항목 수']}개, {stats['사용량(MB)']}/{stats['예산(MB)']}MB"
         )
-
-    drops = []
-    for year, g in df.groupby("입사연도"):
-        g = g.sort_values("경과개월")
-        g["change"] = g["잔존율"].diff()
-        big_drop = g[g["change"] <= -10]
-        for _, row in big_drop.iterrows():
-            drops.append(
-                (
-                    year,
-                    int(row["경과개월"]),
-                    row["change"]
+    elif workbook_watcher().error is not None:
+        # 바뀐 워크북을 읽지 못한 경우 — 마지막으로 정상 로딩된 데이터를 계속 보여줌
+        st.warning(f"변경된 워크북을 불러오지 못해 이전 데이터를 표시합니다: {workbook_watcher().error}")
+
+    # -------------------------------------
+    # 페이지 1: 조직 현황 스냅샷
+    # -------------------------------------
+    if menu.startswith("1"):
+        st.subheader("📍 페이지 1 — 조직 현황 스냅샷")
+
+        # 전체 이력에서 3개월 합계가 직전 3개월 대비 ±20%를 넘은 달 (스냅샷에 미리 계산됨)
+        show_anomalies = st.toggle("이상 구간 표시 (3개월 vs 직전 3개월 ±20% 이상)", value=True)
+
+        with stage("다운샘플링 · 입·퇴사/총원", cached=True) as rec:
+            df_change_chart = headcount_chart_data(version, max_points, snapshot)
+            rec["rows"] = len(df_change_chart)
+
+        with stage("차트 렌더링 · 입·퇴사/총원") as rec:
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown("**월별 입·퇴사 추이**")
+                render_headcount_chart(
+                    df_change_chart, results["headcount_anomalies"] if show_anomalies else None
                 )
-            )
 
-    if drops:
-        drops_df = pd.DataFrame(drops, columns=["입사연도", "경과개월", "변화량"])
-        drops_df = drops_df.sort_values("변화량")
+            with col2:
+                st.markdown("**월별 총원 추세**")
+                st.line_chart(df_change_chart[["총원"]])
+            rec["rows"] = len(df_change_chart)
 
-        if show_table:
+        with st.expander(f"이상 구간 목록 (전체 이력, {len(results['headcount_anomalies'])}건)"):
             st.dataframe(
-    drops_df.reset_index(drop=True),
-    use_container_width=True
-)
+                results["headcount_anomalies"], use_container_width=True, hide_index=True,
+                column_config={"변화율": st.column_config.NumberColumn(format="%.1f")},
+            )
 
+        st.markdown("---")
+        st.markdown("### 🧠 인사이트 코멘트")
 
-        example = drops_df.iloc[0]
-        text_blocks.append(
-            "🔹 **입사연도별 그룹의 잔존율 급락 구간 인사이트**\n"
-            f"- 예: {int(example['입사연도'])}년 입사 그룹의 "
-            f"{int(example['경과개월'])}개월 시점에서 잔존율이 **{example['변화량']:.1f}p** 급락했습니다.\n"
-            "→ 해당 시점 전후의 평가, 조직개편, 리더 변경, 보상 이벤트 등을 함께 검토하는 것이 좋습니다. (추측입니다)"
-        )
-    else:
-        text_blocks.append(
-            "🔹 **입사연도별 그룹의 잔존율 급락 구간 인사이트**\n"
-            "연속 구간에서 -10%p 이상 급락한 패턴은 뚜렷하게 나타나지 않습니다."
-        )
+        with stage("분석 · 인원변동", built="headcount"):
+            headcount_comment = results["headcount_comment"]
+        st.markdown(headcount_comment)
 
-    return "\n\n".join(text_blocks)
-
-# 3-4. 입사연도별 잔존율 라인 그래프용 데이터
-def make_retention_line_data(df_retention):
-    df = df_retention.copy()
-    line_df = df.pivot_table(
-        index="경과개월",
-        columns="입사연도",
-        values="잔존율",
-        aggfunc="mean"
-    ).sort_index()
-    return line_df
-
-# 3-5. 액션 포인트 생성
-def generate_action_points(headcount_comment, risk_df, retention_comment):
-    points = []
-
-    if risk_df is not None:
-        high_risk = risk_df[risk_df["리스크등급"] == "High"]
-        if not high_risk.empty:
-            dept_names = ", ".join(high_risk["부서"].tolist())
-            points.append(
-                f"1) **High Risk 부서 집중 진단 제안 (전년 대비 + 절대 규모)**\n"
-                f"- 대상: {dept_names}\n"
-                f"- 액션: 퇴사자 인터뷰, 조직문화/리더십 진단, 역할·성과 기대치 명확화 워크숍 등을 우선 검토합니다. (추측입니다)"
+        # 조직별인원변동 시트가 있는 워크북에서만 표시
+        unit_summary = results["unit_summary"]
+        if unit_summary is not None:
+            st.markdown("---")
+            st.markdown(f"### 🏢 {unit_summary.index.name}별 인원변동 (최근 3개월 vs 직전 3개월)")
+            overall = st.multiselect(
+                "종합 판정 필터", hr_units.OVERALL_LABELS, default=hr_units.OVERALL_LABELS
             )
-        else:
-            points.append(
-                "1) **High Risk 부서 집중 진단 제안 (전년 대비 + 절대 규모)**\n"
-                "- 현재 기준으로 High Risk에 해당하는 부서는 없지만, "
-                "퇴사 증가 신호가 나타날 경우 신속히 집중 진단을 진행할 수 있도록 준비하는 것이 좋습니다. (추측입니다)"
+            sort_by, ascending = sort_controls(
+                [unit_summary.index.name, *hr_units.SUMMARY_COLUMNS], "unit", "퇴사자_변화율",
+                default_ascending=False,
             )
+            with stage("정렬·필터 · 조직 단위 표", cached=True) as rec:
+                unit_view = unit_summary_view(version, tuple(overall), sort_by, ascending, snapshot)
+                rec["rows"] = len(unit_view)
+            with stage("표 렌더링 · 조직 단위 표") as rec:
+                rec["rows"] = render_paged_table(
+                    unit_view, "unit", {"입사자_변화율": 1, "퇴사자_변화율": 1}
+                )
 
-    points.append(
-        "2) **입사연도별 그룹 잔존율 격차 관리 제안**\n"
-        "- 잔존율이 낮은 입사연도 그룹을 중심으로, 초기 온보딩/배치/피드백 구조를 점검하고 "
-        "동일 시기에 입사한 구성원들의 공통 경험을 인터뷰로 수집하는 것을 권장합니다. (추측입니다)"
-    )
-
-    points.append(
-        "3) **잔존율 급락 시점 재점검 제안**\n"
-        "- 잔존율이 특정 시점 이후 크게 떨어지는 경우, 그 전후로 있었던 평가, 조직개편, 리더 변경, "
-        "보상/성과 제도 변경 등 조직 이벤트를 함께 확인하고, 커뮤니케이션 및 제도 보완 방안을 마련하는 것이 좋습니다. (추측입니다)"
-    )
-
-    points.append(
-        "4) **입·퇴사 및 총원 추세 기반 채용/운영 전략 조정 제안**\n"
-        "- 퇴사 증가가 감지되는 시점에는 단기적인 충원 계획뿐 아니라, "
-        "이탈 사유를 체계적으로 수집·분석하여 중장기적인 구조 개선 방향까지 함께 검토하는 것이 중요합니다. (추측입니다)"
-    )
-
-    return "\n\n".join(points)
-
-# =========================================
-# 4. 메인 화면 구성
-# =========================================
-try:
-    df_change, df_turnover, df_retention, df_tenure = load_data()
-    data_loaded = True
-except FileNotFoundError:
-    st.error("`company_hr_data.xlsx` 파일을 찾을 수 없습니다. app.py와 같은 폴더에 있는지 확인해주세요.")
-    data_loaded = False
-except Exception as e:
-    st.error(f"데이터를 불러오는 중 오류가 발생했습니다: {e}")
-    data_loaded = False
-
-if not data_loaded:
-    st.stop()
-
-# 👉 사이드바는 페이지 선택만 간결하게
-menu = st.sidebar.radio(
-    "페이지 선택",
-    ["1. 조직 현황 스냅샷", "2. 리텐션 분석", "3. 액션 포인트"]
-)
-
-# -------------------------------------
-# 페이지 1: 조직 현황 스냅샷
-# -------------------------------------
-if menu.startswith("1"):
-    st.subheader("📍 페이지 1 — 조직 현황 스냅샷")
-
-    df_change_view = df_change.copy()
-    df_change_view["월"] = to_month_period(df_change_view["월"])
-    df_change_view = df_change_view.sort_values("월")
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.markdown("**월별 입·퇴사 추이**")
-        st.line_chart(
-            df_change_view.set_index("월")[["입사자", "퇴사자"]]
+            # 코멘트 문장은 선택한 단위 하나만 생성 (기본값은 현재 정렬의 첫 행)
+            unit_options = list(unit_view.iloc[:, 0]) or list(unit_summary.index)
+            unit = st.selectbox(f"인사이트 코멘트를 볼 {unit_summary.index.name}", unit_options)
+            if unit is not None:
+                with stage("차트 렌더링 · 조직 단위", cached=True) as rec:
+                    unit_chart_df, unit_anomalies = unit_chart_data(version, unit, max_points, snapshot)
+                    render_headcount_chart(unit_chart_df, unit_anomalies if show_anomalies else None)
+                    rec["rows"] = len(unit_chart_df)
+                st.markdown(hr_units.unit_comment(unit_summary, unit))
+
+    # -------------------------------------
+    # 페이지 2: 리텐션 분석
+    # -------------------------------------
+    elif menu.startswith("2"):
+        st.subheader("📍 페이지 2 — 리텐션 분석")
+
+        st.markdown("#### 🔥 부서별 퇴사자 수 (연도×부서)")
+        with stage("표 렌더링 · 연도×부서", built="turnover_table") as rec:
+            turnover_view = results["turnover_table"]
+            st.dataframe(turnover_view, use_container_width=True)
+            rec["rows"] = turnover_view.size
+
+        st.markdown("---")
+        st.markdown("### 🧠 부서별 인사이트 코멘트 (전년 대비 + 절대 규모)")
+        with stage("분석 · 부서 리스크", built="department"):
+            dept_comment, risk_df = results["department"]
+        if risk_df is not None:
+            grades = st.multiselect("리스크등급 필터", hr_risk.GRADES, default=hr_risk.GRADES)
+            sort_by, ascending = sort_controls(
+                list(risk_df.columns), "risk", "최종리스크스코어", default_ascending=False
+            )
+            with stage("정렬·필터 · 리스크 표", cached=True) as rec:
+                risk_view = risk_table_view(version, tuple(grades), sort_by, ascending, snapshot)
+                rec["rows"] = len(risk_view)
+            with stage("표 렌더링 · 리스크 표") as rec:
+                rec["rows"] = render_paged_table(
+                    risk_view, "risk", hr_tables.risk_table_decimals(risk_df)
+                )
+        st.markdown(dept_comment)
+
+        with st.expander("연도별 리스크 등급 추이 (연속된 모든 연도 쌍 기준)"):
+            with stage("분석 · 연도별 리스크 등급", built="risk_history") as rec:
+                risk_history = results["risk_history"]
+                st.dataframe(risk_history, use_container_width=True)
+                rec["rows"] = risk_history.size
+
+        st.markdown("---")
+        st.markdown("### 📈 입사연도별 잔존율 추이 (그룹별 라인 그래프)")
+        with stage("스냅샷 · 잔존율 피벗", built="retention_line_data") as rec:
+            retention_line_df = results["retention_line_data"]
+            rec["rows"] = retention_line_df.size
+        cohort_options = list(retention_line_df.columns)
+        selected_cohorts = st.multiselect(
+            "표시할 입사연도", cohort_options,
+            default=cohort_options[-DEFAULT_COHORTS:],
+            help=f"기본으로 최근 {DEFAULT_COHORTS}개 입사연도만 표시합니다.",
         )
-
-    with col2:
-        st.markdown("**월별 총원 추세**")
-        st.line_chart(
-            df_change_view.set_index("월")[["총원"]]
+        with stage("차트 렌더링 · 잔존율", cached=True) as rec:
+            if selected_cohorts:
+                retention_chart_df = retention_chart_data(
+                    version, tuple(selected_cohorts), max_points, snapshot
+                )
+                st.line_chart(retention_chart_df, x="경과개월", y="잔존율", color="입사연도")
+                rec["rows"] = len(retention_chart_df)
+            else:
+                st.info("표시할 입사연도를 하나 이상 선택해주세요.")
+
+        st.markdown("---")
+        st.markdown("### ⏳ 근속 기간 생존 곡선 (Kaplan–Meier)")
+        tenure_records = results["tenure_records"]
+        if tenure_records is None:
+            st.info(
+                "근속 시트가 요약 형태(구분, 근속년수)라 생존 곡선을 그릴 수 없습니다. "
+                "직원 단위 데이터(입사일·퇴사일 또는 근속개월·퇴사여부)가 있으면 표시됩니다."
+            )
+        else:
+            group_options = ["전체"] + [c for c in hr_survival.GROUP_COLUMNS if c in tenure_records]
+            group_choice = st.radio("그룹 기준", group_options, horizontal=True)
+            group_by = None if group_choice == "전체" else group_choice
+            with stage("분석 · 생존 곡선", cached=True) as rec:
+                curves = survival_result(version, group_by, snapshot)
+                rec["rows"] = len(tenure_records)
+            if group_by is not None:
+                # 그룹이 많으면 인원이 많은 순으로 기본 선택
+                sizes = curves.groupby("그룹", sort=False)["위험인원"].first().sort_values(ascending=False)
+                selected_groups = st.multiselect(
+                    f"표시할 {group_by}", list(sizes.index), default=list(sizes.index[:DEFAULT_COHORTS])
+                )
+                curves = curves[curves["그룹"].isin(selected_groups)]
+            with stage("차트 렌더링 · 생존 곡선") as rec:
+                render_survival_chart(curves)
+                rec["rows"] = len(curves)
+            st.caption(f"직원 {len(tenure_records):,}명 기준, 재직자는 중도절단으로 처리 · 음영은 95% 신뢰구간")
+
+        st.markdown("---")
+        st.markdown("### 🧠 잔존율 인사이트 코멘트 (입사연도별 그룹 관점)")
+        drop_threshold = st.slider(
+            "잔존율 급락 기준 (직전 시점 대비 %p)", min_value=-30, max_value=-1,
+            value=int(hr_retention.DROP_THRESHOLD), step=1
         )
+        with stage("분석 · 잔존율", cached=True):
+            retention_comment, drops_df, worst_df = retention_result(
+                version, float(drop_threshold), snapshot
+            )
+        if not drops_df.empty:
+            sort_by, ascending = sort_controls(list(drops_df.columns), "drops", "변화량")
+            with stage("정렬 · 급락 구간", cached=True) as rec:
+                drops_view = retention_drops_view(
+                    version, float(drop_threshold), sort_by, ascending, snapshot
+                )
+                rec["rows"] = len(drops_view)
+            with stage("표 렌더링 · 급락 구간") as rec:
+                rec["rows"] = render_paged_table(drops_view, "drops")
+        with stage("표 렌더링 · 최대 낙폭 구간") as rec:
+            with st.expander("입사연도별 최대 낙폭 구간"):
+                st.dataframe(worst_df, use_container_width=True)
+            rec["rows"] = len(worst_df)
+        st.markdown(retention_comment)
+
+    # -------------------------------------
+    # 페이지 3: 액션 포인트
+    # -------------------------------------
+    elif menu.startswith("3"):
+        st.subheader("📍 페이지 3 — 액션 포인트")
+
+        # 스냅샷에 미리 계산된 기본 설정 결과를 그대로 사용
+        with stage("분석 · 인원변동", built="headcount"):
+            headcount_comment = results["headcount_comment"]
+        with stage("분석 · 부서 리스크", built="department"):
+            dept_comment, risk_df = results["department"]
+        with stage("분석 · 잔존율", built="retention"):
+            retention_comment, _, _ = results["retention"]
+
+        st.markdown("### 🧠 요약 인사이트")
+        st.markdown(hr_analysis.summary_insight(headcount_comment))
+
+        st.markdown("---")
+        st.markdown("### ✅ HR 액션 포인트 제안")
+
+        with stage("분석 · 액션 포인트"):
+            action_points = hr_analysis.generate_action_points(
+                headcount_comment, risk_df, retention_comment
+            )
+        st.markdown(action_points)
 
-    st.markdown("---")
-    st.markdown("### 🧠 인사이트 코멘트")
-
-    headcount_comment = analyze_headcount(df_change)
-    st.markdown(headcount_comment)
-
-# -------------------------------------
-# 페이지 2: 리텐션 분석
-# -------------------------------------
-elif menu.startswith("2"):
-    st.subheader("📍 페이지 2 — 리텐션 분석")
-
-    st.markdown("#### 🔥 부서별 퇴사자 수 (연도×부서)")
-    turnover_melt = df_turnover.melt(id_vars=["연도"], var_name="부서", value_name="퇴사자수")
-    turnover_pivot = turnover_melt.pivot(index="연도", columns="부서", values="퇴사자수")
-    st.dataframe(turnover_pivot, use_container_width=True)
-
-    st.markdown("---")
-    st.markdown("### 🧠 부서별 인사이트 코멘트 (전년 대비 + 절대 규모)")
-    dept_comment, risk_df = analyze_department_turnover(df_turnover, show_table=True)
-    st.markdown(dept_comment)
-
-    st.markdown("---")
-    st.markdown("### 📈 입사연도별 잔존율 추이 (그룹별 라인 그래프)")
-    retention_line_df = make_retention_line_data(df_retention)
-    st.line_chart(retention_line_df)
-
-    st.markdown("---")
-    st.markdown("### 🧠 잔존율 인사이트 코멘트 (입사연도별 그룹 관점)")
-    retention_comment = analyze_retention(df_retention, show_table=True)
-    st.markdown(retention_comment)
-
-# -------------------------------------
-# 페이지 3: 액션 포인트
-# -------------------------------------
-elif menu.startswith("3"):
-    st.subheader("📍 페이지 3 — 액션 포인트")
-
-    headcount_comment = analyze_headcount(df_change)
-    dept_comment, risk_df = analyze_department_turnover(df_turnover, show_table=False)
-    retention_comment = analyze_retention(df_retention, show_table=False)
-
-    st.markdown("### 🧠 요약 인사이트")
-    if "🔹 **종합 인사이트**" in headcount_comment:
-        summary_part = headcount_comment.split("🔹 **종합 인사이트**")[-1]
-        st.markdown("**조직 현황 종합 인사이트**" + summary_part)
-    else:
-        st.markdown(headcount_comment)
-
-    st.markdown("---")
-    st.markdown("### ✅ HR 액션 포인트 제안")
-
-    action_points = generate_action_points(
-        headcount_comment, risk_df, retention_comment
-    )
-    st.markdown(action_points)
-
+    render_profile(profiler, menu)
 
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""HR 인사이트 대시보드의 데이터 로딩·분석 모듈 모음
+
+자주 쓰는 함수는 패키지에서 바로 가져올 수 있습니다 (Streamlit 불필요).
+
+    from hr_core import load_data, analyze_headcount
+    sheets = load_data("company_hr_data.xlsx")
+    comment = analyze_headcount(sheets["인원변동"])
+
+`import hr_core` 자체는 pandas·numpy를 읽지 않고, 함수에 처음 접근할 때
+해당 모듈을 import합니다 (PEP 562 모듈 __getattr__).
+"""
+import importlib
+
+# 공개 이름 → 실제로 정의된 모듈
+_EXPORTS = {
+    "load_data": "hr_core.warmup",
+    "build_snapshot": "hr_core.warmup",
+    "normalize_sheets": "hr_core.schema",
+    "SchemaError": "hr_core.schema",
+    "to_month_period": "hr_core.analysis",
+    "analyze_headcount": "hr_core.analysis",
+    "analyze_department_turnover": "hr_core.analysis",
+    "analyze_retention": "hr_core.analysis",
+    "make_headcount_line_data": "hr_core.analysis",
+    "make_retention_line_data": "hr_core.analysis",
+    "generate_action_points": "hr_core.analysis",
+    "summary_insight": "hr_core.analysis",
+}
+
+# ruff·IDE가 읽을 수 있도록 정적 목록으로 둠 (_EXPORTS와 같은 이름)
+__all__ = [
+    "SchemaError",
+    "analyze_department_turnover",
+    "analyze_headcount",
+    "analyze_retention",
+    "build_snapshot",
+    "generate_action_points",
+    "load_data",
+    "make_headcount_line_data",
+    "make_retention_line_data",
+    "normalize_sheets",
+    "summary_insight",
+    "to_month_period",
+]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value   # 다음 접근부터는 일반 속성 조회
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,379 @@
+"""HR 인사이트 분석 함수 모음 (Streamlit 없이 동작)
+
+각 함수는 코멘트 문자열과 표 DataFrame 등 일반 값만 반환하고 화면에는 아무것도 그리지 않으므로,
+대시보드에서는 데이터 버전별로 결과를 캐싱해 두고 렌더링만 합니다.
+"""
+import numpy as np
+import pandas as pd
+
+from hr_core import retention as hr_retention
+from hr_core import risk as hr_risk
+from hr_core.schema import to_month_key
+
+# =========================================
+# 1. 분석 대상 시트·컬럼
+# =========================================
+# 시트별로 분석에 쓰는 컬럼 (None이면 전체 컬럼)
+SHEET_COLUMNS = {
+    "인원변동": ["월", "입사자", "퇴사자", "총원"],
+    "퇴사율": None,  # 부서 컬럼 구성이 워크북마다 달라 전체를 읽음
+    "잔존율": ["입사연도", "경과개월", "잔존율"],
+    "근속": None,    # 요약(구분, 근속년수) 또는 직원 단위 형태라 전체를 읽음
+    "조직별인원변동": None,  # 선택 시트 — 단위 컬럼 이름(부서·사업장 등)이 워크북마다 다름
+}
+
+# =========================================
+# 2. 유틸리티 함수들
+# =========================================
+def to_month_period(series):
+    """월 컬럼을 연-월 형태로 통일 (스키마 정규화로 이미 Period면 날짜 파싱 생략)"""
+    return to_month_key(series).astype(str)
+
+def sort_by_month(df_change):
+    """월 순서로 정렬된 인원변동 (이미 정렬돼 있으면 복사 없이 그대로 반환)"""
+    months = to_month_key(df_change["월"])
+    if months.is_monotonic_increasing:
+        return df_change
+    return df_change.iloc[months.argsort(kind="stable").to_numpy()]
+
+# =========================================
+# 3. 인사이트 코멘트 생성 함수들
+# =========================================
+
+# 3-1. 인원 변동 / 입·퇴사 인사이트
+def analyze_headcount(df_change):
+    df = sort_by_month(df_change)
+
+    if len(df) < 3:
+        return "📌 인원변동 데이터가 3개월 미만이라, 추세 분석은 어렵습니다. (모르겠습니다)"
+
+    recent_df_reset = df.tail(6).reset_index(drop=True)
+
+    last3 = recent_df_reset.tail(3)
+    prev3 = recent_df_reset.head(len(recent_df_reset) - 3)
+
+    if len(prev3) == 0:
+        prev3 = last3  # 비교 불가 시 동일 기간으로 처리 (추측입니다)
+
+    hire_last3 = last3["입사자"].sum()
+    hire_prev3 = prev3["입사자"].sum()
+    sep_last3 = last3["퇴사자"].sum()
+    sep_prev3 = prev3["퇴사자"].sum()
+
+    total_last = df["총원"].iloc[-1]
+    total_first = df["총원"].iloc[0]
+    total_change = total_last - total_first
+
+    return headcount_insights(hire_last3, hire_prev3, sep_last3, sep_prev3, total_change)
+
+# 3-1-1. 최근 3개월 vs 직전 3개월 합계와 총원 변화로 인사이트 문장 생성
+#        (hr_core.incremental의 누적 상태에서도 같은 문장을 만들 때 사용)
+def headcount_insights(hire_last3, hire_prev3, sep_last3, sep_prev3, total_change):
+    text_blocks = []
+
+    def pct_change(new, old):
+        if old == 0:
+            return np.nan
+        return (new - old) / old * 100
+
+    hire_chg = pct_change(hire_last3, hire_prev3)
+    sep_chg = pct_change(sep_last3, sep_prev3)
+
+    # 1) 입사자 추세 (표현 다양화)
+    hire_comment = f"최근 3개월 입사자는 총 **{hire_last3}명**이며, 직전 3개월 대비 "
+    if pd.isna(hire_chg):
+        hire_comment += "비교 가능한 과거 데이터가 부족합니다. (확실하지 않음)"
+    elif hire_chg > 40:
+        hire_comment += (
+            f"**{hire_chg:.1f}% 급증**했습니다. 공격적으로 인력을 확장하는 국면으로 볼 수 있습니다. (추측입니다)"
+        )
+    elif hire_chg > 20:
+        hire_comment += (
+            f"**{hire_chg:.1f}% 증가**했습니다. 채용 강도가 이전보다 확실히 높아진 상태입니다."
+        )
+    elif hire_chg > 5:
+        hire_comment += (
+            f"**{hire_chg:.1f}% 소폭 증가**했습니다. 완만하게 인력을 확충하는 흐름입니다."
+        )
+    elif hire_chg < -40:
+        hire_comment += (
+            f"**{abs(hire_chg):.1f}% 급감**했습니다. 채용 축소 또는 채용 전략 변화가 있었을 가능성이 큽니다. (추측입니다)"
+        )
+    elif hire_chg < -20:
+        hire_comment += (
+            f"**{abs(hire_chg):.1f}% 감소**했습니다. 신규 충원이 눈에 띄게 줄어든 상태입니다."
+        )
+    elif hire_chg < -5:
+        hire_comment += (
+            f"**{abs(hire_chg):.1f}% 소폭 감소**했습니다. 당장은 큰 리스크는 아니지만, "
+            "채용 파이프라인을 점검해 보는 것이 좋습니다. (추측입니다)"
+        )
+    else:
+        hire_comment += (
+            f"{hire_chg:.1f}% 변동으로, 큰 변화 없이 **안정적인 채용 수준**이 유지되고 있습니다."
+        )
+    text_blocks.append("🔹 **입사자 추세 인사이트**\n" + hire_comment)
+
+    # 2) 퇴사자 추세 (표현 다양화)
+    sep_comment = f"최근 3개월 퇴사자는 총 **{sep_last3}명**이며, 직전 3개월 대비 "
+    if pd.isna(sep_chg):
+        sep_comment += "비교 가능한 과거 데이터가 부족합니다. (확실하지 않음)"
+    elif sep_chg > 40:
+        sep_comment += (
+            f"**{sep_chg:.1f}% 급증**했습니다. 단기간에 이탈이 몰리면서, "
+            "조직 안정성 측면에서 강한 경고 신호로 해석될 수 있습니다. (추측입니다)"
+        )
+    elif sep_chg > 20:
+        sep_comment += (
+            f"**{sep_chg:.1f}% 증가**했습니다. 이탈이 눈에 띄게 많아진 구간으로, "
+            "원인 분석과 조기 대응이 필요한 상태입니다. (추측입니다)"
+        )
+    elif sep_chg > 5:
+        sep_comment += (
+            f"**{sep_chg:.1f}% 소폭 증가**했습니다. 당장 심각한 수준은 아니지만, "
+            "특정 부서·직무에 편중되어 있는지 확인하는 것이 좋습니다. (추측입니다)"
+        )
+    elif sep_chg < -20:
+        sep_comment += (
+            f"**{abs(sep_chg):.1f}% 감소**했습니다. 이탈이 뚜렷하게 줄어든 안정 구간입니다."
+        )
+    elif sep_chg < -5:
+        sep_comment += (
+            f"**{abs(sep_chg):.1f}% 소폭 감소**했습니다. 이탈 관리가 비교적 잘 이뤄지고 있는 흐름입니다. (추측입니다)"
+        )
+    else:
+        sep_comment += (
+            f"{sep_chg:.1f}% 변동으로, 이탈 수준은 **크게 흔들림 없이 유지**되고 있습니다."
+        )
+    text_blocks.append("🔹 **퇴사자 추세 인사이트**\n" + sep_comment)
+
+    # 3) 총원 추세 (장기)
+    if total_change > 0:
+        total_comment = (
+            f"분석 기간 전체로 보면 총원은 **+{total_change}명** 증가했습니다. "
+            "장기적으로 조직을 키워가는 성장 전략이 유지되고 있는 모습입니다."
+        )
+    elif total_change < 0:
+        total_comment = (
+            f"분석 기간 전체로 보면 총원은 **{total_change}명** 감소했습니다. "
+            "채용 축소, 자연 이탈, 선택적 구조조정 등이 함께 영향을 준 결과일 수 있습니다. (추측입니다)"
+        )
+    else:
+        total_comment = (
+            "분석 기간 동안 총원은 거의 변동이 없었습니다. "
+            "채용과 퇴사가 거의 균형을 이루는, 안정적인 인력 유지 구간으로 볼 수 있습니다."
+        )
+    text_blocks.append("🔹 **총원 장기 추세 인사이트**\n" + total_comment)
+
+    # 4) 종합 평가
+    net_last3 = hire_last3 - sep_last3
+    if net_last3 > 0 and (not pd.isna(sep_chg) and sep_chg < 20):
+        overall = (
+            "최근 3개월은 **순증가(입사 > 퇴사)** 구간으로, "
+            "단기 리스크는 낮고 성장을 지향하는 국면으로 해석할 수 있습니다. (추측입니다)"
+        )
+    elif net_last3 < 0 and (not pd.isna(sep_chg) and sep_chg > 20):
+        overall = (
+            "최근 3개월은 **순감소(퇴사 > 입사)** 구간이며, "
+            "퇴사 증가까지 겹쳐 **조직 안정성 측면에서 주의 깊은 모니터링이 필요한 시기**입니다. (추측입니다)"
+        )
+    else:
+        overall = (
+            "입·퇴사와 총원 모두 큰 폭의 변화는 아니지만, "
+            "세부 부서·직무 단위에서의 변동 패턴을 함께 살펴보는 것이 좋습니다. (추측입니다)"
+        )
+    text_blocks.append("🔹 **종합 인사이트**\n" + overall)
+
+    return "\n\n".join(text_blocks)
+
+# 3-2. 부서별 퇴사 리스크 분석 (옵션 A: 전년 대비 + 절대 규모 혼합 스코어) — (코멘트, 리스크 표) 반환
+def analyze_department_turnover(df_turnover):
+    text_blocks = []
+
+    # 최신 연도 vs 직전 연도 스코어/등급 (연도×부서 행렬 기반 배열 연산)
+    latest = hr_risk.department_risk(df_turnover, latest_only=True)
+    if latest.empty:
+        return "📌 전년 대비 분석을 할 수 있을 만큼 연도 데이터가 충분하지 않습니다. (모르겠습니다)", None
+
+    last_year = latest["연도"].iloc[0]       # 최신 연도
+    prev_year = latest["직전연도"].iloc[0]   # 직전 연도
+
+    risk_df = pd.DataFrame(
+        {
+            "부서": latest["부서"].astype(object),
+            f"{last_year}년_퇴사자수": latest["퇴사자수"],
+            f"{prev_year}년_퇴사자수": latest["직전퇴사자수"],
+            "전년대비스코어": latest["전년대비스코어"],
+            "절대규모스코어": latest["절대규모스코어"],
+            "최종리스크스코어": latest["최종리스크스코어"],
+            "리스크등급": latest["리스크등급"],
+        }
+    ).sort_values("최종리스크스코어", ascending=False, kind="stable")
+
+    # 인사이트 코멘트 (부서가 많아도 행 단위 iterrows 없이 컬럼을 묶어서 문자열 생성)
+    def describe_depts(rows):
+        return ", ".join(
+            f"{dept}팀("
+            f"{last_year}년 {this_val:.0f}명, "
+            f"{prev_year}년 대비 {yoy:.2f}배, "
+            f"절대규모스코어 {abs_score:.2f}, "
+            f"최종 {final:.2f})"
+            for dept, this_val, yoy, abs_score, final in zip(
+                rows["부서"],
+                rows[f"{last_year}년_퇴사자수"],
+                rows["전년대비스코어"],
+                rows["절대규모스코어"],
+                rows["최종리스크스코어"],
+            )
+        )
+
+    high_risk = risk_df[risk_df["리스크등급"] == "High"]
+    medium_risk = risk_df[risk_df["리스크등급"] == "Medium"]
+
+    if not high_risk.empty:
+        dept_list = describe_depts(high_risk)
+        text_blocks.append(
+            f"🔴 **High Risk 부서 인사이트 (전년 대비 + 절대 규모)**\n"
+            f"{dept_list} 에서 전년 대비 증가 폭과 절대 퇴사 규모가 모두 높은 편입니다. "
+            f"조직문화, 리더십, 역할적합성, 보상 등 원인 진단이 필요합니다. (추측입니다)"
+        )
+    else:
+        text_blocks.append(
+            "🔴 **High Risk 부서 인사이트 (전년 대비 + 절대 규모)**\n"
+            "현재 기준으로 전년 대비 증가 폭과 절대 규모를 함께 보았을 때, "
+            "강하게 경고가 필요한 부서는 없습니다."
+        )
+
+    if not medium_risk.empty:
+        dept_list = describe_depts(medium_risk)
+        text_blocks.append(
+            f"🟠 **Medium Risk 부서 인사이트 (전년 대비 + 절대 규모)**\n"
+            f"{dept_list} 수준으로, 앞으로의 추이를 모니터링하면서 "
+            f"퇴사 사유와 패턴을 주기적으로 확인하는 것이 좋습니다. (추측입니다)"
+        )
+    else:
+        text_blocks.append(
+            "🟠 **Medium Risk 부서 인사이트 (전년 대비 + 절대 규모)**\n"
+            "전년 대비 증가 폭과 절대 규모를 함께 보았을 때, "
+            "중간 수준의 주의가 필요한 부서는 아직 뚜렷하지 않습니다."
+        )
+
+    low_count = (risk_df["리스크등급"] == "Low").sum()
+    text_blocks.append(
+        f"🟢 **Low Risk 부서 인사이트**\n"
+        f"전년과 유사하거나 더 낮은 수준(또는 규모가 상대적으로 작은 수준)의 부서는 총 **{low_count}개**입니다."
+    )
+
+    return "\n\n".join(text_blocks), risk_df
+
+# 3-3. 잔존율 분석 (입사연도별 그룹 관점) — (코멘트, 급락 구간 표, 코호트별 최대 낙폭 표) 반환
+def analyze_retention(df_retention, drop_threshold=hr_retention.DROP_THRESHOLD):
+    text_blocks = []
+
+    df = df_retention
+
+    pivot_12 = df[df["경과개월"] == 12]
+    if pivot_12.empty:
+        text_blocks.append("📌 12개월 잔존율 데이터가 없어 입사연도별 그룹 비교는 어렵습니다. (모르겠습니다)")
+    else:
+        worst = pivot_12.sort_values("잔존율").iloc[0]
+        best = pivot_12.sort_values("잔존율", ascending=False).iloc[0]
+        text_blocks.append(
+            "🔹 **12개월 잔존율 기준 입사연도별 그룹 비교 인사이트**\n"
+            f"- 최저 잔존율: **{int(worst['입사연도'])}년 입사 그룹** ({worst['잔존율']:.1f}%)\n"
+            f"- 최고 잔존율: **{int(best['입사연도'])}년 입사 그룹** ({best['잔존율']:.1f}%)\n"
+            "→ 특정 입사연도 그룹에서 온보딩, 배치, 조직적합성 등 경험의 질이 달랐을 가능성이 있습니다. (추측입니다)"
+        )
+
+    # 전체 코호트를 한 번 정렬해 차분으로 급락 구간과 코호트별 최대 낙폭을 함께 계산
+    drops_df, worst_df = hr_retention.cohort_drops(df, threshold=drop_threshold)
+
+    if not drops_df.empty:
+        example = drops_df.iloc[0]
+        text_blocks.append(
+            "🔹 **입사연도별 그룹의 잔존율 급락 구간 인사이트**\n"
+            f"- 예: {int(example['입사연도'])}년 입사 그룹의 "
+            f"{int(example['경과개월'])}개월 시점에서 잔존율이 **{example['변화량']:.1f}p** 급락했습니다.\n"
+            "→ 해당 시점 전후의 평가, 조직개편, 리더 변경, 보상 이벤트 등을 함께 검토하는 것이 좋습니다. (추측입니다)"
+        )
+    else:
+        text_blocks.append(
+            "🔹 **입사연도별 그룹의 잔존율 급락 구간 인사이트**\n"
+            f"연속 구간에서 {drop_threshold:g}%p 이상 급락한 패턴은 뚜렷하게 나타나지 않습니다."
+        )
+
+    return "\n\n".join(text_blocks), drops_df, worst_df
+
+# 3-4. 입사연도별 잔존율 라인 그래프용 데이터
+def make_retention_line_data(df_retention):
+    line_df = df_retention.pivot_table(
+        index="경과개월",
+        columns="입사연도",
+        values="잔존율",
+        aggfunc="mean"
+    ).sort_index()
+    return line_df
+
+# 3-5. 액션 포인트 생성
+def generate_action_points(headcount_comment, risk_df, retention_comment):
+    points = []
+
+    if risk_df is not None:
+        high_risk = risk_df[risk_df["리스크등급"] == "High"]
+        if not high_risk.empty:
+            dept_names = ", ".join(high_risk["부서"].tolist())
+            points.append(
+                f"1) **High Risk 부서 집중 진단 제안 (전년 대비 + 절대 규모)**\n"
+                f"- 대상: {dept_names}\n"
+                f"- 액션: 퇴사자 인터뷰, 조직문화/리더십 진단, 역할·성과 기대치 명확화 워크숍 등을 우선 검토합니다. (추측입니다)"
+            )
+        else:
+            points.append(
+                "1) **High Risk 부서 집중 진단 제안 (전년 대비 + 절대 규모)**\n"
+                "- 현재 기준으로 High Risk에 해당하는 부서는 없지만, "
+                "퇴사 증가 신호가 나타날 경우 신속히 집중 진단을 진행할 수 있도록 준비하는 것이 좋습니다. (추측입니다)"
+            )
+
+    points.append(
+        "2) **입사연도별 그룹 잔존율 격차 관리 제안**\n"
+        "- 잔존율이 낮은 입사연도 그룹을 중심으로, 초기 온보딩/배치/피드백 구조를 점검하고 "
+        "동일 시기에 입사한 구성원들의 공통 경험을 인터뷰로 수집하는 것을 권장합니다. (추측입니다)"
+    )
+
+    points.append(
+        "3) **잔존율 급락 시점 재점검 제안**\n"
+        "- 잔존율이 특정 시점 이후 크게 떨어지는 경우, 그 전후로 있었던 평가, 조직개편, 리더 변경, "
+        "보상/성과 제도 변경 등 조직 이벤트를 함께 확인하고, 커뮤니케이션 및 제도 보완 방안을 마련하는 것이 좋습니다. (추측입니다)"
+    )
+
+    points.append(
+        "4) **입·퇴사 및 총원 추세 기반 채용/운영 전략 조정 제안**\n"
+        "- 퇴사 증가가 감지되는 시점에는 단기적인 충원 계획뿐 아니라, "
+        "이탈 사유를 체계적으로 수집·분석하여 중장기적인 구조 개선 방향까지 함께 검토하는 것이 중요합니다. (추측입니다)"
+    )
+
+    return "\n\n".join(points)
+
+# 3-6. 월별 입·퇴사/총원 라인 그래프용 데이터
+def make_headcount_line_data(df_change):
+    df = sort_by_month(df_change)
+    line_df = df[["입사자", "퇴사자", "총원"]]
+    line_df.index = pd.Index(to_month_period(df["월"]), name="월")
+    return line_df
+
+# 3-7. 연도×부서 퇴사자 수 표
+def make_turnover_table(df_turnover):
+    turnover_melt = df_turnover.melt(id_vars=["연도"], var_name="부서", value_name="퇴사자수")
+    return turnover_melt.pivot(index="연도", columns="부서", values="퇴사자수")
+
+# 3-8. 부서×연도 리스크 등급 추이 (연속된 모든 연도 쌍 기준)
+def make_risk_history(df_turnover):
+    risk_history = hr_risk.department_risk(df_turnover)
+    return risk_history.pivot(index="부서", columns="연도", values="리스크등급")
+
+# 3-9. 액션 포인트 페이지의 요약 인사이트 (인원변동 코멘트의 종합 인사이트 부분)
+def summary_insight(headcount_comment):
+    if "🔹 **종합 인사이트**" in headcount_comment:
+        summary_part = headcount_comment.split("🔹 **종합 인사이트**")[-1]
+        return "**조직 현황 종합 인사이트**" + summary_part
+    return headcount_comment
@@ -0,0 +1,89 @@
+"""인원변동 전체 이력의 3개월 vs 직전 3개월 이상 구간 탐지
+
+analyze_headcount는 마지막 6개월만 비교하지만, 여기서는 모든 월 t에 대해
+(t-2..t 합계) vs (t-5..t-3 합계) 변화율을 누적합 차분으로 한 번에 구합니다 (O(n)).
+조직별인원변동처럼 여러 시리즈가 이어 붙은 데이터도 단위 경계를 넘지 않도록 같은 방식으로 처리하며,
+기존 인사이트와 같은 ±20/40% 구간(증가·급증, 감소·급감)을 넘은 월만 남깁니다.
+"""
+import numpy as np
+import pandas as pd
+
+from hr_core import analysis as hr_analysis
+from hr_core import units as hr_units
+from hr_core.schema import to_month_key
+
+SERIES = ("입사자", "퇴사자")
+# 표시할 구간 (TREND_LABELS 번호): 급감·감소, 증가·급증 — 소폭 변화와 안정은 제외
+FLAG_CODES = (0, 1, 5, 6)
+SCAN_COLUMNS = ["월", "지표", "인원", "최근3개월", "직전3개월", "변화율", "구간"]
+
+
+def rolling_3v3(values, positions):
+    """시리즈 안 위치(positions)가 주어진 이어 붙은 배열에서 각 행 기준 (최근 3개월, 직전 3개월, 변화율)
+
+    positions는 각 행이 자기 시리즈에서 몇 번째 행인지(0부터)이며, 앞쪽 6개월이 안 되는 행은 NaN입니다.
+    """
+    values = np.asarray(values, dtype=float)
+    # 앞에 0을 6개 붙인 누적합: cum[i + 6] = i행까지 합계 → 구간 합은 슬라이스 차분 (인덱스 계산 없음)
+    cum = np.zeros(len(values) + 6)
+    np.cumsum(values, out=cum[6:])
+    through_3ago = cum[3:-3]
+    last3 = np.where(positions >= 2, cum[6:] - through_3ago, np.nan)
+    prev3 = np.where(positions >= 5, through_3ago - cum[:-6], np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.where(prev3 == 0, np.nan, (last3 - prev3) / prev3 * 100)
+    return last3, prev3, pct
+
+
+def _flags(months, values, positions, units=None):
+    """시리즈별 변화율 계산 후 구간을 넘은 행만 SCAN_COLUMNS DataFrame으로 (행 순서, 지표 순)
+
+    months는 Period[M] 정수 값, units는 (단위 컬럼 이름, 행별 단위 번호, 단위 이름)입니다.
+    (행 × 지표) 배열에서 구간을 넘은 칸 위치를 한 번에 구하므로 정렬이 필요 없고,
+    문자열·객체 변환 없이 정수 코드로 범주형 컬럼을 만듭니다.
+    """
+    columns = [rolling_3v3(values[name], positions) for name in SERIES]
+    last3, prev3, pct = (np.column_stack([c[i] for c in columns]) for i in range(3))
+    # 퇴사자 문장에는 "급감"이 없으므로 같은 기준으로 "감소"에 합침
+    bands = np.column_stack(
+        [hr_units.trend_bands(pct[:, k], sharp_drop=name != "퇴사자") for k, name in enumerate(SERIES)]
+    )
+    hit = np.flatnonzero(np.isin(bands, FLAG_CODES))   # 행 우선 순서 = (행, 지표) 순
+    rows, series = np.divmod(hit, len(SERIES))
+    value = np.column_stack([values[name] for name in SERIES]).ravel()
+
+    out = {}
+    if units is not None:
+        unit_col, unit_codes, unit_names = units
+        out[unit_col] = pd.Categorical.from_codes(unit_codes[rows], categories=unit_names)
+    out.update(
+        {
+            "월": pd.PeriodIndex.from_ordinals(months[rows], freq="M"),
+            "지표": pd.Categorical.from_codes(series, categories=list(SERIES)),
+            "인원": value[hit],
+            "최근3개월": last3.ravel()[hit].astype(np.int64),
+            "직전3개월": prev3.ravel()[hit].astype(np.int64),
+            "변화율": pct.ravel()[hit],
+            "구간": pd.Categorical.from_codes(bands.ravel()[hit], categories=hr_units.TREND_LABELS),
+        }
+    )
+    return pd.DataFrame(out)
+
+
+def scan_change(df_change):
+    """인원변동 시트 전체에서 입사자·퇴사자 3 vs 3 변화가 ±20%를 넘은 월 (SCAN_COLUMNS, 월 순)"""
+    df = hr_analysis.sort_by_month(df_change)
+    months = to_month_key(df["월"]).array.asi8
+    values = {name: df[name].to_numpy() for name in SERIES}
+    return _flags(months, values, np.arange(len(df)))
+
+
+def scan_units(df_units, unit_col=None):
+    """조직별인원변동 시트의 모든 단위를 한 번에 스캔 (단위 컬럼 + SCAN_COLUMNS, 단위·월 순)"""
+    unit_col = unit_col or hr_units.unit_column(df_units)
+    codes, units, order, size, end = hr_units.sort_units(df_units, unit_col)
+    positions = np.arange(len(codes)) - (end - size)[codes]
+    months = to_month_key(df_units["월"]).array.asi8
+    months = months if order is None else months[order]
+    values = {name: hr_units.sorted_column(df_units, name, order) for name in SERIES}
+    return _flags(months, values, positions, units=(unit_col, codes, units))
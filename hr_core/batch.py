@@ -0,0 +1,207 @@
+"""여러 회사 워크북의 인사이트 리포트를 Streamlit 없이 일괄 생성하는 CLI
+
+폴더 안의 워크북마다 analyze_headcount / analyze_department_turnover / analyze_retention /
+generate_action_points를 실행해 회사별 Markdown·JSON 리포트를 쓰고,
+단계별 소요 시간을 summary.json으로 남깁니다. 워크북은 프로세스 풀로 병렬 처리합니다.
+시트 캐시는 입력 폴더에 만들지 않고 --cache-dir(기본: 실행 동안만 쓰는 임시 폴더)에 둡니다.
+
+    python -m hr_core.batch workbooks/ -o reports/ --workers 8
+"""
+import argparse
+import glob
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from hr_core import analysis as hr_analysis
+from hr_core import cache as hr_cache
+from hr_core import retention as hr_retention
+from hr_core import schema as hr_schema
+
+REPORT_SHEETS = ("인원변동", "퇴사율", "잔존율")
+
+
+# =========================================
+# 1. 회사 1곳 리포트 생성 (워커 프로세스에서 실행)
+# =========================================
+def _records(df):
+    return [] if df is None else json.loads(df.to_json(orient="records", force_ascii=False))
+
+
+def _markdown_table(df):
+    header = "| " + " | ".join(str(c) for c in df.columns) + " |"
+    divider = "|" + "---|" * len(df.columns)
+    rows = [
+        "| " + " | ".join(f"{v:.2f}" if isinstance(v, float) else str(v) for v in row) + " |"
+        for row in df.itertuples(index=False)
+    ]
+    return "\n".join([header, divider, *rows])
+
+
+def build_report(path, out_dir, drop_threshold=hr_retention.DROP_THRESHOLD, cache_root=None):
+    """워크북 하나를 분석해 <회사명>.md / <회사명>.json을 쓰고 단계별 소요 시간(초)을 반환"""
+    company = os.path.splitext(os.path.basename(path))[0]
+    timings = {}
+
+    def timed(stage, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        timings[stage] = time.perf_counter() - start
+        return result
+
+    sheets = timed(
+        "load", hr_cache.load_sheets, path, REPORT_SHEETS, hr_analysis.SHEET_COLUMNS, (), cache_root
+    )
+    sheets = timed("schema", hr_schema.normalize_sheets, sheets)
+    headcount_comment = timed("headcount", hr_analysis.analyze_headcount, sheets["인원변동"])
+    dept_comment, risk_df = timed(
+        "department", hr_analysis.analyze_department_turnover, sheets["퇴사율"]
+    )
+    retention_comment, drops_df, worst_df = timed(
+        "retention", hr_analysis.analyze_retention, sheets["잔존율"], drop_threshold
+    )
+    action_points = timed(
+        "action_points", hr_analysis.generate_action_points,
+        headcount_comment, risk_df, retention_comment,
+    )
+
+    start = time.perf_counter()
+    report = {
+        "company": company,
+        "source": os.path.abspath(path),
+        "sha256": hr_cache.workbook_fingerprint(path, cache_root)["sha256"],
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "headcount_comment": headcount_comment,
+        "department_comment": dept_comment,
+        "risk_table": _records(risk_df),
+        "retention_comment": retention_comment,
+        "retention_drops": _records(drops_df),
+        "retention_worst_drops": _records(worst_df),
+        "action_points": action_points,
+    }
+    with open(os.path.join(out_dir, f"{company}.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    markdown = [
+        f"# {company} HR 인사이트 리포트",
+        f"_생성 시각: {report['generated_at']}_",
+        "## 조직 현황 스냅샷",
+        headcount_comment,
+        "## 부서별 퇴사 리스크 (전년 대비 + 절대 규모)",
+        dept_comment,
+    ]
+    if risk_df is not None:
+        markdown.append(_markdown_table(risk_df))
+    markdown += [
+        "## 잔존율 (입사연도별 그룹 관점)",
+        retention_comment,
+        "## HR 액션 포인트 제안",
+        action_points,
+    ]
+    with open(os.path.join(out_dir, f"{company}.md"), "w", encoding="utf-8") as f:
+        f.write("\n\n".join(markdown) + "\n")
+    timings["write"] = time.perf_counter() - start
+
+    return timings
+
+
+def _run_one(path, out_dir, drop_threshold, cache_root):
+    start = time.perf_counter()
+    cpu_start = time.process_time()   # 워커 프로세스 기준 CPU 시간
+    try:
+        timings = build_report(path, out_dir, drop_threshold, cache_root)
+        status, error = "ok", None
+    except Exception as e:  # 한 회사가 실패해도 나머지 리포트는 계속 생성
+        timings, status, error = {}, "error", f"{type(e).__name__}: {e}"
+        # 워크북을 읽지 못하면 manifest만 든 캐시 폴더가 남으므로 정리
+        hr_cache.remove_cache_if_empty(path, cache_root)
+    return {
+        "company": os.path.splitext(os.path.basename(path))[0],
+        "path": path,
+        "status": status,
+        "error": error,
+        "seconds": time.perf_counter() - start,
+        "cpu_seconds": time.process_time() - cpu_start,
+        "stages": timings,
+    }
+
+
+# =========================================
+# 2. 폴더 전체 일괄 실행
+# =========================================
+def run_batch(
+    paths, out_dir, workers=None, drop_threshold=hr_retention.DROP_THRESHOLD, cache_root=None
+):
+    """워크북 목록을 프로세스 풀로 처리하고 summary.json 내용을 반환
+
+    cache_root를 주지 않으면 시트 캐시를 실행 동안만 쓰는 임시 폴더에 두고 끝나면 지웁니다.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory(prefix="hr-batch-cache-") as tmp_root:
+        cache_root = cache_root or tmp_root
+        start = time.perf_counter()
+        results = []
+        if workers == 1:
+            results = [_run_one(path, out_dir, drop_threshold, cache_root) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_run_one, path, out_dir, drop_threshold, cache_root)
+                    for path in paths
+                ]
+                results = [future.result() for future in as_completed(futures)]
+        wall = time.perf_counter() - start
+
+    results.sort(key=lambda r: r["company"])
+    summary = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "workers": workers,
+        "workbooks": len(paths),
+        "failed": sum(r["status"] != "ok" for r in results),
+        "wall_seconds": wall,
+        "cpu_seconds": sum(r["cpu_seconds"] for r in results),
+        "reports_per_second": len(paths) / wall if wall > 0 else None,
+        "results": results,
+    }
+    with open(os.path.join(out_dir, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="회사별 HR 인사이트 리포트 일괄 생성")
+    parser.add_argument("input_dir", help="워크북(.xlsx)이 들어 있는 폴더")
+    parser.add_argument("-o", "--output", default="reports", help="리포트를 저장할 폴더")
+    parser.add_argument("--pattern", default="*.xlsx", help="워크북 파일 패턴")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--drop-threshold", type=float, default=hr_retention.DROP_THRESHOLD)
+    parser.add_argument(
+        "--cache-dir", default=None, help="시트 캐시 폴더 (기본: 실행 동안만 쓰는 임시 폴더)"
+    )
+    args = parser.parse_args(argv)
+
+    paths = sorted(
+        p for p in glob.glob(os.path.join(args.input_dir, args.pattern))
+        if not os.path.basename(p).startswith("~$")  # 엑셀 잠금 파일 제외
+    )
+    if not paths:
+        parser.error(f"{args.input_dir}에 {args.pattern} 파일이 없습니다.")
+
+    summary = run_batch(paths, args.output, args.workers, args.drop_threshold, args.cache_dir)
+    for r in summary["results"]:
+        stages = ", ".join(f"{k} {v:.3f}s" for k, v in r["stages"].items())
+        print(f"{r['company']:<30} {r['status']:<6} {r['seconds']:.3f}s  {stages or r['error']}")
+    print(
+        f"총 {summary['workbooks']}개 (실패 {summary['failed']}개), "
+        f"{summary['workers']}개 프로세스, {summary['wall_seconds']:.2f}s"
+    )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,313 @@
+"""로딩·분석 함수 벤치마크 (합성 데이터 기준, 결과는 JSON으로 저장)
+
+    python -m hr_core.bench --size large
+    python -m hr_core.bench --size large --compare bench_results/large-20250101-000000.json
+
+함수마다 best/평균 소요 시간과 최대 메모리(tracemalloc 기준)를 기록하고,
+--compare로 이전 결과와 비교하면 tolerance 배 이상 느려진 항목을 회귀로 표시합니다.
+주요 모듈의 import 시간(새 프로세스 기준)도 함께 재서 IMPORT_BUDGETS를 넘으면 실패로 처리합니다.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from hr_core import analysis as hr_analysis
+from hr_core import anomaly as hr_anomaly
+from hr_core import cache as hr_cache
+from hr_core import downsample as hr_downsample
+from hr_core import incremental as hr_incremental
+from hr_core import schema as hr_schema
+from hr_core import survival as hr_survival
+from hr_core import synthetic
+from hr_core import units as hr_units
+from hr_core.ingest import write_workbook
+
+REGRESSION_TOLERANCE = 1.25   # 이전 결과 대비 이 배수 이상 느려지면 회귀
+
+# 새 인터프리터에서 import 한 번에 걸리는 시간 상한(초) — 콜드 스타트·워커 기동 비용
+IMPORT_BUDGETS = {
+    "hr_core": 0.02,            # 패키지 자체는 지연 import라 pandas·numpy를 읽지 않아야 함
+    "hr_core.analysis": 0.6,    # pandas·numpy import가 대부분
+    "hr_core.warmup": 0.8,      # + Arrow 캐시(pyarrow)
+    "app": 1.5,                 # + Streamlit·Altair (화면은 main()에서만 그림)
+}
+
+IMPORT_NOISE_S = 0.01         # import 비교 시 이보다 작은 차이는 회귀로 보지 않음 (프로세스 기동 편차)
+
+_IMPORT_SNIPPET = (
+    "import importlib, sys, time\n"
+    "start = time.perf_counter()\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+# =========================================
+# 1. 측정 대상
+# =========================================
+def bench_cases(frames, workbook=None):
+    """{이름: (실행 함수, 처리 행 수, 측정 전 준비 함수)} — 분석 함수는 대시보드처럼 정규화된 시트 기준"""
+    raw = frames
+    frames = hr_schema.normalize_sheets(raw)
+    change, turnover, retention = frames["인원변동"], frames["퇴사율"], frames["잔존율"]
+    retention_wide = hr_analysis.make_retention_line_data(retention)
+    prev_state = hr_incremental.HeadcountState.from_frame(change.iloc[:-1])
+    tenure = hr_survival.tenure_records(frames["근속"])
+    units = frames.get(hr_units.UNIT_SHEET)
+    cases = {
+        "normalize_sheets": (
+            lambda: hr_schema.normalize_sheets(raw), len(change) + turnover.size + len(retention), None
+        ),
+        "to_month_period": (lambda: hr_analysis.to_month_period(change["월"]), len(change), None),
+        "analyze_headcount": (lambda: hr_analysis.analyze_headcount(change), len(change), None),
+        "scan_change": (lambda: hr_anomaly.scan_change(change), len(change), None),
+        "headcount_state_append": (
+            lambda: prev_state.sync(change), len(change), None   # 마지막 1개월만 증분 반영
+        ),
+        "analyze_department_turnover": (
+            lambda: hr_analysis.analyze_department_turnover(turnover), turnover.size, None
+        ),
+        "analyze_retention": (lambda: hr_analysis.analyze_retention(retention), len(retention), None),
+        "make_retention_line_data": (
+            lambda: hr_analysis.make_retention_line_data(retention), len(retention), None
+        ),
+        "downsample_retention": (
+            lambda: hr_downsample.downsample_long(retention_wide), len(retention), None
+        ),
+    }
+    if units is not None:
+        cases["unit_headcount_summary"] = (
+            lambda: hr_units.unit_headcount_summary(units), len(units), None
+        )
+        cases["scan_units"] = (lambda: hr_anomaly.scan_units(units), len(units), None)
+    if tenure is not None:
+        cases["tenure_records"] = (
+            lambda: hr_survival.tenure_records(frames["근속"]), len(tenure), None
+        )
+        cases["kaplan_meier_by_cohort"] = (
+            lambda: hr_survival.survival_curves(tenure, "입사연도"), len(tenure), None
+        )
+
+    if workbook is not None:
+        sheets = ("인원변동", "퇴사율", "잔존율", "근속")
+        total = len(change) + turnover.size + len(retention) + len(frames["근속"])
+
+        def load():
+            return hr_cache.load_sheets(workbook, sheets, hr_analysis.SHEET_COLUMNS)
+
+        def clear_cache():
+            shutil.rmtree(hr_cache.cache_dir_for(workbook), ignore_errors=True)
+
+        cases["load_cold"] = (load, total, clear_cache)   # 엑셀 파싱 + Arrow 캐시 생성
+        cases["load_warm"] = (load, total, None)          # Arrow 캐시 메모리 매핑
+    return cases
+
+
+def measure(func, setup=None, repeat=3):
+    """(소요 시간 목록(초), 최대 메모리(바이트))"""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    # 메모리는 tracemalloc 오버헤드가 시간에 섞이지 않도록 별도 1회 실행으로 측정
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return times, peak
+
+
+def measure_import(module, repeat=3):
+    """새 파이썬 프로세스에서 module을 import하는 데 걸린 시간 목록(초) — import가 실패하면 None"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    for _ in range(repeat):
+        try:
+            out = subprocess.run(
+                [sys.executable, "-c", _IMPORT_SNIPPET, module],
+                capture_output=True, text=True, check=True, cwd=root,
+            )
+        except subprocess.CalledProcessError:
+            return None   # 선택 의존성(streamlit 등)이 없는 환경
+        times.append(float(out.stdout.split()[-1]))
+    return times
+
+
+# =========================================
+# 2. 실행 / 저장 / 비교
+# =========================================
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def prepare_workbook(size, seed, data_dir):
+    """크기·seed별 합성 워크북을 한 번만 만들어 두고 경로를 반환"""
+    os.makedirs(data_dir, exist_ok=True)
+    name = "-".join(f"{k}{v}" for k, v in size.items())
+    path = os.path.join(data_dir, f"synthetic-{name}-seed{seed}.xlsx")
+    if not os.path.exists(path):
+        write_workbook(synthetic.make_frames(**size, seed=seed), path)
+    return path
+
+
+def run_imports(repeat=3, only=None, budgets=IMPORT_BUDGETS):
+    results = []
+    for module, budget in budgets.items():
+        if only and module not in only:
+            continue
+        times = measure_import(module, repeat)
+        if times is None:
+            continue
+        results.append(
+            {
+                "name": module,
+                "best_s": min(times),
+                "mean_s": statistics.mean(times),
+                "budget_s": budget,
+                "over_budget": min(times) > budget,
+            }
+        )
+    return results
+
+
+def run_benchmarks(size, seed=0, repeat=3, workbook=None, only=None, imports=True):
+    frames = synthetic.make_frames(**size, seed=seed)
+    results = []
+    for name, (func, rows, setup) in bench_cases(frames, workbook).items():
+        if only and name not in only:
+            continue
+        times, peak = measure(func, setup, repeat)
+        results.append(
+            {
+                "name": name,
+                "rows": int(rows),
+                "best_s": min(times),
+                "mean_s": statistics.mean(times),
+                "peak_mb": peak / 2**20,
+            }
+        )
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "seed": seed,
+        "repeat": repeat,
+        "size": size,
+        "results": results,
+        "imports": run_imports(repeat, only) if imports else [],
+    }
+
+
+def compare(current, previous, tolerance=REGRESSION_TOLERANCE, key="results", min_delta=0.0):
+    """[(이름, 이전 best_s, 현재 best_s, 배율, 회귀 여부)] — key="imports"면 import 시간 비교
+
+    min_delta(초)보다 작게 느려진 항목은 배율과 관계없이 회귀로 보지 않습니다.
+    """
+    before = {r["name"]: r for r in previous.get(key, [])}
+    rows = []
+    for r in current.get(key, []):
+        if r["name"] not in before:
+            continue
+        old = before[r["name"]]["best_s"]
+        ratio = r["best_s"] / old if old > 0 else float("inf")
+        slower = ratio > tolerance and r["best_s"] - old > min_delta
+        rows.append((r["name"], old, r["best_s"], ratio, slower))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HR 대시보드 로딩·분석 벤치마크")
+    parser.add_argument("--size", choices=sorted(synthetic.SIZES), default="small")
+    for key in synthetic.SIZES["small"]:
+        parser.add_argument(f"--{key.replace('_', '-')}", type=int, help=f"{key} 프리셋 값 덮어쓰기")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="측정할 항목 이름만 지정")
+    parser.add_argument("--skip-load", action="store_true", help="워크북 로딩 측정 생략 (엑셀 생성이 느린 큰 크기용)")
+    parser.add_argument("--skip-imports", action="store_true", help="모듈 import 시간 측정 생략")
+    parser.add_argument("--data-dir", default=".bench_data", help="합성 워크북 보관 폴더")
+    parser.add_argument("--out", help="결과 JSON 경로 (기본: bench_results/<크기>-<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    size = dict(synthetic.SIZES[args.size])
+    for key in size:
+        override = getattr(args, key)
+        if override is not None:
+            size[key] = override
+
+    workbook = None if args.skip_load else prepare_workbook(size, args.seed, args.data_dir)
+    report = run_benchmarks(
+        size, args.seed, args.repeat, workbook, args.only, imports=not args.skip_imports
+    )
+
+    out = args.out or os.path.join(
+        "bench_results", f"{args.size}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"{'항목':<30}{'행 수':>12}{'best(s)':>12}{'mean(s)':>12}{'peak(MB)':>12}")
+    for r in report["results"]:
+        print(f"{r['name']:<30}{r['rows']:>12}{r['best_s']:>12.4f}{r['mean_s']:>12.4f}{r['peak_mb']:>12.1f}")
+    over_budget = 0
+    if report["imports"]:
+        print(f"\n{'import':<30}{'best(s)':>12}{'mean(s)':>12}{'예산(s)':>12}")
+        for r in report["imports"]:
+            over_budget += r["over_budget"]
+            print(
+                f"{r['name']:<30}{r['best_s']:>12.4f}{r['mean_s']:>12.4f}{r['budget_s']:>12.2f}"
+                f"{'  ⚠ 예산 초과' if r['over_budget'] else ''}"
+            )
+    print(f"결과 저장: {out}")
+
+    regressions = 0
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        print(f"\n{'항목':<30}{'이전(s)':>12}{'현재(s)':>12}{'배율':>8}")
+        for key, min_delta in (("results", 0.0), ("imports", IMPORT_NOISE_S)):
+            for name, old, new, ratio, slower in compare(
+                report, previous, args.tolerance, key, min_delta
+            ):
+                regressions += slower
+                label = name if key == "results" else f"import {name}"
+                print(f"{label:<30}{old:>12.4f}{new:>12.4f}{ratio:>8.2f}{'  ⚠ 회귀' if slower else ''}")
+    return 1 if regressions or over_budget else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,268 @@
+"""엑셀 워크북 시트를 Arrow(Feather) 파일로 캐싱하는 모듈
+
+첫 로딩 때 각 시트를 워크북 옆의 `.<파일명>.cache/<해시>/<시트>.arrow`로 변환해 두고,
+이후에는 openpyxl 파싱 없이 메모리 매핑으로 읽습니다.
+워크북 버전은 파일 크기·수정시각·내용 해시(sha256)로 식별하며,
+크기와 수정시각이 그대로면 해시 계산도 생략합니다.
+cache_root를 주면 캐시 폴더를 워크북 옆 대신 그 폴더 아래에 만듭니다 (일괄 실행 등).
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow가 없으면 캐시 없이 엑셀을 바로 읽습니다
+    pa = None
+    feather = None
+
+SHEETS = ("인원변동", "퇴사율", "잔존율", "근속")
+
+CACHE_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+_HASH_CHUNK = 1 << 20
+# Feather는 컬럼 이름을 문자열로 바꿔 저장하므로, 원래 이름(숫자·날짜 머리글 등)을 스키마 메타데이터에 보관
+COLUMNS_KEY = b"hr_core.columns"
+
+
+# =========================================
+# 1. 워크북 버전 식별
+# =========================================
+def cache_dir_for(path, cache_root=None):
+    """워크북 캐시 폴더 경로 — 기본은 워크북 옆, cache_root를 주면 그 아래"""
+    folder, name = os.path.split(os.path.abspath(path))
+    if cache_root is None:
+        return os.path.join(folder, f".{name}.cache")
+    # 다른 폴더의 같은 이름 워크북과 겹치지 않도록 폴더 경로 해시를 붙임
+    tag = hashlib.sha256(folder.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_root, f"{name}-{tag}.cache")
+
+
+def file_sha256(path):
+    """파일 내용의 sha256 해시"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_manifest(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != CACHE_VERSION:
+        return None
+    return manifest
+
+
+def _write_manifest(cache_dir, manifest):
+    # 임시 파일에 쓴 뒤 교체해서, 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 합니다
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, os.path.join(cache_dir, MANIFEST_NAME))
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _remove_stale_versions(cache_dir, keep):
+    for entry in os.listdir(cache_dir):
+        full = os.path.join(cache_dir, entry)
+        if entry != keep and os.path.isdir(full):
+            shutil.rmtree(full, ignore_errors=True)
+
+
+def remove_cache_if_empty(path, cache_root=None):
+    """캐시된 내용 없이 manifest만 남은 캐시 폴더 삭제 (읽다가 실패한 워크북 정리용)"""
+    cache_dir = cache_dir_for(path, cache_root)
+    for root, _, files in os.walk(cache_dir):
+        if any(root != cache_dir or name != MANIFEST_NAME for name in files):
+            return False
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    return True
+
+
+def workbook_fingerprint(path, cache_root=None):
+    """워크북의 크기·수정시각·내용 해시 (파일이 없으면 FileNotFoundError)"""
+    stat = os.stat(path)
+    cache_dir = cache_dir_for(path, cache_root)
+    manifest = _read_manifest(cache_dir)
+
+    if (
+        manifest is not None
+        and manifest["size"] == stat.st_size
+        and manifest["mtime_ns"] == stat.st_mtime_ns
+    ):
+        return manifest
+
+    sha256 = file_sha256(path)
+    unchanged = manifest is not None and manifest["sha256"] == sha256
+    manifest = {
+        "version": CACHE_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": sha256,
+    }
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        if not unchanged:
+            _remove_stale_versions(cache_dir, keep=sha256[:16])
+        _write_manifest(cache_dir, manifest)
+    except OSError:
+        pass  # 읽기 전용 폴더 등에서는 캐시 없이 동작
+    return manifest
+
+
+# =========================================
+# 2. 시트 캐시 읽기/쓰기
+# =========================================
+def _sheet_path(path, manifest, sheet, cache_root=None):
+    return os.path.join(cache_dir_for(path, cache_root), manifest["sha256"][:16], f"{sheet}.arrow")
+
+
+def _absent_path(path, manifest, sheet, cache_root=None):
+    # 워크북에 없는 선택 시트 표시 (다음 로딩 때 엑셀을 다시 열지 않도록)
+    return os.path.join(cache_dir_for(path, cache_root), manifest["sha256"][:16], f"{sheet}.absent")
+
+
+def _mark_absent(target):
+    try:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        open(target, "w").close()
+    except OSError:
+        pass
+
+
+def _encode_columns(columns):
+    """컬럼 이름 목록 → JSON (문자열·숫자·불리언은 그대로, 날짜는 ISO 문자열로 표시)"""
+    encoded = []
+    for name in columns:
+        if isinstance(name, datetime):
+            encoded.append({"datetime": name.isoformat()})
+        elif isinstance(name, (str, bool, int, float)):
+            encoded.append(name)
+        else:
+            raise TypeError(f"캐시에 저장할 수 없는 컬럼 이름입니다: {name!r}")
+    return json.dumps(encoded, ensure_ascii=False).encode("utf-8")
+
+
+def _decode_columns(raw):
+    return [
+        datetime.fromisoformat(name["datetime"]) if isinstance(name, dict) else name
+        for name in json.loads(raw)
+    ]
+
+
+def _write_sheet(df, target):
+    metadata = _encode_columns(df.columns)
+    df = df.reset_index(drop=True).set_axis([str(c) for c in df.columns], axis=1)
+    table = pa.Table.from_pandas(df)
+    table = table.replace_schema_metadata({**table.schema.metadata, COLUMNS_KEY: metadata})
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".tmp")
+    os.close(fd)
+    try:
+        # 메모리 매핑으로 읽을 수 있도록 압축 없이 저장
+        feather.write_feather(table, tmp, compression="uncompressed")
+        os.replace(tmp, target)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _read_sheet(target, sheet, columns=None):
+    """캐시된 시트 (원래 컬럼 이름이 없는 예전 캐시 파일이면 None — 엑셀에서 다시 읽음)"""
+    table = feather.read_table(target, memory_map=True)
+    metadata = table.schema.metadata or {}
+    if COLUMNS_KEY not in metadata:
+        return None
+    names = _decode_columns(metadata[COLUMNS_KEY])
+    if columns is not None:
+        _check_columns(sheet, names, columns)
+        table = table.select([names.index(c) for c in columns])
+        names = list(columns)
+    df = table.to_pandas()
+    df.columns = names
+    return df
+
+
+def _check_columns(sheet, available, columns):
+    missing = [c for c in columns if c not in available]
+    if missing:
+        raise ValueError(f"'{sheet}' 시트에 필요한 컬럼이 없습니다: {missing}")
+
+
+def load_sheets(path, sheets=SHEETS, columns=None, optional=(), cache_root=None):
+    """워크북의 시트들을 {시트명: DataFrame}으로 반환 (캐시가 유효하면 엑셀 파싱 생략)
+
+    columns는 {시트명: 컬럼 목록}으로, 지정한 시트는 해당 컬럼만 읽습니다.
+    optional에 넣은 시트는 워크북에 없으면 오류 대신 None으로 반환합니다.
+    cache_root를 주면 캐시를 워크북 옆 대신 그 폴더 아래에 둡니다.
+    """
+    columns = columns or {}
+
+    if feather is None:
+        return read_excel_sheets(path, sheets, columns, optional)
+
+    manifest = workbook_fingerprint(path, cache_root)
+    frames = {}
+    missing = []
+    for sheet in sheets:
+        target = _sheet_path(path, manifest, sheet, cache_root)
+        df = _read_sheet(target, sheet, columns.get(sheet)) if os.path.exists(target) else None
+        if df is not None:
+            frames[sheet] = df
+        elif sheet in optional and os.path.exists(_absent_path(path, manifest, sheet, cache_root)):
+            frames[sheet] = None
+        else:
+            missing.append(sheet)
+
+    if missing:
+        with pd.ExcelFile(path) as xls:
+            for sheet in missing:
+                if sheet in optional and sheet not in xls.sheet_names:
+                    _mark_absent(_absent_path(path, manifest, sheet, cache_root))
+                    frames[sheet] = None
+                    continue
+                # 캐시는 시트 전체로 만들어 두고, 필요한 컬럼만 잘라서 반환
+                df = pd.read_excel(xls, sheet)
+                try:
+                    _write_sheet(df, _sheet_path(path, manifest, sheet, cache_root))
+                except (pa.ArrowException, OSError, TypeError, ValueError):
+                    pass  # 혼합 타입 컬럼·중복 이름 등으로 캐시에 실패해도 로딩은 계속
+                cols = columns.get(sheet)
+                if cols is not None:
+                    _check_columns(sheet, df.columns, cols)
+                    df = df[list(cols)]
+                frames[sheet] = df
+
+    return {sheet: frames[sheet] for sheet in sheets}
+
+
+def read_excel_sheets(source, sheets=SHEETS, columns=None, optional=()):
+    """캐시 없이 엑셀에서 바로 읽기 — source는 경로 또는 파일 객체(업로드된 BytesIO 등)"""
+    columns = columns or {}
+    with pd.ExcelFile(source) as xls:
+        return {
+            sheet: None if sheet in optional and sheet not in xls.sheet_names
+            else pd.read_excel(xls, sheet, usecols=columns.get(sheet))
+            for sheet in sheets
+        }
+
+
+def load_sheet(path, sheet, columns=None):
+    """워크북의 시트 하나를 DataFrame으로 반환 (columns 지정 시 해당 컬럼만)"""
+    return load_sheets(path, (sheet,), {sheet: columns})[sheet]
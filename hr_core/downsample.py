@@ -0,0 +1,111 @@
+"""라인 차트용 서버 측 다운샘플링 (LTTB: Largest-Triangle-Three-Buckets)
+
+시리즈마다 브라우저로 보내는 점 수를 max_points 이하로 줄이되, 구간마다
+이웃 점들과 이루는 삼각형 넓이가 가장 큰 점을 골라 피크·급락 같은 모양을 유지합니다.
+"""
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_POINTS = 300   # 시리즈당 점 수 상한 (wide 레이아웃 차트 폭 기준)
+MIN_POINTS = 3             # 첫 점 + 가운데 구간 1개 + 마지막 점
+
+
+def _positions(index):
+    """x축 값을 넓이 계산용 숫자로 (월 Period는 월 번호, 그 외 숫자가 아니면 순번)"""
+    if isinstance(index, pd.PeriodIndex):
+        return index.asi8.astype(float)
+    if pd.api.types.is_numeric_dtype(index):
+        return np.asarray(index, dtype=float)
+    return np.arange(len(index), dtype=float)
+
+
+def lttb_indices(x, y, max_points):
+    """LTTB로 고른 점의 위치 (x 오름차순 가정, 첫·마지막 점은 항상 포함)
+
+    y가 (시리즈 수, n) 2차원이면 x를 공유하는 시리즈들을 한 번에 처리해 (시리즈 수, 점 수)를 반환합니다.
+    """
+    y = np.asarray(y, dtype=float)
+    n = y.shape[-1]
+    max_points = max(int(max_points), MIN_POINTS)
+    if n <= max_points:
+        return np.broadcast_to(np.arange(n), y.shape).copy()
+
+    x = np.asarray(x, dtype=float)
+    y2 = y.reshape(-1, n)
+    rows = np.arange(len(y2))
+    # 첫·마지막 점을 뺀 나머지를 max_points - 2개 구간으로 나눔
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    selected = np.empty((len(y2), max_points), dtype=int)
+    selected[:, 0], selected[:, -1] = 0, n - 1
+
+    a = np.zeros(len(y2), dtype=int)
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 구간 평균점 (마지막 구간은 마지막 점)
+        if i + 2 < len(edges):
+            avg_x = x[end:edges[i + 2]].mean()
+            avg_y = y2[:, end:edges[i + 2]].mean(axis=1)
+        else:
+            avg_x, avg_y = x[n - 1], y2[:, n - 1]
+        # 직전 선택점 a, 후보점, 다음 구간 평균점이 이루는 삼각형 넓이(의 2배)
+        xa, ya = x[a][:, None], y2[rows, a][:, None]
+        area = np.abs(
+            (xa - avg_x) * (y2[:, start:end] - ya)
+            - (xa - x[start:end]) * (avg_y[:, None] - ya)
+        )
+        a = start + area.argmax(axis=1)
+        selected[:, i + 1] = a
+    return selected.reshape(y.shape[:-1] + (max_points,))
+
+
+def downsample_frame(wide, max_points=DEFAULT_MAX_POINTS):
+    """x축을 공유하는 몇 개 시리즈용 — 컬럼별로 고른 행의 합집합만 남긴 wide 프레임
+
+    첫·마지막 행은 모든 컬럼이 공유하므로, 나머지 max_points - 2개를 컬럼 수로 나눠 컬럼마다 고릅니다.
+    합집합은 max_points 행 이하입니다 (컬럼이 max_points - 2개보다 많으면 컬럼마다 가운데 점 1개씩).
+    """
+    if len(wide) <= max_points:
+        return wide
+    x = _positions(wide.index)
+    per_column = 2 + max((int(max_points) - 2) // max(len(wide.columns), 1), 1)
+    keep = np.unique(
+        np.concatenate([lttb_indices(x, wide[col].to_numpy(), per_column) for col in wide.columns])
+    )
+    return wide.iloc[keep]
+
+
+def downsample_long(wide, max_points=DEFAULT_MAX_POINTS, x_name=None, series_name=None, value_name="값"):
+    """시리즈가 많은 wide 프레임(index=x, 컬럼=시리즈) → 시리즈별로 줄인 long 프레임 [x, 시리즈, 값]
+
+    시리즈 이름은 문자열로 바꿔 차트에서 범주형 색으로 그려지게 합니다.
+    """
+    x_name = x_name or wide.index.name or "x"
+    series_name = series_name or wide.columns.name or "시리즈"
+    x_all = _positions(wide.index)
+    index_values = wide.index.to_numpy()
+    values = wide.to_numpy(dtype=float).T          # (시리즈 수, x 개수)
+
+    # 코호트마다 관측 기간이 달라 NaN 구간은 제외 — 관측 위치가 같은 시리즈끼리 묶어 한 번에 처리
+    groups = {}
+    for i, valid in enumerate(~np.isnan(values)):
+        groups.setdefault(valid.tobytes(), (valid, []))[1].append(i)
+
+    picked = [None] * len(wide.columns)
+    for valid, members in groups.values():
+        positions = np.flatnonzero(valid)
+        if not len(positions):
+            continue
+        chosen = lttb_indices(x_all[positions], values[members][:, positions], max_points)
+        for i, row in zip(members, chosen):
+            picked[i] = positions[row]
+
+    parts = [
+        pd.DataFrame(
+            {x_name: index_values[rows], series_name: str(col), value_name: values[i, rows]}
+        )
+        for i, (col, rows) in enumerate(zip(wide.columns, picked))
+        if rows is not None
+    ]
+    if not parts:
+        return pd.DataFrame(columns=[x_name, series_name, value_name])
+    return pd.concat(parts, ignore_index=True)
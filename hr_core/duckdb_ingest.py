@@ -0,0 +1,128 @@
+"""DuckDB로 직원 레코드 파일을 집계하는 선택 백엔드 (수 GB 규모 이력용)
+
+hr_core.ingest의 청크 집계와 같은 시트를 만들되, 월×부서 입·퇴사 수와
+입사연도×근속개월 인원 집계를 DuckDB SQL(GROUP BY)로 파일 위에서 바로 계산합니다.
+DuckDB가 파일을 스트리밍으로 읽고 필요하면 디스크로 내려 쓰므로, 파이썬 쪽 메모리는
+집계 결과(월 수 × 부서 수) 규모만 사용합니다. duckdb 패키지가 있을 때만 동작합니다.
+
+    pip install duckdb
+    python -m hr_core.ingest events.parquet --engine duckdb --memory-limit 2GB
+"""
+import os
+
+import pandas as pd
+
+from hr_core.ingest import DEPT_COL, HIRE_COL, TERM_COL, UNKNOWN_DEPT, RecordAggregator
+
+try:
+    import duckdb
+except ImportError:  # 선택 의존성 — 없으면 청크 집계(hr_core.ingest)를 사용
+    duckdb = None
+
+
+def _quote(text):
+    return "'" + str(text).replace("'", "''") + "'"
+
+
+def _source(path):
+    """파일 확장자에 맞는 DuckDB 테이블 함수 (glob 패턴 가능: logs/*.parquet)"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".parquet":
+        return f"read_parquet({_quote(path)})"
+    if ext in (".csv", ".txt"):
+        return f"read_csv({_quote(path)}, header = true, all_varchar = true)"
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {path} (CSV 또는 Parquet)")
+
+
+def _month(col):
+    # 1970-01 기준 월 번호 (hr_core.ingest._month_index와 동일)
+    return f"((year({col}) - 1970) * 12 + month({col}) - 1)"
+
+
+def _day(col):
+    return f"date_diff('day', DATE '1970-01-01', {col})"
+
+
+def _records_sql(path, as_of):
+    """기준일을 반영한 (부서, 입사일, 퇴사일) 레코드 — 청크 집계의 RecordAggregator.add와 같은 규칙"""
+    term = "term" if as_of is None else f"CASE WHEN term > {as_of} THEN NULL ELSE term END"
+    hire_filter = "" if as_of is None else f" AND hire <= {as_of}"
+    return f"""
+        SELECT dept, hire, {term} AS term
+        FROM (
+            SELECT
+                coalesce(CAST("{DEPT_COL}" AS VARCHAR), {_quote(UNKNOWN_DEPT)}) AS dept,
+                CAST(TRY_CAST("{HIRE_COL}" AS TIMESTAMP) AS DATE) AS hire,
+                CAST(TRY_CAST("{TERM_COL}" AS TIMESTAMP) AS DATE) AS term
+            FROM {_source(path)}
+        )
+        WHERE hire IS NOT NULL{hire_filter}
+    """
+
+
+def aggregate_file(path, as_of=None, start=None, memory_limit=None, threads=None):
+    """직원 레코드 CSV/Parquet → {시트명: DataFrame} (ingest.aggregate_records와 같은 시트)
+
+    memory_limit("2GB" 등)와 threads로 DuckDB의 메모리 사용량·병렬도를 제한할 수 있습니다.
+    """
+    if duckdb is None:
+        raise ImportError("DuckDB 백엔드를 쓰려면 duckdb 패키지가 필요합니다: pip install duckdb")
+    as_of_sql = None if as_of is None else f"DATE {_quote(pd.Timestamp(as_of).date().isoformat())}"
+
+    con = duckdb.connect()
+    try:
+        if memory_limit:
+            con.execute(f"SET memory_limit = {_quote(memory_limit)}")
+        if threads:
+            con.execute(f"SET threads = {int(threads)}")
+        con.execute(f"CREATE TEMP VIEW rec AS {_records_sql(path, as_of_sql)}")
+
+        bad = con.execute("SELECT count(*) FROM rec WHERE term < hire").fetchone()[0]
+        if bad:
+            raise ValueError(f"퇴사일이 입사일보다 빠른 레코드가 {bad}건 있습니다.")
+
+        # 1) 월 × 부서 입·퇴사 수
+        month_dept = con.execute(f"""
+            SELECT dept AS "{DEPT_COL}", m AS "월번호",
+                   sum(h)::BIGINT AS "입사자", sum(t)::BIGINT AS "퇴사자"
+            FROM (
+                SELECT dept, {_month("hire")} AS m, 1 AS h, 0 AS t FROM rec
+                UNION ALL
+                SELECT dept, {_month("term")}, 0, 1 FROM rec WHERE term IS NOT NULL
+            )
+            GROUP BY ALL
+            ORDER BY 1, 2
+        """).df()
+
+        # 2) 입사연도 × 근속개월(만 개월 수) 인원 — 재직자는 근속개월 -1
+        cohorts = con.execute(f"""
+            SELECT year(hire) - 1970 AS "입사연도번호",
+                   CASE WHEN term IS NULL THEN -1
+                        ELSE {_month("term")} - {_month("hire")}
+                             - CASE WHEN day(term) < day(hire) THEN 1 ELSE 0 END
+                   END AS "근속개월",
+                   count(*) AS "인원"
+            FROM rec
+            GROUP BY ALL
+        """).df()
+
+        # 3) 평균 근속·기준일 계산용 합계
+        row = con.execute(f"""
+            SELECT
+                count(*) FILTER (WHERE term IS NULL),
+                coalesce(sum({_day("hire")}) FILTER (WHERE term IS NULL), 0),
+                count(*) FILTER (WHERE term IS NOT NULL),
+                coalesce(sum({_day("term")} - {_day("hire")}) FILTER (WHERE term IS NOT NULL), 0),
+                greatest(max({_day("hire")}), max({_day("term")}))
+            FROM rec
+        """).fetchone()
+    finally:
+        con.close()
+
+    aggregator = RecordAggregator(as_of=as_of)
+    aggregator.add_counts(
+        month_dept,
+        cohorts,
+        dict(zip(["n_active", "active_hire_days", "n_left", "left_tenure_days", "max_day"], row)),
+    )
+    return aggregator.frames(start=start)
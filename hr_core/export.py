@@ -0,0 +1,484 @@
+"""대시보드 1~3페이지를 데이터 버전별 정적 파일(HTML + JSON)로 내보내기
+
+조회만 하는 사용자를 위해 스냅샷의 분석 결과를 `<출력 폴더>/<워크북 해시 16자리>/`에
+index.html(차트는 인라인 SVG, 외부 스크립트 없음)과 data.json(차트·표용 사전 집계 데이터)으로 씁니다.
+같은 해시 폴더가 이미 있으면 워크북 해시만 계산하고 바로 끝나므로, 워크북이 바뀔 때만 다시 만들어집니다.
+출력 폴더의 index.html은 최신 버전으로 이동하며, 아무 정적 파일 서버로나 제공할 수 있습니다.
+
+    python -m hr_core.export company_hr_data.xlsx -o site
+    python -m hr_core.export company_hr_data.xlsx -o site --watch   # 워크북이 바뀔 때마다 재생성
+"""
+import argparse
+import html
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from hr_core import analysis as hr_analysis
+from hr_core import cache as hr_cache
+from hr_core import downsample as hr_downsample
+from hr_core import tables as hr_tables
+from hr_core import warmup as hr_warmup
+
+EXPORT_VERSION = 1
+KEEP_VERSIONS = 2          # 최신 버전 + 직전 버전 (교체 중에 열려 있던 페이지용)
+DEFAULT_COHORTS = 10       # 잔존율 차트에 표시할 최근 입사연도 수 (대시보드 기본값과 같음)
+TABLE_ROWS = hr_tables.PAGE_SIZE
+LATEST_NAME = "latest.json"
+PALETTE = ["#4c78a8", "#f58518", "#e45756", "#72b7b2", "#54a24b",
+           "#eeca3b", "#b279a2", "#ff9da6", "#9d755d", "#bab0ac"]
+
+
+# =========================================
+# 1. 데이터 → JSON / HTML 조각
+# =========================================
+def _plain(df, index=False):
+    """JSON으로 쓸 수 있도록 Period·범주형 컬럼을 문자열로 바꾼 DataFrame"""
+    if df is None:
+        return None
+    if index:
+        df = df.reset_index()
+    out = {}
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, (pd.PeriodDtype, pd.CategoricalDtype)):
+            values = values.astype(str)
+        out[str(col)] = values
+    return pd.DataFrame(out)
+
+
+def _records(df, index=False):
+    df = _plain(df, index)
+    return [] if df is None else json.loads(df.to_json(orient="records", force_ascii=False))
+
+
+def _columns(df, index=False):
+    """{컬럼: 값 목록} — 차트 데이터는 행 대신 컬럼 배열로 저장해 크기를 줄임"""
+    df = _plain(df, index)
+    return {col: json.loads(df[col].to_json(orient="values", force_ascii=False)) for col in df.columns}
+
+
+def markdown_html(text):
+    """코멘트에 쓰는 마크다운 일부(**굵게**, 줄바꿈, - 목록, ---)만 HTML로 변환"""
+    blocks = []
+    for block in text.strip().split("\n\n"):
+        if block.strip() == "---":
+            blocks.append("<hr>")
+            continue
+        parts, in_list = [], False
+        for line in block.split("\n"):
+            line = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html.escape(line))
+            is_item = line.startswith("- ")
+            if is_item != in_list:
+                parts.append("<ul>" if is_item else "</ul>")
+                in_list = is_item
+            elif parts and not is_item:
+                parts.append("<br>")
+            parts.append(f"<li>{line[2:]}</li>" if is_item else line)
+        if in_list:
+            parts.append("</ul>")
+        blocks.append(f"<div class='comment'>{''.join(parts)}</div>")
+    return "\n".join(blocks)
+
+
+def html_table(df, max_rows=TABLE_ROWS, index=False, decimals=None):
+    """상위 max_rows행만 담은 HTML 표 (전체 행은 data.json에 있음)"""
+    if df is None or df.empty:
+        return "<p class='muted'>표시할 데이터가 없습니다.</p>"
+    if decimals is None:  # 지정이 없으면 실수 컬럼은 소수 둘째 자리까지
+        decimals = {c: 2 for c in df.columns if pd.api.types.is_float_dtype(df[c].dtype)}
+    view = _plain(hr_tables.round_columns(df, decimals), index)
+    head = "".join(f"<th>{html.escape(str(c))}</th>" for c in view.columns)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{'' if pd.isna(v) else html.escape(str(v))}</td>" for v in row) + "</tr>"
+        for row in view.head(max_rows).itertuples(index=False)
+    )
+    note = ""
+    if len(view) > max_rows:
+        note = f"<p class='muted'>총 {len(view):,}행 중 상위 {max_rows}행 (전체는 data.json)</p>"
+    return f"<div class='table'><table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table></div>{note}"
+
+
+# =========================================
+# 2. 인라인 SVG 라인 차트
+# =========================================
+def _ticks(lo, hi, n=5):
+    if hi <= lo:
+        return [lo]
+    step = (hi - lo) / (n - 1)
+    magnitude = 10 ** np.floor(np.log10(step))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= step)
+    start = np.floor(lo / step) * step
+    return [v for v in np.arange(start, hi + step / 2, step) if lo - 1e-9 <= v <= hi + 1e-9]
+
+
+def svg_line_chart(x, series, x_labels=None, markers=(), y_domain=None, step=False,
+                   width=560, height=260, y_format="{:g}"):
+    """x(숫자 배열)를 공유하는 시리즈들의 라인 차트 SVG 문자열
+
+    series: {이름: 값 배열} (NaN은 선을 끊음), x_labels: x 위치 → 표시 문자열 함수,
+    markers: (x, y, 시리즈 이름, 위쪽 여부, 강조 여부, 툴팁) 목록, step=True면 계단형
+    """
+    left, right, top, bottom = 48, 12, 12, 48
+    x = np.asarray(x, dtype=float)
+    values = [np.asarray(v, dtype=float) for v in series.values()]
+    finite = np.concatenate([v[np.isfinite(v)] for v in values] or [np.array([0.0])])
+    y_lo, y_hi = y_domain or (min(finite.min(initial=0), 0), finite.max(initial=1))
+    y_hi = y_hi if y_hi > y_lo else y_lo + 1
+    x_lo, x_hi = (x.min(), x.max()) if len(x) else (0, 1)
+    x_hi = x_hi if x_hi > x_lo else x_lo + 1
+
+    def px(v):
+        return left + (v - x_lo) / (x_hi - x_lo) * (width - left - right)
+
+    def py(v):
+        return top + (1 - (v - y_lo) / (y_hi - y_lo)) * (height - top - bottom)
+
+    parts = [f"<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 {width} {height}' class='chart'>"]
+    for t in _ticks(y_lo, y_hi):
+        parts.append(
+            f"<line x1='{left}' x2='{width - right}' y1='{py(t):.1f}' y2='{py(t):.1f}' class='grid'/>"
+            f"<text x='{left - 6}' y='{py(t) + 4:.1f}' class='tick' text-anchor='end'>{y_format.format(t)}</text>"
+        )
+    for t in _ticks(x_lo, x_hi, 6):
+        label = x_labels(t) if x_labels else f"{t:g}"
+        parts.append(
+            f"<text x='{px(t):.1f}' y='{height - bottom + 16}' class='tick' text-anchor='middle'>"
+            f"{html.escape(label)}</text>"
+        )
+
+    colors = {}
+    for i, (name, v) in enumerate(zip(series, values)):
+        colors[name] = PALETTE[i % len(PALETTE)]
+        path, pen_down = [], False
+        for xv, yv in zip(x, v):
+            if not np.isfinite(yv):
+                pen_down = False
+                continue
+            if pen_down and step:
+                path.append(f"H{px(xv):.1f}V{py(yv):.1f}")
+            else:
+                path.append(f"{'L' if pen_down else 'M'}{px(xv):.1f},{py(yv):.1f}")
+            pen_down = True
+        parts.append(
+            f"<path d='{''.join(path)}' fill='none' stroke='{colors[name]}' stroke-width='1.6'>"
+            f"<title>{html.escape(str(name))}</title></path>"
+        )
+
+    for mx, my, name, up, strong, tip in markers:
+        cx, cy, r = px(mx), py(my), 6 if strong else 4
+        tip_y, base_y = (cy - r, cy + r) if up else (cy + r, cy - r)
+        points = f"{cx:.1f},{tip_y:.1f} {cx - r:.1f},{base_y:.1f} {cx + r:.1f},{base_y:.1f}"
+        parts.append(
+            f"<polygon points='{points}' fill='{colors.get(name, PALETTE[0])}' stroke='#fff' stroke-width='0.8'>"
+            f"<title>{html.escape(tip)}</title></polygon>"
+        )
+
+    legend_x = left
+    for name, color in colors.items():
+        parts.append(
+            f"<rect x='{legend_x}' y='{height - 16}' width='10' height='10' fill='{color}'/>"
+            f"<text x='{legend_x + 14}' y='{height - 7}' class='tick'>{html.escape(str(name))}</text>"
+        )
+        legend_x += 24 + 8 * len(str(name))
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+# =========================================
+# 3. 스냅샷 → 페이지 데이터 / HTML
+# =========================================
+def _headcount_chart(results, max_points):
+    """다운샘플링한 인원변동 차트 데이터 (data.json과 SVG가 같은 행을 씀)
+
+    마커는 전체 해상도 값을 쓰므로, 이상 구간 달은 다운샘플링 후에도 차트에 남도록 합칩니다.
+    """
+    full = results["headcount_line_data"]
+    anomalies = results["headcount_anomalies"]
+    headcount = hr_downsample.downsample_frame(full, max_points)
+    flagged = full.index.isin(anomalies["월"].astype(str)) & ~full.index.isin(headcount.index)
+    if flagged.any():
+        headcount = pd.concat([headcount, full[flagged]]).sort_index()
+    return headcount
+
+
+def page_data(snapshot, max_points=hr_downsample.DEFAULT_MAX_POINTS):
+    """data.json 내용 — 대시보드 기본 화면에 보이는 결과를 차트용으로 미리 집계"""
+    results = snapshot.results
+    headcount = _headcount_chart(results, max_points)
+    retention_wide = results["retention_line_data"]
+    cohorts = list(retention_wide.columns)[-DEFAULT_COHORTS:]
+    retention = hr_downsample.downsample_frame(retention_wide[cohorts], max_points)
+    dept_comment, risk_df = results["department"]
+    retention_comment, drops_df, worst_df = results["retention"]
+    risk_view = None
+    if risk_df is not None:
+        risk_view = hr_tables.filter_sort(risk_df, None, "최종리스크스코어", ascending=False)
+
+    return {
+        "export_version": EXPORT_VERSION,
+        "version": snapshot.version,
+        "built_at": snapshot.built_at,
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "page1": {
+            "headcount_chart": _columns(headcount, index=True),
+            "anomalies": _records(results["headcount_anomalies"]),
+            "headcount_comment": results["headcount_comment"],
+            "unit_summary": _records(results.get("unit_summary"), index=True),
+        },
+        "page2": {
+            "turnover_table": _records(results["turnover_table"], index=True),
+            "department_comment": dept_comment,
+            "risk_table": _records(risk_view),
+            "risk_history": _records(results["risk_history"], index=True),
+            "retention_chart": _columns(retention, index=True),
+            "survival": _columns(results["survival"]) if results["survival"] is not None else None,
+            "retention_comment": retention_comment,
+            "retention_drops": _records(drops_df),
+            "retention_worst_drops": _records(worst_df),
+        },
+        "page3": {
+            "summary": hr_analysis.summary_insight(results["headcount_comment"]),
+            "action_points": hr_analysis.generate_action_points(
+                results["headcount_comment"], risk_df, retention_comment
+            ),
+        },
+    }
+
+
+def _headcount_svg(headcount, anomalies):
+    months = list(headcount.index)
+    position = {m: i for i, m in enumerate(months)}
+    markers = [
+        (position[m], row["인원"], row["지표"], row["변화율"] > 0, row["구간"] in ("급증", "급감"),
+         f"{m} {row['지표']} {row['변화율']:.1f}% ({row['구간']})")
+        for row in _records(anomalies)
+        if (m := row["월"]) in position
+    ]
+
+    def label(i):
+        return months[int(round(i))] if 0 <= round(i) < len(months) else ""
+
+    x = np.arange(len(months))
+    flows = svg_line_chart(x, {c: headcount[c] for c in ("입사자", "퇴사자")}, label, markers)
+    total = svg_line_chart(x, {"총원": headcount["총원"]}, label,
+                           y_domain=(headcount["총원"].min(), headcount["총원"].max()))
+    return flows, total
+
+
+def render_html(snapshot, data, max_points=hr_downsample.DEFAULT_MAX_POINTS):
+    """페이지 1~3을 한 파일에 담은 HTML (스크립트 없이 인라인 SVG와 CSS만 사용)"""
+    results = snapshot.results
+    flows_svg, total_svg = _headcount_svg(
+        _headcount_chart(results, max_points), results["headcount_anomalies"]
+    )
+
+    retention = data["page2"]["retention_chart"]
+    retention_series = {c: retention[c] for c in retention if c != "경과개월"}
+    retention_svg = svg_line_chart(retention["경과개월"], retention_series, y_format="{:g}%")
+
+    survival_html = "<p class='muted'>근속 시트가 요약 형태라 생존 곡선이 없습니다.</p>"
+    survival = data["page2"]["survival"]
+    if survival is not None:
+        survival_html = svg_line_chart(
+            survival["근속개월"], {"생존율": survival["생존율"]}, y_domain=(0, 1), step=True,
+            y_format="{:.0%}",
+        )
+
+    dept_comment, risk_df = results["department"]
+    _, drops_df, worst_df = results["retention"]
+    risk_view = None if risk_df is None else pd.DataFrame(data["page2"]["risk_table"])
+    unit_summary = results.get("unit_summary")
+    unit_html = ""
+    if unit_summary is not None:
+        unit_view = hr_tables.filter_sort(
+            unit_summary.reset_index(), None, "퇴사자_변화율", ascending=False
+        )
+        unit_html = (
+            f"<h3>🏢 {html.escape(str(unit_summary.index.name))}별 인원변동 (최근 3개월 vs 직전 3개월)</h3>"
+            + html_table(unit_view, decimals={"입사자_변화율": 1, "퇴사자_변화율": 1})
+        )
+
+    title = "HR 인사이트 대시보드"
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>
+body {{ font-family: -apple-system, "Noto Sans KR", "Malgun Gothic", sans-serif; margin: 0 auto;
+       max-width: 1200px; padding: 16px 24px; color: #262730; line-height: 1.6; }}
+nav a {{ margin-right: 16px; }}
+section {{ border-top: 1px solid #ddd; margin-top: 24px; }}
+.row {{ display: flex; gap: 24px; flex-wrap: wrap; }}
+.row > div {{ flex: 1 1 480px; }}
+.chart {{ width: 100%; height: auto; }}
+.chart .grid {{ stroke: #eee; }}
+.chart .tick {{ font-size: 11px; fill: #666; }}
+.table {{ overflow-x: auto; }}
+table {{ border-collapse: collapse; font-size: 13px; }}
+th, td {{ border-bottom: 1px solid #eee; padding: 4px 8px; text-align: right; white-space: nowrap; }}
+th {{ background: #f7f7f9; }}
+.muted {{ color: #888; font-size: 13px; }}
+.comment {{ margin: 12px 0; }}
+.comment ul {{ margin: 2px 0; }}
+</style>
+</head>
+<body>
+<h1>👥 {title}</h1>
+<p class="muted">데이터 버전 {snapshot.version[:12]} · 분석 {html.escape(snapshot.built_at)} ·
+내보내기 {html.escape(data["generated_at"])} · <a href="data.json">data.json</a></p>
+<nav><a href="#page1">1. 조직 현황 스냅샷</a><a href="#page2">2. 리텐션 분석</a><a href="#page3">3. 액션 포인트</a></nav>
+
+<section id="page1">
+<h2>📍 페이지 1 — 조직 현황 스냅샷</h2>
+<div class="row">
+<div><strong>월별 입·퇴사 추이</strong>{flows_svg}
+<p class="muted">▲▼ 3개월 합계가 직전 3개월 대비 ±20% 이상 변한 달 (큰 표시는 ±40%)</p></div>
+<div><strong>월별 총원 추세</strong>{total_svg}</div>
+</div>
+<h3>🧠 인사이트 코멘트</h3>
+{markdown_html(results["headcount_comment"])}
+{unit_html}
+</section>
+
+<section id="page2">
+<h2>📍 페이지 2 — 리텐션 분석</h2>
+<h4>🔥 부서별 퇴사자 수 (연도×부서)</h4>
+{html_table(results["turnover_table"], index=True)}
+<h3>🧠 부서별 인사이트 코멘트 (전년 대비 + 절대 규모)</h3>
+{html_table(risk_view, decimals=None if risk_df is None else hr_tables.risk_table_decimals(risk_df))}
+{markdown_html(dept_comment)}
+<h3>📈 입사연도별 잔존율 추이 (최근 {DEFAULT_COHORTS}개 입사연도)</h3>
+{retention_svg}
+<h3>⏳ 근속 기간 생존 곡선 (Kaplan–Meier)</h3>
+{survival_html}
+<h3>🧠 잔존율 인사이트 코멘트 (입사연도별 그룹 관점)</h3>
+{html_table(drops_df)}
+<h4>입사연도별 최대 낙폭 구간</h4>
+{html_table(worst_df)}
+{markdown_html(data["page2"]["retention_comment"])}
+</section>
+
+<section id="page3">
+<h2>📍 페이지 3 — 액션 포인트</h2>
+<h3>🧠 요약 인사이트</h3>
+{markdown_html(data["page3"]["summary"])}
+<h3>✅ HR 액션 포인트 제안</h3>
+{markdown_html(data["page3"]["action_points"])}
+</section>
+</body>
+</html>
+"""
+
+
+# =========================================
+# 4. 버전 폴더 쓰기 / 정리
+# =========================================
+def version_dir(out_dir, version):
+    return os.path.join(out_dir, version[:16])
+
+
+def _write_text(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _prune(out_dir, keep):
+    """최근에 만든 버전 폴더 keep개만 남기고 삭제"""
+    folders = [
+        os.path.join(out_dir, name) for name in os.listdir(out_dir)
+        if os.path.isfile(os.path.join(out_dir, name, "index.html"))
+    ]
+    folders.sort(key=os.path.getmtime, reverse=True)
+    for folder in folders[keep:]:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def export_snapshot(snapshot, out_dir, max_points=hr_downsample.DEFAULT_MAX_POINTS,
+                    keep=KEEP_VERSIONS, force=False):
+    """스냅샷을 <out_dir>/<해시>/에 내보내고 (폴더, 새로 썼는지) 반환"""
+    os.makedirs(out_dir, exist_ok=True)
+    target = version_dir(out_dir, snapshot.version)
+    written = force or not os.path.isfile(os.path.join(target, "index.html"))
+    if written:
+        data = page_data(snapshot, max_points)
+        # 임시 폴더에 모두 쓴 뒤 이름을 바꿔서, 서버가 반쯤 쓰인 버전을 내보내지 않도록 함
+        tmp = tempfile.mkdtemp(dir=out_dir, prefix=".tmp-")
+        os.chmod(tmp, 0o755)  # mkdtemp는 소유자 전용(0700)이라 웹 서버가 읽을 수 있게 조정
+        try:
+            with open(os.path.join(tmp, "data.json"), "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            _write_text(os.path.join(tmp, "index.html"), render_html(snapshot, data, max_points))
+            if os.path.exists(target):
+                shutil.rmtree(target)
+            os.replace(tmp, target)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    # 출력 폴더 첫 화면은 최신 버전으로 이동 (이전 버전으로 돌아간 경우에도 정리 대상에서 빠지도록 갱신)
+    os.utime(target)
+    name = os.path.basename(target)
+    _write_text(
+        os.path.join(out_dir, "index.html"),
+        f"<!DOCTYPE html><meta charset='utf-8'><meta http-equiv='refresh' content='0; url={name}/'>"
+        f"<a href='{name}/'>HR 인사이트 대시보드</a>\n",
+    )
+    latest = {"version": snapshot.version, "path": f"{name}/", "built_at": snapshot.built_at}
+    _write_text(os.path.join(out_dir, LATEST_NAME), json.dumps(latest, ensure_ascii=False))
+    _prune(out_dir, keep)
+    return target, written
+
+
+def export_workbook(path, out_dir, max_points=hr_downsample.DEFAULT_MAX_POINTS,
+                    keep=KEEP_VERSIONS, force=False):
+    """워크북 해시의 버전 폴더가 이미 있으면 분석 없이 건너뛰고, 없을 때만 스냅샷을 만들어 내보냄"""
+    version = hr_cache.workbook_fingerprint(path)["sha256"]
+    target = version_dir(out_dir, version)
+    if not force and os.path.isfile(os.path.join(target, "index.html")):
+        return target, False
+    return export_snapshot(hr_warmup.build_snapshot(path), out_dir, max_points, keep, force)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 페이지를 정적 HTML + JSON으로 내보내기")
+    parser.add_argument("path", nargs="?", default="company_hr_data.xlsx")
+    parser.add_argument("-o", "--output", default="site", help="내보낼 폴더")
+    parser.add_argument("--max-points", type=int, default=hr_downsample.DEFAULT_MAX_POINTS)
+    parser.add_argument("--keep", type=int, default=KEEP_VERSIONS, help="남겨 둘 버전 수")
+    parser.add_argument("--force", action="store_true", help="같은 버전이 있어도 다시 생성")
+    parser.add_argument("--watch", action="store_true", help="워크북이 바뀔 때마다 다시 내보내기")
+    args = parser.parse_args(argv)
+
+    if not args.watch:
+        start = time.perf_counter()
+        target, written = export_workbook(args.path, args.output, args.max_points, args.keep, args.force)
+        state = "생성" if written else "변경 없음 (건너뜀)"
+        print(f"{target} {state}: {time.perf_counter() - start:.2f}s")
+        return 0
+
+    def build(path):
+        snapshot = hr_warmup.build_snapshot(path)
+        target, written = export_snapshot(snapshot, args.output, args.max_points, args.keep)
+        print(f"{target} {'생성' if written else '변경 없음'} ({snapshot.built_at})", flush=True)
+        return snapshot
+
+    watcher = hr_warmup.WorkbookWatcher(args.path, build=build).start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        watcher.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
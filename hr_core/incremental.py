@@ -0,0 +1,163 @@
+"""인원변동 시트의 증분 상태 — 월 추가 시 전체 이력을 다시 처리하지 않음
+
+analyze_headcount가 실제로 쓰는 값은 최근 6개월(3개월 vs 직전 3개월 합계)과
+첫 달·마지막 달 총원뿐이므로, 이 값들만 상태로 유지하고 월이 추가되면 O(1)로 갱신합니다.
+상태는 워크북 캐시 폴더의 headcount_state.json에 저장되며, 워크북이 바뀌었을 때
+결과에 영향을 주는 기존 행(첫 행과 마지막 6개 행)이 그대로이고 뒤에 월만 추가된 경우에는
+새 행만 반영합니다.
+"""
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field, replace
+
+import pandas as pd
+
+from hr_core import analysis as hr_analysis
+from hr_core.cache import cache_dir_for
+
+WINDOW = 6                      # 최근 3개월 + 직전 3개월
+STATE_FILE = "headcount_state.json"
+STATE_VERSION = 1
+_HASH_COLUMNS = ["월", "입사자", "퇴사자", "총원"]
+
+
+def _row_hashes(df_change, positions):
+    """지정한 행 위치들의 해시 목록 (월 순서로 정렬한 시트 기준)"""
+    rows = df_change[_HASH_COLUMNS].iloc[positions]
+    return pd.util.hash_pandas_object(rows, index=False).tolist()
+
+
+@dataclass
+class HeadcountState:
+    """인원변동 요약 상태: 전체 개월 수, 첫 달 총원, 최근 6개월 [월, 입사자, 퇴사자, 총원]"""
+
+    n_months: int = 0
+    first_month: str = None
+    first_total: float = None
+    window: list = field(default_factory=list)
+    # 월 순서로 정렬한 시트의 첫 행·마지막 WINDOW개 행 해시 (기존 행이 그대로인지 확인용)
+    first_hash: int = None
+    tail_hashes: list = field(default_factory=list)
+
+    @classmethod
+    def from_frame(cls, df_change):
+        """인원변동 시트 전체로 상태를 새로 계산"""
+        df = hr_analysis.sort_by_month(df_change)
+
+        state = cls(n_months=len(df))
+        if len(df):
+            hashes = _row_hashes(df, [0, *range(max(len(df) - WINDOW, 0), len(df))])
+            state.first_hash, state.tail_hashes = hashes[0], hashes[1:]
+            # 월은 JSON으로 저장하므로 "YYYY-MM" 문자열로 보관 (첫 행·최근 6개월만 변환)
+            head_tail = pd.concat([df.head(1), df.tail(WINDOW)])
+            months = hr_analysis.to_month_period(head_tail["월"]).tolist()
+            state.first_month = months[0]
+            state.first_total = df["총원"].iloc[0].item()
+            tail = head_tail.iloc[1:]
+            state.window = [
+                list(row)
+                for row in zip(months[1:], *(tail[c].tolist() for c in _HASH_COLUMNS[1:]))
+            ]
+        return state
+
+    def append(self, month, hires, seps, total):
+        """한 달 추가 (월은 마지막 달 이후여야 함)"""
+        if self.window and month <= self.window[-1][0]:
+            raise ValueError(f"{month}은(는) 마지막 월 {self.window[-1][0]} 이후가 아닙니다.")
+        if self.n_months == 0:
+            self.first_month, self.first_total = month, total
+        self.window.append([month, hires, seps, total])
+        del self.window[:-WINDOW]
+        self.n_months += 1
+
+    def rolling_sums(self):
+        """(최근 3개월 입사, 직전 3개월 입사, 최근 3개월 퇴사, 직전 3개월 퇴사) — 창 크기 고정이라 O(1)"""
+        last3 = self.window[-3:]
+        prev3 = self.window[:-3] or last3  # 비교 불가 시 동일 기간으로 처리 (추측입니다)
+        return (
+            sum(row[1] for row in last3),
+            sum(row[1] for row in prev3),
+            sum(row[2] for row in last3),
+            sum(row[2] for row in prev3),
+        )
+
+    def total_change(self):
+        return self.window[-1][3] - self.first_total
+
+    def comment(self):
+        """analyze_headcount와 같은 인사이트 코멘트"""
+        if self.n_months < 3:
+            return "📌 인원변동 데이터가 3개월 미만이라, 추세 분석은 어렵습니다. (모르겠습니다)"
+        return hr_analysis.headcount_insights(*self.rolling_sums(), self.total_change())
+
+    def sync(self, df_change):
+        """바뀐 인원변동 시트를 반영한 상태 반환 — 기존 행 뒤에 월만 추가됐으면 새 행만 처리"""
+        # 시트 행 순서가 월 순서가 아니어도 같은 행을 비교하도록 정렬한 뒤 확인
+        df = hr_analysis.sort_by_month(df_change)
+        n_old, n_new = self.n_months, len(df)
+        if 0 < n_old <= n_new:
+            tail_start = n_old - len(self.tail_hashes)
+            hashes = _row_hashes(df, [0, *range(tail_start, n_new)])
+            old_tail, new_hashes = hashes[1:len(self.tail_hashes) + 1], hashes[len(self.tail_hashes) + 1:]
+            if hashes[0] == self.first_hash and old_tail == self.tail_hashes:
+                if n_new == n_old:
+                    return self
+                new_rows = df.iloc[n_old:]
+                months = hr_analysis.to_month_period(new_rows["월"])
+                updated = replace(self, window=[list(row) for row in self.window])
+                try:
+                    for month, hires, seps, total in zip(
+                        months, new_rows["입사자"].tolist(), new_rows["퇴사자"].tolist(),
+                        new_rows["총원"].tolist(),
+                    ):
+                        updated.append(month, hires, seps, total)
+                except ValueError:
+                    pass  # 중간 월이 끼어든 경우 등은 전체 재계산
+                else:
+                    updated.tail_hashes = (old_tail + new_hashes)[-WINDOW:]
+                    return updated
+        return HeadcountState.from_frame(df)
+
+
+# =========================================
+# 상태 저장/불러오기
+# =========================================
+def _state_path(path):
+    return os.path.join(cache_dir_for(path), STATE_FILE)
+
+
+def load_state(path):
+    """워크북 옆 캐시 폴더에 저장된 상태 (없거나 깨졌으면 None)"""
+    try:
+        with open(_state_path(path), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.pop("version", None) != STATE_VERSION:
+        return None
+    try:
+        return HeadcountState(**data)
+    except TypeError:
+        return None  # 필드 구성이 다른 예전 상태 파일
+
+
+def save_state(path, state):
+    folder = cache_dir_for(path)
+    try:
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": STATE_VERSION, **asdict(state)}, f, ensure_ascii=False)
+        os.replace(tmp, _state_path(path))
+    except OSError:
+        pass  # 읽기 전용 폴더 등에서는 저장 없이 동작
+
+
+def headcount_state(path, df_change):
+    """저장된 상태를 현재 인원변동 시트에 맞춰 갱신해 반환 (바뀐 경우에만 저장)"""
+    state = load_state(path)
+    updated = HeadcountState.from_frame(df_change) if state is None else state.sync(df_change)
+    if updated is not state:
+        save_state(path, updated)
+    return updated
@@ -0,0 +1,417 @@
+"""직원 단위 원천 데이터(사번·부서·입사일·퇴사일)로 집계 시트를 만드는 모듈
+
+CSV/Parquet 파일을 청크 단위로 읽으면서 월×부서 입·퇴사 수, 입사연도×근속개월 퇴사 수를
+bincount로 누적하고, 마지막에 대시보드가 쓰는 시트(인원변동·퇴사율·잔존율·근속)를 만듭니다.
+직원 수와 무관하게 메모리는 (월 수 × 부서 수) 규모만 사용합니다.
+
+    python -m hr_core.ingest employees.csv -o company_hr_data.xlsx
+    python -m hr_core.ingest 'history/*.parquet' --engine duckdb   # DuckDB 집계 (선택)
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from hr_core.cache import SHEETS
+from hr_core.units import UNIT_SHEET
+
+ID_COL = "사번"
+DEPT_COL = "부서"
+HIRE_COL = "입사일"
+TERM_COL = "퇴사일"
+RECORD_COLUMNS = [ID_COL, DEPT_COL, HIRE_COL, TERM_COL]
+
+UNKNOWN_DEPT = "미지정"
+RETENTION_STEP = 12      # 잔존율 시트의 경과개월 간격
+CHUNKSIZE = 500_000
+DAYS_PER_YEAR = 365.25
+EXCEL_MAX_ROWS = 1_048_575   # 헤더 제외
+
+
+# =========================================
+# 1. 카운트 누적용 행렬
+# =========================================
+class _CountGrid:
+    """정수 키(월·연도 등) × 열 번호 카운트 행렬 — 키 범위와 열 수가 늘어나면 자동 확장"""
+
+    def __init__(self):
+        self.origin = 0
+        self.counts = np.zeros((0, 0), dtype=np.int64)
+
+    def add(self, rows, cols, weights=None):
+        """(키, 열) 쌍마다 1씩 (weights를 주면 그 값만큼) 더함"""
+        if len(rows) == 0:
+            return
+        lo, hi = int(rows.min()), int(rows.max())
+        n_cols = max(self.counts.shape[1], int(cols.max()) + 1)
+        self._grow(lo, hi, n_cols)
+
+        n_rows = hi - lo + 1
+        flat = (rows - lo) * n_cols + cols
+        block = np.bincount(flat, weights, minlength=n_rows * n_cols).reshape(n_rows, n_cols)
+        if weights is not None:
+            block = block.astype(np.int64)
+        start = lo - self.origin
+        self.counts[start:start + n_rows] += block
+
+    def _grow(self, lo, hi, n_cols):
+        if self.counts.shape[0] == 0:
+            self.origin = lo
+            self.counts = np.zeros((hi - lo + 1, n_cols), dtype=np.int64)
+            return
+        before = max(0, self.origin - lo)
+        after = max(0, hi - (self.origin + self.counts.shape[0] - 1))
+        right = n_cols - self.counts.shape[1]
+        if before or after or right:
+            self.counts = np.pad(self.counts, ((before, after), (0, right)))
+            self.origin -= before
+
+    def aligned(self, lo, hi, n_cols=None):
+        """키 lo..hi 구간의 카운트 행렬 (없는 키·열은 0)"""
+        n_cols = self.counts.shape[1] if n_cols is None else n_cols
+        out = np.zeros((hi - lo + 1, n_cols), dtype=np.int64)
+        if self.counts.shape[0] == 0:
+            return out
+        src_lo = max(lo, self.origin)
+        src_hi = min(hi, self.origin + self.counts.shape[0] - 1)
+        if src_lo <= src_hi:
+            width = min(n_cols, self.counts.shape[1])
+            out[src_lo - lo:src_hi - lo + 1, :width] = self.counts[
+                src_lo - self.origin:src_hi - self.origin + 1, :width
+            ]
+        return out
+
+
+def _month_index(days):
+    """datetime64[D] → 1970-01 기준 월 번호"""
+    return days.astype("datetime64[M]").astype(np.int64)
+
+
+def _day_of_month(days):
+    return (days - days.astype("datetime64[M]")).astype(np.int64)
+
+
+def _month_label(months):
+    return np.asarray(months).astype("datetime64[M]").astype(str)
+
+
+def _to_day(value):
+    return np.datetime64(pd.Timestamp(value).date(), "D")
+
+
+# =========================================
+# 2. 청크 단위 집계기
+# =========================================
+class RecordAggregator:
+    """직원 레코드 청크를 받아 월×부서 입·퇴사, 입사연도×근속개월 퇴사 수를 누적
+
+    as_of(기준일)를 주면 그 이후 입사는 제외하고, 그 이후 퇴사는 재직으로 봅니다.
+    주지 않으면 데이터에 나타난 가장 늦은 날짜를 기준일로 씁니다.
+    """
+
+    def __init__(self, as_of=None):
+        self.as_of = None if as_of is None else _to_day(as_of)
+        self.depts = []
+        self._dept_codes = {}
+
+        self.hires = _CountGrid()          # 월 × 부서 입사자 수
+        self.terms = _CountGrid()          # 월 × 부서 퇴사자 수
+        self.cohort_size = _CountGrid()    # 입사연도 × 1 입사자 수
+        self.cohort_terms = _CountGrid()   # 입사연도 × 근속개월 퇴사자 수
+
+        self.n_active = 0
+        self.active_hire_days = 0          # 재직자 입사일(일 번호) 합계
+        self.n_left = 0
+        self.left_tenure_days = 0          # 퇴사자 근속일수 합계
+        self.max_day = None
+
+    def _dept_index(self, values):
+        codes, uniques = pd.factorize(values.fillna(UNKNOWN_DEPT).astype(str))
+        lookup = np.empty(len(uniques), dtype=np.int64)
+        for i, name in enumerate(uniques):
+            if name not in self._dept_codes:
+                self._dept_codes[name] = len(self.depts)
+                self.depts.append(name)
+            lookup[i] = self._dept_codes[name]
+        return lookup[codes]
+
+    def add(self, chunk):
+        """직원 레코드 DataFrame 청크 하나를 누적"""
+        missing = [c for c in (DEPT_COL, HIRE_COL, TERM_COL) if c not in chunk.columns]
+        if missing:
+            raise ValueError(f"직원 레코드에 필요한 컬럼이 없습니다: {missing}")
+
+        hire = pd.to_datetime(chunk[HIRE_COL], errors="coerce").to_numpy().astype("datetime64[D]")
+        term = pd.to_datetime(chunk[TERM_COL], errors="coerce").to_numpy().astype("datetime64[D]")
+
+        keep = ~np.isnat(hire)
+        if self.as_of is not None:
+            keep &= hire <= self.as_of
+            term = np.where(term > self.as_of, np.datetime64("NaT"), term)
+        hire, term = hire[keep], term[keep]
+        dept = self._dept_index(chunk[DEPT_COL][keep])
+
+        left = ~np.isnat(term)
+        bad = left & (term < hire)
+        if bad.any():
+            raise ValueError(f"퇴사일이 입사일보다 빠른 레코드가 {int(bad.sum())}건 있습니다.")
+        if len(hire) == 0:
+            return
+
+        hire_m = _month_index(hire)
+        term_m = _month_index(term[left])
+
+        # 1) 월 × 부서 입·퇴사 수
+        self.hires.add(hire_m, dept)
+        self.terms.add(term_m, dept[left])
+
+        # 2) 입사연도 × 근속개월 (만 개월 수) 퇴사 수
+        cohort = hire_m // 12
+        tenure_m = (term_m - hire_m[left]) - (_day_of_month(term[left]) < _day_of_month(hire[left]))
+        self.cohort_size.add(cohort, np.zeros(len(cohort), dtype=np.int64))
+        self.cohort_terms.add(cohort[left], tenure_m)
+
+        # 3) 평균 근속 계산용 합계 (재직자는 기준일이 정해진 뒤 계산)
+        hire_days = hire.astype(np.int64)
+        term_days = term[left].astype(np.int64)
+        self.n_active += int((~left).sum())
+        self.active_hire_days += int(hire_days[~left].sum())
+        self.n_left += int(left.sum())
+        self.left_tenure_days += int((term_days - hire_days[left]).sum())
+
+        chunk_max = max(hire_days.max(), term_days.max()) if len(term_days) else hire_days.max()
+        self.max_day = chunk_max if self.max_day is None else max(self.max_day, chunk_max)
+
+    def add_counts(self, month_dept, cohorts, totals):
+        """외부 엔진(DuckDB 등)에서 GROUP BY로 미리 집계한 카운트를 누적
+
+        month_dept: DataFrame[부서, 월번호, 입사자, 퇴사자] (월번호는 1970-01 기준)
+        cohorts: DataFrame[입사연도번호, 근속개월, 인원] (근속개월이 음수면 재직자, 1970년 기준)
+        totals: {n_active, active_hire_days, n_left, left_tenure_days, max_day}
+        """
+        if len(month_dept):
+            dept = self._dept_index(month_dept[DEPT_COL])
+            months = month_dept["월번호"].to_numpy(dtype=np.int64)
+            self.hires.add(months, dept, month_dept["입사자"].to_numpy(dtype=float))
+            self.terms.add(months, dept, month_dept["퇴사자"].to_numpy(dtype=float))
+        if len(cohorts):
+            cohort = cohorts["입사연도번호"].to_numpy(dtype=np.int64)
+            tenure = cohorts["근속개월"].to_numpy(dtype=np.int64)
+            size = cohorts["인원"].to_numpy(dtype=float)
+            left = tenure >= 0
+            self.cohort_size.add(cohort, np.zeros(len(cohort), dtype=np.int64), size)
+            self.cohort_terms.add(cohort[left], tenure[left], size[left])
+
+        self.n_active += int(totals["n_active"])
+        self.active_hire_days += int(totals["active_hire_days"])
+        self.n_left += int(totals["n_left"])
+        self.left_tenure_days += int(totals["left_tenure_days"])
+        if totals["max_day"] is not None:
+            max_day = int(totals["max_day"])
+            self.max_day = max_day if self.max_day is None else max(self.max_day, max_day)
+
+    # -------------------------------------
+    # 집계 결과 → 대시보드 시트
+    # -------------------------------------
+    def _as_of_day(self):
+        if self.as_of is not None:
+            return int(self.as_of.astype(np.int64))
+        if self.max_day is None:
+            raise ValueError("집계할 직원 레코드가 없습니다.")
+        return int(self.max_day)
+
+    def _dept_order(self):
+        """부서 컬럼 순서 (이름순) — 레코드·청크 순서나 집계 엔진과 무관하게 같은 시트가 나오도록"""
+        order = np.argsort(np.asarray(self.depts, dtype=str), kind="stable")
+        return order, [self.depts[i] for i in order]
+
+    def _month_range(self):
+        last = int(_month_index(np.array([self._as_of_day()], dtype="datetime64[D]"))[0])
+        return self.hires.origin, last
+
+    def headcount_frame(self, start=None):
+        """인원변동 시트: 월, 입사자, 퇴사자, 총원(월말 재직자 수) — start(YYYY-MM) 이후만"""
+        lo, hi = self._month_range()
+        hires = self.hires.aligned(lo, hi, len(self.depts)).sum(axis=1)
+        terms = self.terms.aligned(lo, hi, len(self.depts)).sum(axis=1)
+        df = pd.DataFrame(
+            {
+                "월": _month_label(np.arange(lo, hi + 1)),
+                "입사자": hires,
+                "퇴사자": terms,
+                "총원": np.cumsum(hires - terms),
+            }
+        )
+        if start is not None:
+            df = df[df["월"] >= str(start)].reset_index(drop=True)
+        return df
+
+    def unit_headcount_frame(self, start=None):
+        """조직별인원변동 시트: 부서, 월, 입사자, 퇴사자, 총원 (부서 × 월 long 형식)"""
+        lo, hi = self._month_range()
+        order, depts = self._dept_order()
+        hires = self.hires.aligned(lo, hi, len(self.depts))[:, order]
+        terms = self.terms.aligned(lo, hi, len(self.depts))[:, order]
+        totals = np.cumsum(hires - terms, axis=0)
+        months = np.arange(lo, hi + 1)
+        if start is not None:
+            keep = _month_label(months) >= str(start)
+            months, hires, terms, totals = months[keep], hires[keep], terms[keep], totals[keep]
+        n_months, n_depts = hires.shape
+        # 부서별로 월이 이어지도록 (부서, 월) 순서로 펼침
+        return pd.DataFrame(
+            {
+                DEPT_COL: np.repeat(np.asarray(depts, dtype=object), n_months),
+                "월": np.tile(_month_label(months), n_depts),
+                "입사자": hires.T.ravel(),
+                "퇴사자": terms.T.ravel(),
+                "총원": totals.T.ravel(),
+            }
+        )
+
+    def turnover_frame(self):
+        """퇴사율 시트: 연도 + 부서별 퇴사자 수 컬럼"""
+        lo, hi = self._month_range()
+        lo -= lo % 12                      # 연초부터 연말까지 12개월 단위로 맞춤
+        hi += 11 - hi % 12
+        order, depts = self._dept_order()
+        terms = self.terms.aligned(lo, hi, len(self.depts))[:, order]
+        by_year = terms.reshape(-1, 12, len(self.depts)).sum(axis=1)
+        df = pd.DataFrame(by_year, columns=depts)
+        df.insert(0, "연도", 1970 + np.arange(lo // 12, hi // 12 + 1))
+        return df
+
+    def retention_frame(self, step=RETENTION_STEP):
+        """잔존율 시트: 입사연도, 경과개월, 잔존율(%)
+
+        경과개월 k의 잔존율 = k개월을 채우기 전에 퇴사하지 않은 입사자 비율이며,
+        입사연도 1월부터 기준일까지 경과한 개월 수를 step 단위로 올림한 시점까지 표시합니다.
+        """
+        if self.cohort_size.counts.shape[0] == 0:
+            return pd.DataFrame(columns=["입사연도", "경과개월", "잔존율"])
+        lo = self.cohort_size.origin
+        hi = lo + self.cohort_size.counts.shape[0] - 1
+        size = self.cohort_size.aligned(lo, hi, 1)[:, 0]
+        left_hist = self.cohort_terms.aligned(lo, hi)
+        # left_before[c, k] = 근속 k개월 미만에 퇴사한 인원
+        left_before = np.hstack(
+            [np.zeros((len(size), 1), dtype=np.int64), np.cumsum(left_hist, axis=1)]
+        )
+
+        cohorts = np.arange(lo, hi + 1)
+        as_of_month = self._month_range()[1]
+        elapsed = np.maximum(as_of_month - cohorts * 12, 0)
+        n_points = -(-elapsed // step) + 1
+        n_points[size == 0] = 0
+
+        cohort_idx = np.repeat(np.arange(len(cohorts)), n_points)
+        offsets = (np.arange(n_points.sum()) - np.repeat(np.cumsum(n_points) - n_points, n_points)) * step
+        left = left_before[cohort_idx, np.minimum(offsets, left_before.shape[1] - 1)]
+        rate = (size[cohort_idx] - left) / size[cohort_idx] * 100
+        return pd.DataFrame(
+            {
+                "입사연도": 1970 + cohorts[cohort_idx],
+                "경과개월": offsets,
+                "잔존율": np.round(rate, 1),
+            }
+        )
+
+    def tenure_frame(self):
+        """근속 시트: 재직자/퇴사자 평균 근속년수"""
+        as_of = self._as_of_day()
+        active_days = self.n_active * as_of - self.active_hire_days
+        return pd.DataFrame(
+            {
+                "구분": ["재직자 평균 근속", "퇴사자 평균 근속"],
+                "근속년수": [
+                    round(active_days / self.n_active / DAYS_PER_YEAR, 2) if self.n_active else np.nan,
+                    round(self.left_tenure_days / self.n_left / DAYS_PER_YEAR, 2) if self.n_left else np.nan,
+                ],
+            }
+        )
+
+    def frames(self, start=None):
+        """{시트명: DataFrame} — company_hr_data.xlsx와 같은 시트 구성"""
+        return {
+            "인원변동": self.headcount_frame(start=start),
+            "퇴사율": self.turnover_frame(),
+            "잔존율": self.retention_frame(),
+            "근속": self.tenure_frame(),
+            UNIT_SHEET: self.unit_headcount_frame(start=start),
+        }
+
+
+# =========================================
+# 3. 파일 읽기 / 워크북 쓰기
+# =========================================
+def read_records(path, chunksize=CHUNKSIZE):
+    """CSV/Parquet 직원 레코드를 DataFrame 청크로 순회"""
+    columns = [DEPT_COL, HIRE_COL, TERM_COL]
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".parquet":
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path)
+        for batch in parquet.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    elif ext in (".csv", ".txt"):
+        yield from pd.read_csv(path, usecols=columns, dtype={DEPT_COL: str}, chunksize=chunksize)
+    else:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {path} (CSV 또는 Parquet)")
+
+
+def aggregate_records(source, as_of=None, start=None, chunksize=CHUNKSIZE):
+    """직원 레코드(파일 경로 또는 DataFrame 청크들) → {시트명: DataFrame}
+
+    파일은 chunksize 행씩 읽어 누적하므로 메모리는 파일 크기와 무관합니다.
+    수 GB 파일을 SQL 엔진으로 집계하려면 hr_core.duckdb_ingest.aggregate_file을 씁니다.
+    """
+    chunks = read_records(source, chunksize) if isinstance(source, (str, os.PathLike)) else source
+    aggregator = RecordAggregator(as_of=as_of)
+    for chunk in chunks:
+        aggregator.add(chunk)
+    return aggregator.frames(start=start)
+
+
+def write_workbook(frames, path):
+    """집계 시트를 대시보드가 읽는 엑셀 워크북으로 저장
+
+    조직별인원변동처럼 선택 시트는 frames에 있을 때만, 엑셀 행 수 한도 안일 때만 씁니다.
+    """
+    extra = [s for s in frames if s not in SHEETS and len(frames[s]) <= EXCEL_MAX_ROWS]
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        for sheet in (*SHEETS, *extra):
+            frames[sheet].to_excel(writer, sheet_name=sheet, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="직원 레코드로 HR 대시보드 워크북 생성")
+    parser.add_argument("records", help="직원 레코드 CSV/Parquet (사번, 부서, 입사일, 퇴사일)")
+    parser.add_argument("-o", "--output", default="company_hr_data.xlsx", help="저장할 워크북 경로")
+    parser.add_argument("--as-of", help="기준일 (기본: 데이터의 가장 늦은 날짜)")
+    parser.add_argument("--start", help="인원변동 시트 시작 월 (YYYY-MM)")
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE)
+    parser.add_argument(
+        "--engine", choices=["chunked", "duckdb"], default="chunked",
+        help="집계 방식: pandas 청크 누적(기본) 또는 DuckDB SQL (duckdb 패키지 필요)",
+    )
+    parser.add_argument("--memory-limit", help="DuckDB 메모리 한도 (예: 2GB)")
+    args = parser.parse_args(argv)
+
+    if args.engine == "duckdb":
+        from hr_core.duckdb_ingest import aggregate_file
+
+        frames = aggregate_file(
+            args.records, as_of=args.as_of, start=args.start, memory_limit=args.memory_limit
+        )
+    else:
+        frames = aggregate_records(
+            args.records, as_of=args.as_of, start=args.start, chunksize=args.chunksize
+        )
+    write_workbook(frames, args.output)
+    print(f"{args.output} 저장 완료 (인원변동 {len(frames['인원변동'])}개월, 부서 {frames['퇴사율'].shape[1] - 1}개)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""메모리 예산 안에서 동작하는 내용 해시 기반 LRU 캐시 (업로드 워크북 스냅샷·위젯 결과용)
+
+st.cache_data는 크기 제한 없이 결과를 서버 메모리에 계속 붙잡아 두므로,
+업로드된 워크북의 파싱 결과와 분석 결과는 이 캐시에 워크북 내용 sha256을 키로 보관하고,
+위젯 값에 따라 달라지는 표·차트 데이터도 (함수, 버전, 위젯 값) 키로 같은 예산 안에 둡니다.
+항목마다 DataFrame 등의 실제 메모리 크기를 계산해 두고, 합계가 예산을 넘으면
+가장 오래 쓰지 않은 항목부터 내보냅니다. 같은 파일은 누가 올려도 한 항목을 공유합니다.
+
+예산은 환경변수 HR_UPLOAD_CACHE_MB(기본 512MB)로 정합니다.
+"""
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+
+import numpy as np
+import pandas as pd
+
+BUDGET_ENV_VAR = "HR_UPLOAD_CACHE_MB"
+DEFAULT_BUDGET_MB = 512
+_MISSING = object()   # 캐시에 없음 (None도 캐시할 수 있는 값이라 따로 구분)
+
+
+def budget_from_settings():
+    """환경변수로 지정한 메모리 예산(바이트) — 값이 잘못되면 기본값"""
+    try:
+        mb = float(os.environ.get(BUDGET_ENV_VAR, DEFAULT_BUDGET_MB))
+    except ValueError:
+        mb = DEFAULT_BUDGET_MB
+    return int(max(mb, 0) * 1024 * 1024)
+
+
+def deep_sizeof(obj, _seen=None):
+    """DataFrame·배열·dict·dataclass 등을 따라 들어가며 합산한 대략적인 메모리 크기(바이트)"""
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(deep_sizeof(v, seen) for v in obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return sys.getsizeof(obj) + sum(deep_sizeof(getattr(obj, f.name), seen) for f in fields(obj))
+    return sys.getsizeof(obj)
+
+
+class LRUCache:
+    """{키: 값} — 값 크기 합계가 budget_bytes를 넘지 않도록 가장 오래 안 쓴 항목부터 제거
+
+    여러 세션(스레드)이 동시에 쓰며, 같은 키를 동시에 요청하면 한 번만 만듭니다.
+    예산보다 큰 값은 만들어서 반환하되 캐시에는 넣지 않습니다.
+    """
+
+    def __init__(self, budget_bytes, sizeof=deep_sizeof):
+        self.budget_bytes = budget_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()   # 키 → (값, 크기), 마지막이 가장 최근 사용
+        self._total = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}            # 키별 생성 잠금 (같은 키 중복 빌드 방지)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self):
+        return self._total
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size=None):
+        size = self.sizeof(value) if size is None else size
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total -= old[1]
+            if size > self.budget_bytes:
+                return value
+            self._entries[key] = (value, size)
+            self._total += size
+            while self._total > self.budget_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._total -= evicted
+                self.evictions += 1
+        return value
+
+    def get_or_build(self, key, build):
+        """캐시에 있으면 반환, 없으면 build()로 만들어 넣고 반환 (실패하면 아무것도 넣지 않음)
+
+        같은 키를 기다리던 요청들은 먼저 끝난 빌드 결과를 받습니다. 결과가 예산보다 커서
+        캐시에 들어가지 않았거나 곧바로 밀려난 경우에도 다시 만들지 않습니다.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            # 키별 [잠금, 대기 중인 요청 수, 마지막 빌드 결과] — 대기 요청이 모두 끝날 때까지 유지
+            entry = self._key_locks.setdefault(key, [threading.Lock(), 0, _MISSING])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                # 다른 요청이 먼저 만들어 둔 경우
+                if entry[2] is not _MISSING:
+                    return entry[2]
+                value = self.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+                with self._lock:
+                    self.misses += 1
+                entry[2] = self.put(key, build())
+                return entry[2]
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    self._key_locks.pop(key, None)
+
+    def stats(self):
+        """화면·로그용 현재 상태"""
+        with self._lock:
+            return {
+                "항목 수": len(self._entries),
+                "사용량(MB)": round(self._total / 1024 / 1024, 1),
+                "예산(MB)": round(self.budget_bytes / 1024 / 1024, 1),
+                "적중": self.hits,
+                "생성": self.misses,
+                "제거": self.evictions,
+            }
@@ -0,0 +1,149 @@
+"""대시보드 실행 단계별 소요 시간 계측 (옵트인)
+
+쿼리 파라미터 `?profile=1` 또는 환경변수 HR_PROFILE=1일 때만 켜지며,
+단계마다 소요 시간, 캐시 적중 여부, 처리 행 수를 기록합니다.
+워크북 파싱·정규화·분석은 요청 밖에서 스냅샷을 만들 때 일어나므로, 화면에 쓰인 스냅샷의
+빌드 단계별 시간(Snapshot.stages)도 함께 표시합니다.
+HR_PROFILE_LOG=<경로>를 주면 실행마다 기록을 JSONL로 덧붙여 저장하며,
+스냅샷 빌드 기록은 버전마다 한 번만 남깁니다 ("kind": "build").
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+ENV_VAR = "HR_PROFILE"
+LOG_ENV_VAR = "HR_PROFILE_LOG"
+_TRUTHY = ("1", "true", "yes", "on")
+
+_local = threading.local()
+
+# 이 프로세스에서 빌드 기록을 이미 로그에 남긴 (로그 경로, 스냅샷 버전)
+_logged_builds = set()
+_logged_lock = threading.Lock()
+
+
+def mark_miss():
+    """캐시 함수 본문에서 호출 — 현재 진행 중인 캐시 단계를 miss로 표시 (계측이 꺼져 있으면 무시)"""
+    for record in reversed(getattr(_local, "stack", ())):
+        if record["cache"] != "-":
+            record["cache"] = "miss"
+            return
+
+
+class StageProfiler:
+    """단계별 (단계, 소요 시간, 캐시, 행 수) 기록기"""
+
+    def __init__(self, enabled=False, log_path=None):
+        self.enabled = enabled
+        self.log_path = log_path
+        self.records = []
+        self.run_id = uuid.uuid4().hex[:8]
+        self.build = None   # 이번 실행에 쓰인 스냅샷의 빌드 기록
+
+    @classmethod
+    def from_settings(cls, query_value=None):
+        """쿼리 파라미터 값과 환경변수로 계측 여부·로그 경로 결정"""
+        enabled = str(query_value or os.environ.get(ENV_VAR, "")).lower() in _TRUTHY
+        return cls(enabled=enabled, log_path=os.environ.get(LOG_ENV_VAR) or None)
+
+    def record_build(self, version, stages, build_seconds, built_at=""):
+        """이번 실행에 쓰인 스냅샷의 빌드 단계별 시간(초) 등록 — stage(built=...)가 참조"""
+        self.build = {
+            "version": version,
+            "built_at": built_at,
+            "build_seconds": build_seconds,
+            "stages": dict(stages),
+        }
+
+    @contextmanager
+    def stage(self, name, cached=False, built=None):
+        """with 블록 하나를 단계로 계측 — 블록 안에서 record["rows"]에 처리 행 수를 넣을 수 있음
+
+        built에 스냅샷 빌드 단계 이름을 주면 결과를 스냅샷에서 꺼낸 단계로 보고,
+        그 결과를 만드는 데 든 빌드 시간을 build_seconds로 함께 기록합니다.
+        """
+        record = {"stage": name, "seconds": 0.0, "cache": "hit" if cached else "-", "rows": None}
+        if built is not None:
+            record["cache"] = "snapshot"
+            stages = self.build["stages"] if self.build else {}
+            record["build_seconds"] = stages.get(built)
+        if not self.enabled:
+            yield record
+            return
+
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        record["depth"] = len(stack)   # 다른 단계 안에서 시작한 단계는 1 이상
+        self.records.append(record)
+        stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            stack.pop()
+
+    def table(self):
+        """사이드바 표시용 기록 (ms 단위)"""
+        return [
+            {
+                "단계": "  " * r["depth"] + r["stage"],
+                "소요(ms)": round(r["seconds"] * 1000, 1),
+                "캐시": r["cache"],
+                "빌드(ms)": _ms(r.get("build_seconds")),
+                "행 수": r["rows"],
+            }
+            for r in self.records
+        ]
+
+    def build_table(self):
+        """스냅샷 빌드 단계별 시간 (ms 단위, 빌드 순서)"""
+        if self.build is None:
+            return []
+        return [
+            {"단계": stage, "소요(ms)": _ms(seconds)} for stage, seconds in self.build["stages"].items()
+        ]
+
+    def total_seconds(self):
+        # 중첩된 단계 시간은 바깥 단계에 이미 포함되므로 최상위 단계만 합산
+        return sum(r["seconds"] for r in self.records if r["depth"] == 0)
+
+    def _new_build_lines(self):
+        """아직 로그에 남기지 않은 스냅샷 빌드 기록 (버전마다 한 번)"""
+        if self.build is None:
+            return []
+        key = (self.log_path, self.build["version"])
+        with _logged_lock:
+            if key in _logged_builds:
+                return []
+            _logged_builds.add(key)
+        info = {
+            "kind": "build",
+            "version": self.build["version"],
+            "built_at": self.build["built_at"],
+        }
+        lines = [{**info, "stage": stage, "seconds": seconds} for stage, seconds in self.build["stages"].items()]
+        lines.append({**info, "stage": "total", "seconds": self.build["build_seconds"]})
+        return lines
+
+    def write_log(self, **extra):
+        """기록을 JSONL로 덧붙여 저장 (로그 경로가 없으면 무시)"""
+        if not (self.enabled and self.log_path and self.records):
+            return
+        timestamp = datetime.now().isoformat(timespec="milliseconds")
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            for build in self._new_build_lines():
+                line = {"run": self.run_id, "time": timestamp, **build}
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+            for record in self.records:
+                line = {"run": self.run_id, "time": timestamp, **extra, **record}
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 1)
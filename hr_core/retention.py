@@ -0,0 +1,65 @@
+"""입사연도별(코호트) 잔존율 급락 구간 탐지
+
+전체 코호트를 (입사연도, 경과개월) 순으로 한 번 정렬한 뒤,
+인접 행 차분으로 모든 코호트의 구간 변화량을 한 번에 계산합니다.
+"""
+import numpy as np
+import pandas as pd
+
+DROP_THRESHOLD = -10.0  # 연속 구간 변화량이 이 값(%p) 이하이면 급락으로 봄
+
+
+def cohort_changes(df_retention):
+    """(입사연도, 경과개월, 잔존율, 변화량) 배열 — 코호트 내 직전 시점 대비 변화량, 첫 시점은 NaN"""
+    df = df_retention.dropna(subset=["입사연도"]).sort_values(
+        ["입사연도", "경과개월"], kind="stable"
+    )
+    cohort = df["입사연도"].to_numpy()
+    month = df["경과개월"].to_numpy()
+    rate = df["잔존율"].to_numpy(dtype=float)
+
+    change = np.full(len(rate), np.nan)
+    if len(rate) > 1:
+        same_cohort = cohort[1:] == cohort[:-1]
+        change[1:] = np.where(same_cohort, rate[1:] - rate[:-1], np.nan)
+    return cohort, month, rate, change
+
+
+def cohort_drops(df_retention, threshold=DROP_THRESHOLD):
+    """(급락 구간 DataFrame, 코호트별 최대 낙폭 DataFrame)
+
+    급락 구간: 변화량이 threshold 이하인 (입사연도, 경과개월, 변화량), 변화량 오름차순
+    최대 낙폭: 코호트마다 가장 크게 떨어진 구간의 (입사연도, 최대낙폭, 최대낙폭개월),
+    떨어진 구간이 없는 코호트는 NaN
+    """
+    cohort, month, _, change = cohort_changes(df_retention)
+
+    is_drop = change <= threshold
+    drops_df = pd.DataFrame(
+        {
+            "입사연도": cohort[is_drop],
+            "경과개월": month[is_drop].astype(int),
+            "변화량": change[is_drop],
+        }
+    ).sort_values("변화량", kind="stable")
+
+    # 코호트별 최소 변화량: (코호트, 변화량) 정렬 후 각 코호트의 첫 행 (NaN은 맨 뒤)
+    order = np.lexsort((np.where(np.isnan(change), np.inf, change), cohort))
+    sorted_cohort = cohort[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = sorted_cohort[1:] != sorted_cohort[:-1]
+    worst_idx = order[first]
+
+    # 떨어진 구간이 없는 코호트(변화량이 모두 0 이상이거나 시점이 1개)는 NaN
+    worst_change = change[worst_idx]
+    no_drop = ~(worst_change < 0)
+    worst_month = pd.array(month[worst_idx], dtype="Int64")
+    worst_month[no_drop] = pd.NA
+    worst_df = pd.DataFrame(
+        {
+            "입사연도": cohort[worst_idx],
+            "최대낙폭": np.where(no_drop, np.nan, worst_change),
+            "최대낙폭개월": worst_month,
+        }
+    )
+    return drops_df.reset_index(drop=True), worst_df
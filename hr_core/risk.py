@@ -0,0 +1,102 @@
+"""부서별 퇴사 리스크 스코어 엔진 (전년 대비 + 절대 규모 혼합 스코어)
+
+연도×부서 퇴사자수 행렬 전체에 대해, 연속된 모든 연도 쌍의 스코어와 등급을
+배열 연산으로 한 번에 계산합니다.
+"""
+import numpy as np
+import pandas as pd
+
+# 최종 리스크 스코어 기준
+HIGH_SCORE = 1.2      # 이 이상인 부서 중 상위 HIGH_MAX_COUNT개가 High
+HIGH_MAX_COUNT = 2
+MEDIUM_SCORE = 1.0    # High가 아닌 부서 중 이 이상이면 Medium
+GRADES = ("High", "Medium", "Low")   # 위험도 높은 순
+
+RISK_COLUMNS = [
+    "연도",
+    "직전연도",
+    "부서",
+    "퇴사자수",
+    "직전퇴사자수",
+    "전년대비스코어",
+    "절대규모스코어",
+    "최종리스크스코어",
+    "리스크등급",
+]
+
+
+def turnover_matrix(df_turnover):
+    """(연도 배열, 부서 목록, 연도×부서 퇴사자수 행렬) — 연도 오름차순, 같은 연도 행은 합산"""
+    dept_cols = [c for c in df_turnover.columns if c != "연도"]
+    grouped = df_turnover.groupby("연도", sort=True)[dept_cols].sum()
+    return grouped.index.to_numpy(), dept_cols, grouped.to_numpy()
+
+
+def risk_scores(this_year, prev_year):
+    """(전년대비, 절대규모, 최종) 스코어 행렬 — 각 행이 하나의 연도 쌍"""
+    this_year = np.asarray(this_year, dtype=float)
+    prev_year = np.asarray(prev_year, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 1) 전년 대비 스코어 (직전 연도 0명이면 계산 불가)
+        yoy = np.where(prev_year == 0, np.nan, this_year / prev_year)
+
+        # 2) 절대 규모 스코어 (해당 연도 전체 부서 평균 대비)
+        avg = this_year.mean(axis=1, keepdims=True)
+        abs_score = np.where((avg == 0) | np.isnan(avg), np.nan, this_year / avg)
+
+    # 3) 최종 스코어: 둘 다 있으면 50:50, 하나만 있으면 그 값, 둘 다 없으면 NaN
+    final = np.where(
+        np.isnan(yoy),
+        abs_score,
+        np.where(np.isnan(abs_score), yoy, 0.5 * yoy + 0.5 * abs_score),
+    )
+    return yoy, abs_score, final
+
+
+def risk_grades(final):
+    """최종 스코어 행렬 → High/Medium/Low 등급 행렬 (행 단위로 등급 산정)"""
+    final = np.asarray(final, dtype=float)
+
+    # 행마다 스코어 내림차순 순위 (NaN은 맨 뒤, 동점은 부서 순서 유지)
+    order = np.argsort(-final, axis=1, kind="stable")
+    rank = np.argsort(order, axis=1, kind="stable")
+
+    high = (final >= HIGH_SCORE) & (rank < HIGH_MAX_COUNT)
+    medium = ~high & (final >= MEDIUM_SCORE)
+    return np.where(high, "High", np.where(medium, "Medium", "Low"))
+
+
+def department_risk(df_turnover, latest_only=False):
+    """연속된 모든 연도 쌍 × 부서의 리스크 스코어/등급 (long format)
+
+    latest_only=True면 최신 연도와 직전 연도 쌍만 계산합니다.
+    연도가 2개 미만이거나 부서 컬럼이 없으면 빈 DataFrame을 반환합니다.
+    """
+    years, dept_cols, counts = turnover_matrix(df_turnover)
+    if len(years) < 2 or not dept_cols:
+        return pd.DataFrame(columns=RISK_COLUMNS)
+
+    if latest_only:
+        years, counts = years[-2:], counts[-2:]
+
+    this_year, prev_year = counts[1:], counts[:-1]
+    yoy, abs_score, final = risk_scores(this_year, prev_year)
+    grades = risk_grades(final)
+
+    n_pairs, n_depts = this_year.shape
+    dept_codes = np.tile(np.arange(n_depts), n_pairs)
+    return pd.DataFrame(
+        {
+            "연도": np.repeat(years[1:], n_depts),
+            "직전연도": np.repeat(years[:-1], n_depts),
+            "부서": pd.Categorical.from_codes(dept_codes, categories=pd.Index(dept_cols)),
+            "퇴사자수": this_year.ravel(),
+            "직전퇴사자수": prev_year.ravel(),
+            "전년대비스코어": yoy.ravel(),
+            "절대규모스코어": abs_score.ravel(),
+            "최종리스크스코어": final.ravel(),
+            "리스크등급": grades.ravel(),
+        },
+        columns=RISK_COLUMNS,
+    )
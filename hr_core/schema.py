@@ -0,0 +1,160 @@
+"""시트별 스키마 검증·정규화 (로딩 직후 한 번만 적용)
+
+- 인원변동: 월 → Period[M], 입사자·퇴사자·총원 → int32
+- 퇴사율: 연도 → int16, 부서별 퇴사자수 → int32 (빈 칸이 있는 부서는 float64 유지)
+- 잔존율: 입사연도·경과개월 → int16, 잔존율 → float64
+- 조직별인원변동(선택): 인원변동과 같고, 조직 단위 컬럼(부서·사업장 등) → category
+
+형식이 맞지 않으면 분석 도중이 아니라 여기서 바로 SchemaError를 냅니다.
+정규화된 DataFrame은 분석 함수들이 복사 없이 읽기만 합니다.
+"""
+import numpy as np
+import pandas as pd
+
+YEAR_DTYPE = "int16"
+COUNT_DTYPE = "int32"
+
+
+class SchemaError(ValueError):
+    """시트 형식이 분석에 필요한 스키마와 다를 때"""
+
+
+def _fail(sheet, column, series, positions, reason):
+    # 엑셀 기준 행 번호 (헤더가 1행이므로 읽어 온 행 번호 + 2)
+    rows = [r + 2 if isinstance(r, (int, np.integer)) else r for r in series.index[positions]]
+    shown = ", ".join(str(r) for r in rows[:5])
+    more = f" 외 {len(rows) - 5}개" if len(rows) > 5 else ""
+    raise SchemaError(f"'{sheet}' 시트 '{column}' 컬럼의 {shown}행{more}: {reason}")
+
+
+def _require(sheet, df, columns):
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise SchemaError(f"'{sheet}' 시트에 필요한 컬럼이 없습니다: {missing}")
+
+
+def _numeric(sheet, column, series):
+    values = pd.to_numeric(series, errors="coerce")
+    bad = np.flatnonzero(values.isna().to_numpy() & series.notna().to_numpy())
+    if len(bad):
+        _fail(sheet, column, series, bad, "숫자가 아닌 값이 있습니다.")
+    return values
+
+
+def _integer(sheet, column, series, dtype, allow_missing=False):
+    """정수 컬럼으로 변환 — 빈 칸을 허용하면 빈 칸이 있을 때만 float64로 둠"""
+    values = _numeric(sheet, column, series)
+    missing = values.isna().to_numpy()
+    if missing.any():
+        if not allow_missing:
+            _fail(sheet, column, series, np.flatnonzero(missing), "값이 비어 있습니다.")
+        dtype = "float64"
+    present = values.to_numpy(dtype=float)[~missing]
+    fraction = np.flatnonzero(~missing)[present != np.round(present)]
+    if len(fraction):
+        _fail(sheet, column, series, fraction, "정수가 아닌 값이 있습니다.")
+    if dtype != "float64" and len(present):
+        info = np.iinfo(dtype)
+        out_of_range = np.flatnonzero(~missing)[(present < info.min) | (present > info.max)]
+        if len(out_of_range):
+            _fail(sheet, column, series, out_of_range, f"{dtype} 범위를 벗어난 값이 있습니다.")
+    return values.astype(dtype)
+
+
+def to_month_key(series):
+    """월 컬럼 → Period[M] (이미 Period면 그대로 반환)"""
+    if isinstance(series.dtype, pd.PeriodDtype):
+        return series
+    return pd.to_datetime(series).dt.to_period("M")
+
+
+# =========================================
+# 시트별 정규화
+# =========================================
+def normalize_change(df, sheet="인원변동"):
+    _require(sheet, df, ["월", "입사자", "퇴사자", "총원"])
+    try:
+        months = to_month_key(df["월"])
+    except (ValueError, TypeError) as e:
+        raise SchemaError(f"'{sheet}' 시트 '월' 컬럼을 연-월로 읽을 수 없습니다: {e}") from e
+    if months.isna().any():
+        _fail(sheet, "월", months, np.flatnonzero(months.isna().to_numpy()), "값이 비어 있습니다.")
+
+    out = {"월": months}
+    for col in ("입사자", "퇴사자", "총원"):
+        out[col] = _integer(sheet, col, df[col], COUNT_DTYPE)
+    other = [c for c in df.columns if c not in out]
+    return pd.DataFrame({**out, **{c: df[c] for c in other}}, index=df.index)
+
+
+def normalize_unit_change(df, sheet="조직별인원변동"):
+    if df is None:
+        return None  # 워크북에 없는 선택 시트
+    out = normalize_change(df, sheet)
+    units = [c for c in out.columns if c not in ("월", "입사자", "퇴사자", "총원")]
+    if not units:
+        raise SchemaError(f"'{sheet}' 시트에 조직 단위(부서·사업장 등) 컬럼이 없습니다.")
+    unit = out[units[0]]
+    if unit.isna().any():
+        _fail(sheet, units[0], unit, np.flatnonzero(unit.isna().to_numpy()), "값이 비어 있습니다.")
+    out[units[0]] = unit.astype(str).astype("category")
+    return out
+
+
+def normalize_turnover(df, sheet="퇴사율"):
+    _require(sheet, df, ["연도"])
+    years = _integer(sheet, "연도", df["연도"], YEAR_DTYPE)
+    dept_cols = [c for c in df.columns if c != "연도"]
+
+    # 부서가 수천 개일 수 있어, 이미 숫자형인 부서 컬럼은 2차원 배열로 한 번에 검사
+    is_numeric = [pd.api.types.is_numeric_dtype(dtype) for dtype in df[dept_cols].dtypes]
+    numeric = [c for c, ok in zip(dept_cols, is_numeric) if ok]
+    others = [c for c, ok in zip(dept_cols, is_numeric) if not ok]
+    parts = [years.to_frame()]
+    if numeric:
+        values = df[numeric].to_numpy(dtype=float)
+        missing = np.isnan(values)
+        bad = ~missing & ((values != np.round(values)) | (np.abs(values) > np.iinfo(COUNT_DTYPE).max))
+        if bad.any():
+            col = int(np.flatnonzero(bad.any(axis=0))[0])
+            _integer(sheet, numeric[col], df[numeric[col]], COUNT_DTYPE, allow_missing=True)
+        # 해당 연도에 없던 부서는 빈 칸일 수 있어, 빈 칸이 있는 부서만 float64로 둠
+        has_missing = missing.any(axis=0)
+        int_cols = [c for c, m in zip(numeric, has_missing) if not m]
+        float_cols = [c for c, m in zip(numeric, has_missing) if m]
+        parts.append(df[int_cols].astype(COUNT_DTYPE))
+        parts.append(df[float_cols].astype("float64"))
+    for col in others:
+        parts.append(_integer(sheet, col, df[col], COUNT_DTYPE, allow_missing=True).to_frame())
+    return pd.concat(parts, axis=1)[["연도", *dept_cols]]
+
+
+def normalize_retention(df, sheet="잔존율"):
+    _require(sheet, df, ["입사연도", "경과개월", "잔존율"])
+    df = df.dropna(how="all")  # 엑셀 끝의 빈 행
+    out = {
+        "입사연도": _integer(sheet, "입사연도", df["입사연도"], YEAR_DTYPE),
+        "경과개월": _integer(sheet, "경과개월", df["경과개월"], YEAR_DTYPE),
+        "잔존율": _numeric(sheet, "잔존율", df["잔존율"]).astype("float64"),
+    }
+    other = [c for c in df.columns if c not in out]
+    return pd.DataFrame({**out, **{c: df[c] for c in other}}, index=df.index)
+
+
+NORMALIZERS = {
+    "인원변동": normalize_change,
+    "퇴사율": normalize_turnover,
+    "잔존율": normalize_retention,
+    "조직별인원변동": normalize_unit_change,
+}
+
+
+def normalize(sheet, df):
+    """시트 이름에 맞는 정규화 적용 (규칙이 없는 시트는 그대로)"""
+    func = NORMALIZERS.get(sheet)
+    return df if func is None else func(df, sheet)
+
+
+def normalize_sheets(frames):
+    """{시트명: DataFrame} 전체 정규화"""
+    return {sheet: normalize(sheet, df) for sheet, df in frames.items()}
@@ -0,0 +1,177 @@
+"""근속 기간 기반 Kaplan–Meier 생존(잔존) 곡선
+
+직원 단위 근속 데이터(근속 개월 수 + 퇴사 여부, 재직자는 중도절단)로 그룹별 생존 곡선과
+Greenwood 분산 기반 log-log 신뢰구간을 계산합니다. (그룹, 근속개월) 키를 한 번 정렬한 뒤
+누적합으로 위험집합을 구하므로 전체 O(n log n)이며, 수십만 명도 한 번에 처리합니다.
+
+근속 시트가 직원 단위가 아니라 요약(구분, 근속년수) 형태이면 tenure_records는 None을 반환합니다.
+"""
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from hr_core.schema import SchemaError
+
+ALPHA = 0.05                      # 95% 신뢰구간
+ALL_GROUP = "전체"
+GROUP_COLUMNS = ("입사연도", "부서")
+CURVE_COLUMNS = ["그룹", "근속개월", "위험인원", "퇴사인원", "중도절단", "생존율", "하한", "상한"]
+
+
+# =========================================
+# 1. 근속 시트 → 직원 단위 (근속개월, 퇴사) 레코드
+# =========================================
+def _full_months(start, end):
+    """두 날짜 사이의 만 개월 수"""
+    months = (end.dt.year - start.dt.year) * 12 + (end.dt.month - start.dt.month)
+    return months - (end.dt.day < start.dt.day)
+
+
+def tenure_records(df_tenure, as_of=None, sheet="근속"):
+    """직원 단위 근속 레코드 DataFrame[근속개월, 퇴사, (입사연도), (부서)] — 요약 시트면 None
+
+    다음 두 형태 중 하나를 지원합니다.
+    - 입사일(, 퇴사일): 퇴사일이 없거나 기준일 이후면 재직(중도절단). 기준일 기본값은 데이터의 가장 늦은 날짜
+    - 근속개월 또는 근속년수 + 퇴사여부(1/0, True/False)
+    """
+    columns = set(df_tenure.columns)
+    out = {}
+    if "입사일" in columns:
+        try:
+            hire = pd.to_datetime(df_tenure["입사일"])
+            term = (
+                pd.to_datetime(df_tenure["퇴사일"]) if "퇴사일" in columns
+                else pd.Series(pd.NaT, index=df_tenure.index, dtype=hire.dtype)
+            )
+        except (ValueError, TypeError) as e:
+            raise SchemaError(f"'{sheet}' 시트의 입사일/퇴사일을 날짜로 읽을 수 없습니다: {e}") from e
+        if hire.isna().any():
+            raise SchemaError(f"'{sheet}' 시트 '입사일' 컬럼에 비어 있는 값이 있습니다.")
+        bad = np.flatnonzero((term.notna() & (term < hire)).to_numpy())
+        if len(bad):
+            # 엑셀 기준 행 번호 (헤더가 1행)
+            shown = ", ".join(str(r + 2) for r in bad[:5])
+            more = f" 외 {len(bad) - 5}개" if len(bad) > 5 else ""
+            raise SchemaError(f"'{sheet}' 시트 {shown}행{more}: 퇴사일이 입사일보다 빠릅니다.")
+        as_of = pd.Timestamp(as_of) if as_of is not None else pd.Series([hire.max(), term.max()]).max()
+        left = term.notna() & (term <= as_of)
+        end = term.where(left, as_of)
+        keep = (hire <= as_of).to_numpy()  # 기준일 이후 입사자는 제외
+        out["근속개월"] = _full_months(hire, end).to_numpy()[keep]
+        out["퇴사"] = left.to_numpy()[keep]
+        out["입사연도"] = hire.dt.year.to_numpy()[keep]
+    elif "퇴사여부" in columns and ({"근속개월", "근속년수"} & columns):
+        if "근속개월" in columns:
+            months = pd.to_numeric(df_tenure["근속개월"], errors="coerce")
+        else:
+            months = pd.to_numeric(df_tenure["근속년수"], errors="coerce") * 12
+        event = pd.to_numeric(df_tenure["퇴사여부"].replace({True: 1, False: 0}), errors="coerce")
+        if months.isna().any() or event.isna().any() or (months < 0).any():
+            raise SchemaError(f"'{sheet}' 시트의 근속 기간/퇴사여부에 비어 있거나 잘못된 값이 있습니다.")
+        keep = np.ones(len(df_tenure), dtype=bool)
+        out["근속개월"] = np.floor(months.to_numpy(dtype=float))
+        out["퇴사"] = event.to_numpy() != 0
+        if "입사연도" in columns:
+            out["입사연도"] = df_tenure["입사연도"].to_numpy()
+    else:
+        return None
+
+    if "부서" in columns:
+        out["부서"] = df_tenure["부서"].to_numpy()[keep]
+    records = pd.DataFrame(out)
+    records["근속개월"] = records["근속개월"].astype("int32")
+    if "부서" in records:
+        records["부서"] = records["부서"].astype("category")
+    return records
+
+
+# =========================================
+# 2. Kaplan–Meier
+# =========================================
+def _group_cumsum(values, starts):
+    """정렬된 배열에서 그룹(starts 위치부터 시작)마다 따로 누적합"""
+    total = np.cumsum(values)
+    offset = np.repeat(total[starts] - values[starts], np.diff(np.append(starts, len(values))))
+    return total - offset
+
+
+def kaplan_meier(durations, events, groups=None, alpha=ALPHA):
+    """그룹별 Kaplan–Meier 곡선 DataFrame (CURVE_COLUMNS, 그룹·근속개월 오름차순)
+
+    durations: 정수 근속 기간(개월), events: 퇴사 여부(재직자는 False = 중도절단),
+    groups: 그룹 라벨 (None이면 전체 하나). 같은 시점의 퇴사는 중도절단보다 먼저 일어난 것으로 봅니다.
+    """
+    durations = np.asarray(durations, dtype=np.int64)
+    events = np.asarray(events, dtype=bool)
+    if (durations < 0).any():
+        # 음수 기간은 (그룹, 근속개월) 키에서 이웃 그룹으로 섞여 들어가므로 받지 않음
+        raise ValueError("근속 기간은 0 이상이어야 합니다.")
+    if groups is None:
+        codes, labels = np.zeros(len(durations), dtype=np.int64), np.array([ALL_GROUP], dtype=object)
+    else:
+        codes, labels = pd.factorize(pd.Series(groups), sort=True)
+        labels = np.asarray(labels, dtype=object)
+    valid = codes >= 0   # 그룹 값이 비어 있는 직원 제외
+    durations, events, codes = durations[valid], events[valid], codes[valid]
+    if len(durations) == 0:
+        return pd.DataFrame(columns=CURVE_COLUMNS)
+
+    # (그룹, 근속개월) 키 하나로 정렬 — 유일한 키마다 인원·퇴사 수
+    span = int(durations.max()) + 1
+    keys, inverse = np.unique(codes * span + durations, return_inverse=True)
+    n_total = np.bincount(inverse).astype(float)
+    n_event = np.bincount(inverse, weights=events).astype(float)
+    key_group, key_time = keys // span, keys % span
+
+    starts = np.flatnonzero(np.r_[True, key_group[1:] != key_group[:-1]])
+    group_size = np.add.reduceat(n_total, starts)
+    # 위험집합 = 그룹 인원 - 이 시점 이전까지 빠져나간 인원
+    passed = _group_cumsum(n_total, starts) - n_total
+    at_risk = np.repeat(group_size, np.diff(np.append(starts, len(keys)))) - passed
+
+    # 위험집합 전원이 퇴사한 시점(S=0)은 log 항이 -inf라 누적합 차분이 다음 그룹까지 NaN으로 만들므로,
+    # 그 항은 0으로 두고 "0이 된 적 있음"을 따로 누적해 표시
+    wiped = n_event >= at_risk
+    emptied = _group_cumsum(wiped.astype(np.int64), starts) > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_step = np.where(wiped, 0.0, np.log1p(-n_event / at_risk))
+        survival = np.where(emptied, 0.0, np.exp(_group_cumsum(log_step, starts)))
+        # Greenwood: Var(log S) = Σ d / (n (n - d))
+        greenwood = _group_cumsum(
+            np.where(wiped, 0.0, n_event / (at_risk * (at_risk - n_event))), starts
+        )
+        # log-log 변환 신뢰구간: S^exp(±z·se / log S)
+        z = NormalDist().inv_cdf(1 - alpha / 2)
+        spread = z * np.sqrt(greenwood) / np.abs(np.log(survival))
+        lower = survival ** np.exp(spread)
+        upper = survival ** np.exp(-spread)
+    # 아직 퇴사가 없으면(S=1) 구간도 1, 모두 퇴사하면(S=0) 0
+    lower = np.where(survival >= 1, 1.0, np.where(survival <= 0, 0.0, lower))
+    upper = np.where(survival >= 1, 1.0, np.where(survival <= 0, 0.0, upper))
+
+    return pd.DataFrame(
+        {
+            "그룹": labels[key_group],
+            "근속개월": key_time,
+            "위험인원": at_risk.astype(np.int64),
+            "퇴사인원": n_event.astype(np.int64),
+            "중도절단": (n_total - n_event).astype(np.int64),
+            "생존율": survival,
+            "하한": lower,
+            "상한": upper,
+        }
+    )
+
+
+def survival_curves(records, group_by=None, alpha=ALPHA):
+    """tenure_records 결과로 그룹별 곡선 계산 (group_by: None, "입사연도", "부서")"""
+    groups = None if group_by is None else records[group_by]
+    return kaplan_meier(records["근속개월"], records["퇴사"], groups, alpha)
+
+
+def median_tenure(curves):
+    """그룹별 생존율이 처음으로 0.5 이하가 되는 근속개월 (도달하지 않으면 NaN)"""
+    reached = curves[curves["생존율"] <= 0.5]
+    medians = reached.groupby("그룹", sort=False)["근속개월"].first()
+    return medians.reindex(curves["그룹"].unique())
@@ -0,0 +1,127 @@
+"""벤치마크용 합성 HR 데이터 생성기 (company_hr_data.xlsx와 같은 스키마)
+
+같은 seed와 크기를 주면 항상 같은 데이터를 만듭니다.
+"""
+import numpy as np
+import pandas as pd
+
+# 크기 프리셋: 인원변동 개월 수, 퇴사율 연도 수 × 부서 수, 잔존율 코호트 수 × 경과개월 수,
+# 근속 시트 직원 수 (0이면 요약 형태)
+SIZES = {
+    "small": {
+        "months": 24, "years": 5, "depts": 10, "cohorts": 6, "cohort_months": 72,
+        "employees": 2_000,
+    },
+    "medium": {
+        "months": 120, "years": 15, "depts": 1000, "cohorts": 50, "cohort_months": 120,
+        "employees": 50_000,
+    },
+    "large": {
+        "months": 600, "years": 30, "depts": 10000, "cohorts": 200, "cohort_months": 240,
+        "employees": 500_000,
+    },
+}
+
+
+def make_change(months, seed=0):
+    """인원변동 시트: 월(YYYY-MM), 입사자, 퇴사자, 총원"""
+    rng = np.random.default_rng(seed)
+    hires = rng.poisson(20, months)
+    seps = rng.poisson(18, months)
+    labels = np.arange(np.datetime64("2025-12", "M") - months + 1, np.datetime64("2026-01", "M"))
+    return pd.DataFrame(
+        {
+            "월": labels.astype(str),
+            "입사자": hires,
+            "퇴사자": seps,
+            "총원": 300 + np.cumsum(hires - seps),
+        }
+    )
+
+
+def make_turnover(years, depts, seed=0):
+    """퇴사율 시트: 연도 + 부서별 연간 퇴사자 수 컬럼"""
+    rng = np.random.default_rng(seed + 1)
+    scale = rng.gamma(2.0, 3.0, depts)          # 부서마다 다른 퇴사 규모
+    counts = rng.poisson(scale * rng.uniform(0.5, 1.5, (years, 1)))
+    df = pd.DataFrame(counts, columns=[f"부서{i:05d}" for i in range(depts)])
+    df.insert(0, "연도", np.arange(2025 - years + 1, 2026))
+    return df
+
+
+def make_retention(cohorts, cohort_months, seed=0):
+    """잔존율 시트: 입사연도, 경과개월(0..cohort_months-1), 잔존율(%) — 가끔 급락 구간 포함"""
+    rng = np.random.default_rng(seed + 2)
+    hazard = rng.uniform(0.0, 0.01, (cohorts, cohort_months))
+    spikes = rng.random((cohorts, cohort_months)) < 0.01
+    hazard[spikes] += rng.uniform(0.1, 0.3, spikes.sum())
+    hazard[:, 0] = 0.0
+    rate = 100 * np.cumprod(1 - hazard, axis=1)
+    return pd.DataFrame(
+        {
+            "입사연도": np.repeat(np.arange(2025 - cohorts + 1, 2026), cohort_months),
+            "경과개월": np.tile(np.arange(cohort_months), cohorts),
+            "잔존율": np.round(rate.ravel(), 1),
+        }
+    )
+
+
+def make_tenure(seed=0):
+    """근속 시트: 재직자/퇴사자 평균 근속년수"""
+    rng = np.random.default_rng(seed + 3)
+    return pd.DataFrame(
+        {
+            "구분": ["재직자 평균 근속", "퇴사자 평균 근속"],
+            "근속년수": np.round(rng.uniform(1, 5, 2), 2),
+        }
+    )
+
+
+def make_employee_tenure(employees, depts=10, seed=0):
+    """직원 단위 근속 시트: 입사일, 퇴사일(재직자는 빈 칸), 부서 — 기준일 2025-12-31"""
+    rng = np.random.default_rng(seed + 4)
+    as_of = np.datetime64("2025-12-31")
+    hire = as_of - rng.integers(0, 20 * 365, employees).astype("timedelta64[D]")
+    stay = rng.weibull(1.2, employees) * 5 * 365        # 근속 일수 (초기 이탈이 조금 많은 분포)
+    term = hire + stay.astype("timedelta64[D]")
+    left = term <= as_of
+    return pd.DataFrame(
+        {
+            "입사일": hire,
+            "퇴사일": np.where(left, term, np.datetime64("NaT")),
+            "부서": np.char.add("부서", rng.integers(0, depts, employees).astype(str)),
+        }
+    )
+
+
+def make_unit_change(months, depts, seed=0):
+    """조직별인원변동 시트: 부서, 월, 입사자, 퇴사자, 총원 (부서 × 월 long 형식)"""
+    rng = np.random.default_rng(seed + 5)
+    scale = rng.gamma(2.0, 1.0, (depts, 1))          # 부서마다 다른 입·퇴사 규모
+    hires = rng.poisson(scale, (depts, months))
+    seps = rng.poisson(scale * rng.uniform(0.8, 1.2, (depts, 1)), (depts, months))
+    labels = np.arange(np.datetime64("2025-12", "M") - months + 1, np.datetime64("2026-01", "M"))
+    return pd.DataFrame(
+        {
+            "부서": np.repeat([f"부서{i:05d}" for i in range(depts)], months),
+            "월": np.tile(labels.astype(str), depts),
+            "입사자": hires.ravel(),
+            "퇴사자": seps.ravel(),
+            "총원": (50 + np.cumsum(hires - seps, axis=1)).ravel(),
+        }
+    )
+
+
+def make_frames(months, years, depts, cohorts, cohort_months, employees=0, seed=0):
+    """{시트명: DataFrame} — 워크북 4개 시트 + 조직별인원변동 (employees > 0이면 근속 시트를 직원 단위로)"""
+    return {
+        "인원변동": make_change(months, seed),
+        "퇴사율": make_turnover(years, depts, seed),
+        "잔존율": make_retention(cohorts, cohort_months, seed),
+        "근속": (
+            make_employee_tenure(employees, min(depts, 20), seed) if employees
+            else make_tenure(seed)
+        ),
+        "조직별인원변동": make_unit_change(months, depts, seed),
+    }
+
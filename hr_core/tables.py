@@ -0,0 +1,57 @@
+"""큰 표(부서 리스크, 잔존율 급락 구간)의 정렬·필터·페이지 나누기
+
+Styler처럼 셀마다 HTML을 만들지 않고, 숫자는 컬럼 단위로 한 번에 반올림한 뒤
+현재 페이지 행만 잘라서 화면에 넘깁니다. 표시 서식은 화면 쪽 컬럼 설정으로 지정합니다.
+"""
+import math
+
+import pandas as pd
+
+from hr_core import risk as hr_risk
+
+PAGE_SIZE = 50
+SCORE_COLUMNS = ["전년대비스코어", "절대규모스코어", "최종리스크스코어"]
+
+# 정렬 시 문자열 순서 대신 의미 순서를 쓰는 컬럼
+_SORT_ORDER = {"리스크등급": hr_risk.GRADES}
+
+
+def risk_table_decimals(risk_df):
+    """리스크 표 컬럼별 소수 자릿수 — 퇴사자수는 정수, 스코어는 소수 둘째 자리"""
+    decimals = {c: 0 for c in risk_df.columns if c.endswith("년_퇴사자수")}
+    decimals.update({c: 2 for c in SCORE_COLUMNS if c in risk_df.columns})
+    return decimals
+
+
+def round_columns(df, decimals):
+    """{컬럼: 소수 자릿수}대로 컬럼 단위 반올림한 사본"""
+    return df.round(decimals)
+
+
+def _ordered(column):
+    return pd.Categorical(column, categories=_SORT_ORDER[column.name], ordered=True)
+
+
+def filter_sort(df, filters=None, sort_by=None, ascending=True):
+    """{컬럼: 허용 값 목록}으로 거르고 sort_by 기준으로 정렬 (동점은 기존 순서 유지)
+
+    허용 값이 None인 컬럼은 거르지 않고, 빈 목록이면 (모두 선택 해제) 빈 표를 반환합니다.
+    """
+    for col, values in (filters or {}).items():
+        if values is not None:
+            df = df[df[col].isin(values)]
+    if sort_by:
+        key = _ordered if sort_by in _SORT_ORDER else None
+        df = df.sort_values(sort_by, ascending=ascending, kind="stable", key=key)
+    return df
+
+
+def page_count(n_rows, page_size=PAGE_SIZE):
+    return max(math.ceil(n_rows / page_size), 1)
+
+
+def page_slice(df, page, page_size=PAGE_SIZE):
+    """1부터 시작하는 page 번호의 행만 반환 (범위를 벗어나면 마지막 페이지)"""
+    page = min(max(int(page), 1), page_count(len(df), page_size))
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
@@ -0,0 +1,154 @@
+"""조직 단위(부서·사업장 등)별 인원변동 인사이트 일괄 계산
+
+단위 × 월 long 형식 데이터를 (단위, 월) 순으로 한 번 정렬한 뒤 bincount로
+모든 단위의 최근 3개월 vs 직전 3개월 입·퇴사 합계, 장기 총원 변화, 추세 구간을 한 번에 구합니다.
+구간 판정(±5/20/40%)은 analyze_headcount의 if/elif 기준과 같은 경계를 배열 구간으로 적용하고,
+코멘트 문장은 화면에서 실제로 보는 단위에 대해서만 unit_comment로 만듭니다.
+"""
+import numpy as np
+import pandas as pd
+
+from hr_core import analysis as hr_analysis
+from hr_core.schema import SchemaError, to_month_key
+
+UNIT_SHEET = "조직별인원변동"
+COUNT_COLUMNS = ["입사자", "퇴사자", "총원"]
+WINDOW = 6   # 최근 3개월 + 직전 3개월
+
+# headcount_insights와 같은 경계: 음수 쪽은 "< 경계", 양수 쪽은 "> 경계"일 때 다음 구간
+NEGATIVE_EDGES = np.array([-40.0, -20.0, -5.0])
+POSITIVE_EDGES = np.array([5.0, 20.0, 40.0])
+TREND_LABELS = ["급감", "감소", "소폭 감소", "안정", "소폭 증가", "증가", "급증"]
+NO_COMPARISON = "비교 불가"
+OVERALL_LABELS = ["순증가", "순감소 + 퇴사 증가", "큰 변화 없음"]
+SUMMARY_COLUMNS = [
+    "개월수", "최근3개월_입사자", "직전3개월_입사자", "입사자_변화율", "입사자_추세",
+    "최근3개월_퇴사자", "직전3개월_퇴사자", "퇴사자_변화율", "퇴사자_추세", "총원_변화", "종합",
+]
+
+
+def unit_column(df_units):
+    """단위 컬럼 이름 (월·입사자·퇴사자·총원이 아닌 첫 컬럼)"""
+    for col in df_units.columns:
+        if col not in ("월", *COUNT_COLUMNS):
+            return col
+    raise SchemaError(f"'{UNIT_SHEET}' 시트에 조직 단위(부서·사업장 등) 컬럼이 없습니다.")
+
+
+def trend_bands(pct, sharp_drop=True):
+    """변화율(%) 배열 → TREND_LABELS 구간 번호 (NaN은 -1)
+
+    sharp_drop=False면 "급감" 구간 없이 "감소"로 합칩니다 (퇴사자 추세 기준).
+    """
+    pct = np.asarray(pct, dtype=float)
+    codes = np.where(
+        pct < 0,
+        np.searchsorted(NEGATIVE_EDGES, pct, side="right"),
+        3 + np.searchsorted(POSITIVE_EDGES, pct, side="left"),
+    )
+    if not sharp_drop:
+        codes = np.maximum(codes, 1)
+    return np.where(np.isnan(pct), -1, codes)
+
+
+def _labels(codes, labels):
+    categories = [*labels, NO_COMPARISON]
+    return pd.Categorical.from_codes(np.where(codes < 0, len(labels), codes), categories=categories)
+
+
+def _pct_change(new, old):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(old == 0, np.nan, (new - old) / old * 100)
+
+
+def sort_units(df_units, unit_col):
+    """(단위, 월) 순 정렬 정보 (codes, units, order, size, end)
+
+    codes: 정렬된 행의 단위 번호, units: 단위 이름, order: 원래 행 위치(이미 정렬돼 있으면 None),
+    size: 단위별 행 수, end: 단위별 마지막 행 다음 위치
+    """
+    codes, units = pd.factorize(df_units[unit_col], sort=True)
+    months = to_month_key(df_units["월"]).array.asi8
+    # ingest가 만드는 시트처럼 이미 (단위, 월) 순이면 정렬 생략
+    same = codes[1:] == codes[:-1]
+    if (codes[1:] >= codes[:-1]).all() and (months[1:][same] > months[:-1][same]).all():
+        order = None
+    else:
+        order = np.lexsort((months, codes))
+        codes = codes[order]
+    size = np.bincount(codes, minlength=len(units))
+    return codes, units, order, size, np.cumsum(size)
+
+
+def sorted_column(df_units, column, order):
+    values = df_units[column].to_numpy()
+    return values if order is None else values[order]
+
+
+def unit_headcount_summary(df_units, unit_col=None):
+    """단위별 인원변동 요약 DataFrame (index=단위, SUMMARY_COLUMNS) — 단위 수와 무관하게 한 번의 정렬"""
+    unit_col = unit_col or unit_column(df_units)
+    codes, units, order, size, end = sort_units(df_units, unit_col)
+    hires = sorted_column(df_units, "입사자", order)
+    seps = sorted_column(df_units, "퇴사자", order)
+    totals = sorted_column(df_units, "총원", order)
+
+    n_units = len(units)
+    start = end - size
+    from_end = end[codes] - 1 - np.arange(len(codes))   # 각 행이 단위 안에서 끝에서 몇 번째인지
+
+    last3 = from_end < 3
+    prev3 = (from_end >= 3) & (from_end < WINDOW)
+
+    def window_sum(values, mask):
+        return np.bincount(codes[mask], weights=values[mask], minlength=n_units).astype(np.int64)
+
+    hire_last3, hire_prev3 = window_sum(hires, last3), window_sum(hires, prev3)
+    sep_last3, sep_prev3 = window_sum(seps, last3), window_sum(seps, prev3)
+    # 3개월뿐인 단위는 직전 3개월을 같은 기간으로 처리 (analyze_headcount와 동일)
+    only3 = size == 3
+    hire_prev3 = np.where(only3, hire_last3, hire_prev3)
+    sep_prev3 = np.where(only3, sep_last3, sep_prev3)
+
+    has_rows = size > 0
+    total_change = np.zeros(n_units, dtype=np.int64)
+    total_change[has_rows] = totals[end[has_rows] - 1] - totals[start[has_rows]]
+
+    hire_chg = _pct_change(hire_last3, hire_prev3)
+    sep_chg = _pct_change(sep_last3, sep_prev3)
+
+    net = hire_last3 - sep_last3
+    overall = np.where(
+        (net > 0) & (sep_chg < 20), 0, np.where((net < 0) & (sep_chg > 20), 1, 2)
+    )
+
+    summary = pd.DataFrame(
+        {
+            "개월수": size,
+            "최근3개월_입사자": hire_last3,
+            "직전3개월_입사자": hire_prev3,
+            "입사자_변화율": hire_chg,
+            "입사자_추세": _labels(trend_bands(hire_chg), TREND_LABELS),
+            "최근3개월_퇴사자": sep_last3,
+            "직전3개월_퇴사자": sep_prev3,
+            "퇴사자_변화율": sep_chg,
+            "퇴사자_추세": _labels(trend_bands(sep_chg, sharp_drop=False), TREND_LABELS),
+            "총원_변화": total_change,
+            "종합": pd.Categorical.from_codes(overall, categories=OVERALL_LABELS),
+        },
+        index=pd.Index(units, name=unit_col),
+    )
+    # 3개월 미만 단위는 추세 분석에서 제외
+    return summary[summary["개월수"] >= 3]
+
+
+def unit_comment(summary, unit):
+    """한 단위의 인사이트 코멘트 (analyze_headcount와 같은 문장)"""
+    row = summary.loc[unit]
+    return hr_analysis.headcount_insights(
+        int(row["최근3개월_입사자"]),
+        int(row["직전3개월_입사자"]),
+        int(row["최근3개월_퇴사자"]),
+        int(row["직전3개월_퇴사자"]),
+        int(row["총원_변화"]),
+    )
@@ -0,0 +1,241 @@
+"""워크북 사전 로딩(warm-up)과 변경 감시
+
+WorkbookWatcher는 백그라운드 스레드에서 워크북을 읽고 모든 분석을 미리 계산한
+스냅샷을 만든 뒤, 워크북 파일이 바뀌면 새 스냅샷을 요청 경로 밖에서 다시 만들어
+참조 하나만 바꿔 끼웁니다. 요청을 처리하는 쪽은 항상 완성된 스냅샷만 읽습니다.
+
+서버를 띄우기 전에 디스크 캐시(Arrow 시트, 인원변동 증분 상태)를 미리 만들어 두려면:
+
+    python -m hr_core.warmup company_hr_data.xlsx
+"""
+import argparse
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from hr_core import analysis as hr_analysis
+from hr_core import anomaly as hr_anomaly
+from hr_core import cache as hr_cache
+from hr_core import incremental as hr_incremental
+from hr_core import schema as hr_schema
+from hr_core import survival as hr_survival
+from hr_core import units as hr_units
+
+POLL_SECONDS = 2.0
+ANALYSIS_SHEETS = ("인원변동", "퇴사율", "잔존율", "근속", hr_units.UNIT_SHEET)
+OPTIONAL_SHEETS = (hr_units.UNIT_SHEET,)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """한 데이터 버전의 정규화된 시트와 미리 계산한 분석 결과"""
+
+    version: str                       # 워크북 내용 sha256
+    sheets: dict
+    results: dict
+    built_at: str = ""
+    build_seconds: float = 0.0
+    stages: dict = field(default_factory=dict)
+
+
+def _timer(stages):
+    def timed(stage, func, *args):
+        t = time.perf_counter()
+        result = func(*args)
+        stages[stage] = time.perf_counter() - t
+        return result
+    return timed
+
+
+def _analyze(sheets, timed, headcount_comment):
+    """정규화 전 시트들 → (정규화된 시트, 기본 설정의 분석 결과)"""
+    sheets = timed("schema", hr_schema.normalize_sheets, sheets)
+    change, turnover, retention = sheets["인원변동"], sheets["퇴사율"], sheets["잔존율"]
+    # 근속 시트가 직원 단위일 때만 생존 곡선용 레코드가 만들어짐 (요약 시트면 None)
+    tenure = timed("tenure_records", hr_survival.tenure_records, sheets["근속"])
+    # 조직별인원변동 시트가 있을 때만 단위별 요약 (코멘트 문장은 화면에서 고른 단위만)
+    units = sheets[hr_units.UNIT_SHEET]
+
+    results = {
+        "headcount_line_data": timed(
+            "headcount_line_data", hr_analysis.make_headcount_line_data, change
+        ),
+        "headcount_comment": timed("headcount", headcount_comment, change),
+        "headcount_anomalies": timed("headcount_anomalies", hr_anomaly.scan_change, change),
+        "turnover_table": timed("turnover_table", hr_analysis.make_turnover_table, turnover),
+        "department": timed("department", hr_analysis.analyze_department_turnover, turnover),
+        "risk_history": timed("risk_history", hr_analysis.make_risk_history, turnover),
+        "retention_line_data": timed(
+            "retention_line_data", hr_analysis.make_retention_line_data, retention
+        ),
+        "retention": timed("retention", hr_analysis.analyze_retention, retention),
+        "tenure_records": tenure,
+        "survival": None if tenure is None else timed(
+            "survival", hr_survival.survival_curves, tenure
+        ),
+        "unit_summary": None if units is None else timed(
+            "unit_summary", hr_units.unit_headcount_summary, units
+        ),
+        "unit_anomalies": None if units is None else timed(
+            "unit_anomalies", hr_anomaly.scan_units, units
+        ),
+    }
+    return sheets, results
+
+
+def load_data(path):
+    """워크북 → 정규화된 {시트명: DataFrame} (화면 없이 워커·노트북에서 쓰는 용도, Arrow 캐시 사용)
+
+    조직별인원변동처럼 선택 시트가 워크북에 없으면 값이 None입니다.
+    """
+    sheets = hr_cache.load_sheets(path, ANALYSIS_SHEETS, hr_analysis.SHEET_COLUMNS, OPTIONAL_SHEETS)
+    return hr_schema.normalize_sheets(sheets)
+
+
+def build_snapshot(path):
+    """워크북을 읽어 기본 설정의 모든 분석을 계산한 스냅샷 생성"""
+    stages = {}
+    timed = _timer(stages)
+    start = time.perf_counter()
+
+    version = timed("fingerprint", hr_cache.workbook_fingerprint, path)["sha256"]
+    sheets = timed(
+        "load", hr_cache.load_sheets, path, ANALYSIS_SHEETS, hr_analysis.SHEET_COLUMNS,
+        OPTIONAL_SHEETS,
+    )
+    # 인원변동 코멘트는 워크북 캐시 폴더의 증분 상태로 계산
+    sheets, results = _analyze(
+        sheets, timed, lambda change: hr_incremental.headcount_state(path, change).comment()
+    )
+    return Snapshot(
+        version=version,
+        sheets=sheets,
+        results=results,
+        built_at=datetime.now().isoformat(timespec="seconds"),
+        build_seconds=time.perf_counter() - start,
+        stages=stages,
+    )
+
+
+def build_upload_snapshot(data, version=None):
+    """업로드된 워크북 바이트로 스냅샷 생성 (디스크 캐시·증분 상태 없이 메모리에서만)"""
+    stages = {}
+    timed = _timer(stages)
+    start = time.perf_counter()
+
+    version = version or timed("fingerprint", lambda: hashlib.sha256(data).hexdigest())
+    sheets = timed(
+        "load", hr_cache.read_excel_sheets, io.BytesIO(data), ANALYSIS_SHEETS,
+        hr_analysis.SHEET_COLUMNS, OPTIONAL_SHEETS,
+    )
+    sheets, results = _analyze(
+        sheets, timed, lambda change: hr_incremental.HeadcountState.from_frame(change).comment()
+    )
+    return Snapshot(
+        version=version,
+        sheets=sheets,
+        results=results,
+        built_at=datetime.now().isoformat(timespec="seconds"),
+        build_seconds=time.perf_counter() - start,
+        stages=stages,
+    )
+
+
+def _file_signature(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+class WorkbookWatcher:
+    """워크북을 주기적으로 stat해서 바뀌면 백그라운드에서 스냅샷을 다시 만드는 감시 스레드"""
+
+    def __init__(self, path, build=build_snapshot, interval=POLL_SECONDS):
+        self.path = path
+        self.build = build
+        self.interval = interval
+        self.snapshot = None          # 요청 쪽에서 읽는 현재 스냅샷 (통째로 교체)
+        self.error = None             # 마지막 빌드 실패 (이전 스냅샷은 계속 제공)
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="hr-workbook-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def wait(self, timeout=None):
+        """첫 스냅샷(또는 첫 실패)까지 대기 후 현재 스냅샷 반환 — 스냅샷이 없으면 마지막 오류를 다시 발생"""
+        self._ready.wait(timeout)
+        snapshot = self.snapshot
+        if snapshot is None:
+            if self.error is not None:
+                raise self.error
+            raise TimeoutError("워크북을 아직 불러오는 중입니다.")
+        return snapshot
+
+    def _rebuild(self):
+        try:
+            snapshot = self.build(self.path)
+        except Exception as e:  # 빌드가 실패해도 감시는 계속하고 이전 스냅샷을 유지
+            logger.warning("워크북 스냅샷 생성 실패: %s", e)
+            self.error = e
+        else:
+            if self.snapshot is None or snapshot.version != self.snapshot.version:
+                self.snapshot = snapshot  # 참조 대입 한 번으로 교체
+            self.error = None
+            logger.info(
+                "워크북 스냅샷 준비 완료 (%s, %.2fs)", snapshot.version[:12], snapshot.build_seconds
+            )
+        finally:
+            self._ready.set()
+
+    def _run(self):
+        built = None      # 마지막으로 빌드를 시도한 파일 상태 (크기, 수정 시각)
+        pending = None    # 바뀐 것을 본 파일 상태 — 한 주기 동안 그대로여야 빌드 (쓰는 도중 방지)
+        while True:
+            try:
+                signature = _file_signature(self.path)
+            except OSError as e:
+                signature = None
+                if not self._ready.is_set():
+                    self.error = FileNotFoundError(e.errno, e.strerror, self.path)
+                    self._ready.set()
+
+            if signature is not None and signature != built:
+                if built is None or signature == pending:
+                    built, pending = signature, None
+                    self._rebuild()
+                else:
+                    pending = signature
+
+            if self._stop.wait(self.interval):
+                return
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="워크북 디스크 캐시를 미리 만들어 두기")
+    parser.add_argument("path", nargs="?", default="company_hr_data.xlsx")
+    args = parser.parse_args(argv)
+
+    snapshot = build_snapshot(args.path)
+    stages = ", ".join(f"{k} {v:.3f}s" for k, v in snapshot.stages.items())
+    print(f"{args.path} ({snapshot.version[:12]}) 준비 완료: {snapshot.build_seconds:.2f}s  [{stages}]")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,9 @@
+"""테스트 공용 fixture"""
+import legacy as legacy_module
+import pytest
+
+
+@pytest.fixture
+def legacy():
+    """변경 전 app.py의 분석 함수(tests/legacy.py) — 새 구현과 비교하는 기준"""
+    return legacy_module
@@ -0,0 +1,56 @@
+"""전체 이력 3 vs 3 이상 구간 탐지(hr_core.anomaly) — 창 반복 계산과 비교"""
+import numpy as np
+import pandas as pd
+
+from hr_core import anomaly, schema, synthetic, units
+
+
+def _brute_3v3(values):
+    last3, prev3, pct = [], [], []
+    for i in range(len(values)):
+        last = values[i - 2:i + 1].sum() if i >= 2 else np.nan
+        prev = values[i - 5:i - 2].sum() if i >= 5 else np.nan
+        last3.append(last)
+        prev3.append(prev)
+        pct.append(np.nan if not prev or np.isnan(prev) else (last - prev) / prev * 100)
+    return np.array(last3), np.array(prev3), np.array(pct)
+
+
+def test_rolling_3v3_matches_window_loop():
+    values = np.random.default_rng(0).poisson(5, 40)
+    values[10:13] = 0   # 직전 3개월 합계 0 → 변화율 NaN
+    got = anomaly.rolling_3v3(values, np.arange(len(values)))
+    for ours, expected in zip(got, _brute_3v3(values)):
+        np.testing.assert_allclose(ours, expected, equal_nan=True)
+
+
+def test_rolling_3v3_with_three_months():
+    # 3개월뿐이면 마지막 달에 최근 3개월 합계만 있고 직전 3개월·변화율은 없음
+    last3, prev3, pct = anomaly.rolling_3v3(np.array([1, 2, 3]), np.arange(3))
+    np.testing.assert_array_equal(np.isnan(last3), [True, True, False])
+    assert last3[2] == 6
+    assert np.isnan(prev3).all() and np.isnan(pct).all()
+
+
+def test_scan_change_flags_match_trend_bands():
+    raw = synthetic.make_change(60, seed=3)
+    flags = anomaly.scan_change(schema.normalize_change(raw))
+    expected = []
+    for name in anomaly.SERIES:
+        _, _, pct = _brute_3v3(raw[name].to_numpy())
+        codes = units.trend_bands(pct, sharp_drop=name != "퇴사자")
+        for i in np.flatnonzero(np.isin(codes, anomaly.FLAG_CODES)):
+            expected.append((raw["월"].iloc[i], name, units.TREND_LABELS[codes[i]]))
+    got = list(zip(flags["월"].astype(str), flags["지표"].astype(str), flags["구간"].astype(str)))
+    assert sorted(got) == sorted(expected)
+    assert len(got) > 0
+
+
+def test_scan_units_does_not_cross_unit_boundaries():
+    raw = synthetic.make_unit_change(months=30, depts=5, seed=1)
+    raw = raw.sample(frac=1, random_state=2).reset_index(drop=True)
+    flags = anomaly.scan_units(schema.normalize_unit_change(raw))
+    for unit, group in raw.groupby("부서"):
+        alone = anomaly.scan_change(schema.normalize_change(group.drop(columns="부서")))
+        ours = flags[flags["부서"] == unit].drop(columns="부서").reset_index(drop=True)
+        pd.testing.assert_frame_equal(ours, alone, check_categorical=False)
@@ -0,0 +1,53 @@
+"""회사별 리포트 일괄 생성(hr_core.batch)"""
+import os
+import shutil
+import time
+
+import pytest
+
+from hr_core import batch, cache
+
+WORKBOOK = os.path.join(os.path.dirname(__file__), os.pardir, "company_hr_data.xlsx")
+
+
+def test_failed_report_leaves_no_empty_cache(tmp_path):
+    shutil.copy(WORKBOOK, tmp_path / "good.xlsx")
+    (tmp_path / "corrupt.xlsx").write_bytes(b"not a workbook")
+    cache_root = tmp_path / "cache"
+
+    paths = sorted(str(p) for p in tmp_path.glob("*.xlsx"))
+    summary = batch.run_batch(paths, str(tmp_path / "out"), workers=1, cache_root=str(cache_root))
+
+    status = {r["company"]: r["status"] for r in summary["results"]}
+    assert status == {"corrupt": "error", "good": "ok"}
+    assert not os.path.exists(cache.cache_dir_for(tmp_path / "corrupt.xlsx", cache_root))
+    assert os.path.exists(cache.cache_dir_for(tmp_path / "good.xlsx", cache_root))
+    assert (tmp_path / "out" / "good.md").exists()
+
+
+def test_batch_does_not_write_cache_into_input_folder(tmp_path):
+    inputs = tmp_path / "in"
+    inputs.mkdir()
+    shutil.copy(WORKBOOK, inputs / "a.xlsx")
+    summary = batch.run_batch([str(inputs / "a.xlsx")], str(tmp_path / "out"), workers=2)
+    assert summary["failed"] == 0
+    assert sorted(os.listdir(inputs)) == ["a.xlsx"]
+
+
+def _busy_report(path, out_dir, drop_threshold, cache_root=None):
+    """워크북 대신 CPU를 0.2초 이상 쓰는 리포트 — 워커 안에서 잰 CPU 시간을 단계로 반환"""
+    start = time.process_time()
+    while time.process_time() - start < 0.2:
+        pass
+    return {"busy": time.process_time() - start}
+
+
+def test_summary_reports_worker_cpu_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch, "build_report", _busy_report)
+    paths = [str(tmp_path / f"{name}.xlsx") for name in ("a", "b")]
+    summary = batch.run_batch(paths, str(tmp_path / "out"), workers=1)
+
+    for result in summary["results"]:
+        assert result["cpu_seconds"] >= result["stages"]["busy"] >= 0.2
+    assert summary["cpu_seconds"] == pytest.approx(sum(r["cpu_seconds"] for r in summary["results"]))
+    assert summary["cpu_seconds"] >= 0.4
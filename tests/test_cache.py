@@ -0,0 +1,133 @@
+"""워크북 시트 Arrow 캐시(hr_core.cache) — 캐시에서 읽은 결과가 엑셀을 바로 읽은 결과와 같은지 확인"""
+import os
+from datetime import datetime
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from hr_core import cache
+
+feather = pytest.importorskip("pyarrow.feather")
+
+CHANGE = [["월", "입사자", "퇴사자", "총원"], ["2025-01", 3, 1, 100], ["2025-02", 2, 4, 98]]
+# 엑셀 머리글에 숫자·날짜·불리언이 들어간 시트 (Feather는 컬럼 이름을 문자열로 저장)
+TURNOVER = [
+    ["연도", "개발", 2023, 1.5, datetime(2024, 1, 1), True],
+    [2024, 1, 2, 3, 4, 5],
+    [2025, 6, 7, 8, 9, 10],
+]
+
+
+def _write_workbook(path, sheets):
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    for name, rows in sheets.items():
+        ws = wb.create_sheet(name)
+        for row in rows:
+            ws.append(row)
+    wb.save(path)
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "hr.xlsx"
+    _write_workbook(path, {"인원변동": CHANGE, "퇴사율": TURNOVER})
+    return path
+
+
+def _no_excel(monkeypatch):
+    """이후 엑셀 파싱이 일어나면 실패하도록"""
+    def fail(*args, **kwargs):
+        raise AssertionError("캐시가 있는데 엑셀을 다시 열었습니다.")
+    monkeypatch.setattr(cache.pd, "ExcelFile", fail)
+
+
+def test_warm_load_matches_cold_read_excel(workbook, monkeypatch):
+    sheets = ("인원변동", "퇴사율")
+    cold = cache.read_excel_sheets(workbook, sheets)
+    first = cache.load_sheets(workbook, sheets)
+    _no_excel(monkeypatch)
+    warm = cache.load_sheets(workbook, sheets)
+
+    for sheet in sheets:
+        pd.testing.assert_frame_equal(first[sheet], cold[sheet])
+        pd.testing.assert_frame_equal(warm[sheet], cold[sheet])
+        assert [type(c) for c in warm[sheet].columns] == [type(c) for c in cold[sheet].columns]
+    assert list(warm["퇴사율"].columns) == ["연도", "개발", 2023, 1.5, datetime(2024, 1, 1), True]
+
+
+def test_old_cache_file_without_column_names_is_rebuilt(workbook):
+    manifest = cache.workbook_fingerprint(workbook)
+    target = cache._sheet_path(workbook, manifest, "퇴사율")
+    os.makedirs(os.path.dirname(target))
+    # 컬럼 이름 메타데이터 없이 문자열 이름으로 저장된 예전 캐시 파일
+    stale = cache.read_excel_sheets(workbook, ("퇴사율",))["퇴사율"]
+    feather.write_feather(stale.set_axis([str(c) for c in stale.columns], axis=1), target)
+
+    df = cache.load_sheet(workbook, "퇴사율")
+    assert list(df.columns) == ["연도", "개발", 2023, 1.5, datetime(2024, 1, 1), True]
+    assert cache.COLUMNS_KEY in feather.read_table(target).schema.metadata
+
+
+def test_content_change_invalidates_cache(workbook):
+    before = cache.load_sheet(workbook, "인원변동")
+    old_dir = os.path.dirname(cache._sheet_path(workbook, cache.workbook_fingerprint(workbook), "인원변동"))
+
+    edited = [row[:] for row in CHANGE]
+    edited[2][3] = 97
+    _write_workbook(workbook, {"인원변동": edited, "퇴사율": TURNOVER})
+    after = cache.load_sheet(workbook, "인원변동")
+
+    assert before["총원"].tolist() == [100, 98]
+    assert after["총원"].tolist() == [100, 97]
+    assert cache.workbook_fingerprint(workbook)["sha256"] == cache.file_sha256(workbook)
+    assert not os.path.exists(old_dir)   # 이전 버전 캐시는 정리
+
+
+def test_touch_without_content_change_reuses_cache(workbook, monkeypatch):
+    cache.load_sheet(workbook, "인원변동")
+    manifest = cache.workbook_fingerprint(workbook)
+    target = cache._sheet_path(workbook, manifest, "인원변동")
+    written = os.stat(target).st_mtime_ns
+
+    st = os.stat(workbook)
+    os.utime(workbook, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    _no_excel(monkeypatch)
+    df = cache.load_sheet(workbook, "인원변동")
+
+    assert df["총원"].tolist() == [100, 98]
+    assert cache.workbook_fingerprint(workbook)["mtime_ns"] == st.st_mtime_ns + 10**9
+    assert os.stat(target).st_mtime_ns == written
+
+
+def test_column_projection_cold_and_warm(workbook, monkeypatch):
+    columns = {"인원변동": ["총원", "월"], "퇴사율": ["연도", 2023]}
+    cold = cache.load_sheets(workbook, ("인원변동", "퇴사율"), columns)
+    _no_excel(monkeypatch)
+    warm = cache.load_sheets(workbook, ("인원변동", "퇴사율"), columns)
+
+    for sheet, cols in columns.items():
+        assert list(cold[sheet].columns) == cols
+        pd.testing.assert_frame_equal(warm[sheet], cold[sheet])
+    assert warm["퇴사율"][2023].tolist() == [2, 7]
+
+
+def test_missing_column_raises_cold_and_warm(workbook):
+    columns = {"인원변동": ["월", "부서"]}
+    for _ in range(2):   # 처음(엑셀)과 두 번째(캐시) 모두
+        with pytest.raises(ValueError, match="부서"):
+            cache.load_sheets(workbook, ("인원변동",), columns)
+    # 숫자 머리글 2023과 문자열 "2023"은 다른 컬럼
+    with pytest.raises(ValueError):
+        cache.load_sheets(workbook, ("퇴사율",), {"퇴사율": ["2023"]})
+
+
+def test_absent_optional_sheet_is_remembered(workbook, monkeypatch):
+    sheets = ("인원변동", "부서별인원변동")
+    first = cache.load_sheets(workbook, sheets, optional=("부서별인원변동",))
+    _no_excel(monkeypatch)
+    second = cache.load_sheets(workbook, sheets, optional=("부서별인원변동",))
+
+    assert first["부서별인원변동"] is None and second["부서별인원변동"] is None
+    pd.testing.assert_frame_equal(second["인원변동"], first["인원변동"])
@@ -0,0 +1,61 @@
+"""서버 측 다운샘플링(hr_core.downsample) — 점 수 상한과 피크 보존"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from hr_core import downsample
+
+
+def _headcount(n, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.period_range("1900-01", periods=n, freq="M")
+    hires, seps = rng.poisson(20, n), rng.poisson(18, n)
+    return pd.DataFrame(
+        {"입사자": hires, "퇴사자": seps, "총원": 300 + np.cumsum(hires - seps)}, index=index
+    )
+
+
+def test_lttb_keeps_first_last_and_count():
+    y = np.random.default_rng(1).normal(size=1000)
+    picked = downsample.lttb_indices(np.arange(1000), y, 50)
+    assert len(picked) == 50
+    assert picked[0] == 0 and picked[-1] == 999
+    assert (np.diff(picked) > 0).all()
+
+
+@pytest.mark.parametrize("n, max_points", [(5000, 300), (1000, 100), (1000, 7), (400, 399)])
+def test_frame_union_stays_within_max_points(n, max_points):
+    df = _headcount(n)
+    out = downsample.downsample_frame(df, max_points)
+    assert len(out) <= max_points
+    assert out.index.is_monotonic_increasing
+    assert out.index[0] == df.index[0] and out.index[-1] == df.index[-1]
+    pd.testing.assert_frame_equal(out, df.loc[out.index])
+
+
+def test_frame_short_enough_is_unchanged():
+    df = _headcount(100)
+    assert downsample.downsample_frame(df, 100) is df
+
+
+def test_frame_keeps_spikes_in_every_column():
+    df = _headcount(3000)
+    df.iloc[1234, 0] = 500      # 입사자 급증
+    df.iloc[2222, 1] = 400      # 퇴사자 급증
+    df.iloc[777, 2] = -5000     # 총원 급락
+    out = downsample.downsample_frame(df, 60)
+    for pos in (1234, 2222, 777):
+        assert df.index[pos] in out.index
+
+
+def test_long_limits_each_series_and_skips_missing():
+    wide = pd.DataFrame(np.random.default_rng(2).normal(size=(500, 3)), columns=[2023, 2024, 2025])
+    wide.iloc[400:, 2] = np.nan      # 최근 코호트는 관측 기간이 짧음
+    wide.iloc[250, 1] = 50.0
+    long = downsample.downsample_long(wide, 40, x_name="경과개월", series_name="입사연도")
+
+    counts = long.groupby("입사연도").size()
+    assert counts.to_dict() == {"2023": 40, "2024": 40, "2025": 40}
+    assert long["값"].notna().all()
+    assert long.loc[long["입사연도"] == "2025", "경과개월"].max() < 400
+    assert ((long["입사연도"] == "2024") & (long["경과개월"] == 250)).any()
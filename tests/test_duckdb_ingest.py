@@ -0,0 +1,39 @@
+"""DuckDB 집계 백엔드가 청크 집계(hr_core.ingest)와 같은 시트를 만드는지 확인"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from hr_core import ingest
+
+duckdb_ingest = pytest.importorskip("hr_core.duckdb_ingest")
+if duckdb_ingest.duckdb is None:
+    pytest.skip("duckdb가 설치되어 있지 않음", allow_module_level=True)
+
+
+def _records(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    # 1965년부터 입사 — 1970년 이전 입사연도(음수 월번호)의 코호트 계산 확인용
+    hire = pd.Timestamp("1965-01-01") + pd.to_timedelta(rng.integers(0, 365 * 30, n), unit="D")
+    tenure = pd.to_timedelta(rng.integers(0, 365 * 12, n), unit="D")
+    term = (hire + tenure).where(rng.random(n) < 0.6)
+    return pd.DataFrame(
+        {
+            ingest.DEPT_COL: rng.choice(["개발", "영업", "인사"], n),
+            ingest.HIRE_COL: hire,
+            ingest.TERM_COL: term,
+        }
+    )
+
+
+@pytest.mark.parametrize("as_of", [None, "1990-06-15"])
+def test_engines_match_with_pre_1970_hires(tmp_path, as_of):
+    path = tmp_path / "records.csv"
+    _records().to_csv(path, index=False)
+
+    chunked = ingest.aggregate_records(str(path), as_of=as_of, chunksize=500)
+    duck = duckdb_ingest.aggregate_file(str(path), as_of=as_of)
+
+    assert list(duck) == list(chunked)
+    assert len(chunked) == 5
+    for sheet, expected in chunked.items():
+        pd.testing.assert_frame_equal(duck[sheet], expected, check_dtype=False, obj=sheet)
@@ -0,0 +1,59 @@
+"""정적 HTML + JSON 내보내기(hr_core.export)"""
+import json
+import os
+
+import pytest
+
+from hr_core import export, ingest, synthetic, warmup
+
+
+@pytest.fixture(scope="module")
+def workbook(tmp_path_factory):
+    """다운샘플링이 일어나도록 인원변동이 긴 합성 워크북"""
+    frames = synthetic.make_frames(months=400, years=4, depts=5, cohorts=3, cohort_months=24, seed=3)
+    change = frames["인원변동"]
+    change.loc[[50, 51, 52], "퇴사자"] *= 4   # 3 vs 3 급증 구간
+    path = tmp_path_factory.mktemp("wb") / "hr.xlsx"
+    ingest.write_workbook(frames, path)
+    return path
+
+
+def test_chart_json_and_svg_use_the_same_rows(workbook, monkeypatch):
+    snapshot = warmup.build_snapshot(workbook)
+    anomaly_months = set(snapshot.results["headcount_anomalies"]["월"].astype(str))
+    assert anomaly_months
+
+    data = export.page_data(snapshot, max_points=40)
+    chart_months = data["page1"]["headcount_chart"]["월"]
+    assert anomaly_months <= set(chart_months)
+    assert len(chart_months) < len(snapshot.results["headcount_line_data"])
+
+    drawn = []
+    render = export._headcount_svg
+
+    def record(headcount, anomalies):
+        drawn.append(headcount)
+        return render(headcount, anomalies)
+    monkeypatch.setattr(export, "_headcount_svg", record)
+    export.render_html(snapshot, data, max_points=40)
+    assert [str(m) for m in drawn[0].index] == chart_months
+    assert drawn[0]["총원"].tolist() == data["page1"]["headcount_chart"]["총원"]
+
+
+def test_second_export_of_same_workbook_is_skipped(workbook, tmp_path, monkeypatch):
+    out = tmp_path / "site"
+    target, written = export.export_workbook(workbook, out)
+    assert written
+    index = os.path.join(target, "index.html")
+    first_mtime = os.stat(index).st_mtime_ns
+    with open(out / export.LATEST_NAME, encoding="utf-8") as f:
+        assert json.load(f)["path"] == f"{os.path.basename(target)}/"
+
+    def fail(path):
+        raise AssertionError("같은 버전인데 스냅샷을 다시 만들었습니다.")
+    monkeypatch.setattr(export.hr_warmup, "build_snapshot", fail)
+    again, written = export.export_workbook(workbook, out)
+
+    assert (again, written) == (target, False)
+    assert os.stat(index).st_mtime_ns == first_mtime
+    assert sorted(os.listdir(out)) == sorted([os.path.basename(target), "index.html", export.LATEST_NAME])
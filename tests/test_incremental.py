@@ -0,0 +1,79 @@
+"""인원변동 증분 상태(hr_core.incremental) — 변경 전 analyze_headcount와 같은 코멘트인지 확인"""
+import pytest
+
+from hr_core import analysis, schema, synthetic
+from hr_core.incremental import HeadcountState
+
+
+@pytest.mark.parametrize("months", [2, 3, 4, 6, 7, 36])
+def test_from_frame_matches_legacy(legacy, months):
+    raw = synthetic.make_change(months, seed=months)
+    df = schema.normalize_change(raw)
+    expected = legacy.analyze_headcount(raw)
+    assert analysis.analyze_headcount(df) == expected
+    assert HeadcountState.from_frame(df).comment() == expected
+
+
+def test_append_then_sync_matches_full_analysis(legacy):
+    raw = synthetic.make_change(30, seed=7)
+    df = schema.normalize_change(raw)
+
+    # 앞 20개월로 상태를 만든 뒤 한 달씩 append
+    state = HeadcountState.from_frame(df.iloc[:20])
+    months = analysis.to_month_period(df["월"])
+    for i in range(20, 25):
+        row = df.iloc[i]
+        state.append(months.iloc[i], row["입사자"].item(), row["퇴사자"].item(), row["총원"].item())
+        assert state.comment() == legacy.analyze_headcount(raw.iloc[:i + 1])
+
+    # 나머지는 sync로 — 뒤에 월만 추가된 경우라 새 행만 반영
+    synced = HeadcountState.from_frame(df.iloc[:25]).sync(df)
+    assert synced.n_months == 30
+    assert synced.comment() == legacy.analyze_headcount(raw)
+    assert synced == HeadcountState.from_frame(df)
+
+
+def test_sync_recomputes_when_existing_rows_change(legacy):
+    raw = synthetic.make_change(24, seed=2)
+    state = HeadcountState.from_frame(schema.normalize_change(raw))
+
+    edited = raw.copy()
+    edited.loc[22, "퇴사자"] += 50   # 최근 6개월 안의 기존 행 수정
+    df = schema.normalize_change(edited)
+    synced = state.sync(df)
+    assert synced.comment() == legacy.analyze_headcount(edited)
+    assert synced != state
+
+
+
+@pytest.mark.parametrize("order", ["reversed", "shuffled"])
+def test_sync_detects_edits_on_unsorted_sheet(legacy, order):
+    raw = synthetic.make_change(24, seed=5)
+    # 최신 월이 위에 오거나 행이 섞인 시트 — 시트 행 위치와 월 순서가 다름
+    if order == "reversed":
+        raw = raw.iloc[::-1].reset_index(drop=True)
+    else:
+        raw = raw.sample(frac=1, random_state=0).reset_index(drop=True)
+    state = HeadcountState.from_frame(schema.normalize_change(raw))
+    assert state == HeadcountState.from_frame(schema.normalize_change(synthetic.make_change(24, seed=5)))
+
+    # 최근 6개월 중 한 달을 수정 — 시트의 첫 행·마지막 6개 행이 아닌 위치
+    edited = raw.copy()
+    row = edited["월"].sort_values().index[-2]
+    assert row not in {0, *range(len(raw) - 6, len(raw))}
+    edited.loc[row, "입사자"] += 40
+    synced = state.sync(schema.normalize_change(edited))
+    assert synced != state
+    assert synced.comment() == legacy.analyze_headcount(edited)
+
+
+def test_sync_unchanged_returns_same_state():
+    df = schema.normalize_change(synthetic.make_change(12, seed=4))
+    state = HeadcountState.from_frame(df)
+    assert state.sync(df) is state
+
+
+def test_append_rejects_out_of_order_month():
+    state = HeadcountState.from_frame(schema.normalize_change(synthetic.make_change(6)))
+    with pytest.raises(ValueError):
+        state.append("2020-01", 1, 1, 1)
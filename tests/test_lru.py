@@ -0,0 +1,92 @@
+"""메모리 예산 LRU 캐시(hr_core.lru)"""
+import threading
+import time
+
+from hr_core.lru import LRUCache
+
+
+def _sized(cache_budget):
+    # 값 자체를 크기로 쓰는 캐시 (테스트용)
+    return LRUCache(cache_budget, sizeof=lambda value: value["size"])
+
+
+def test_evicts_least_recently_used_within_budget():
+    cache = _sized(100)
+    cache.put("a", {"size": 40})
+    cache.put("b", {"size": 40})
+    cache.get("a")
+    cache.put("c", {"size": 40})
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.total_bytes == 80
+    assert cache.evictions == 1
+
+
+def _concurrent_builds(cache, key, size, n_threads=8):
+    builds = []
+    started = threading.Event()
+
+    def build():
+        builds.append(1)
+        started.set()
+        time.sleep(0.2)   # 다른 요청들이 같은 키를 기다리는 동안
+        return {"size": size}
+
+    results = []
+    first = threading.Thread(target=lambda: results.append(cache.get_or_build(key, build)))
+    first.start()
+    started.wait()
+    waiters = [
+        threading.Thread(target=lambda: results.append(cache.get_or_build(key, build)))
+        for _ in range(n_threads - 1)
+    ]
+    for t in waiters:
+        t.start()
+    for t in [first, *waiters]:
+        t.join()
+    return builds, results
+
+
+def test_concurrent_requests_build_once():
+    cache = _sized(100)
+    builds, results = _concurrent_builds(cache, "k", 10)
+    assert len(builds) == 1
+    assert all(r is results[0] for r in results)
+    assert "k" in cache
+
+
+def test_waiters_share_result_too_large_to_cache():
+    cache = _sized(100)
+    builds, results = _concurrent_builds(cache, "big", 1000)
+    assert len(builds) == 1
+    assert all(r is results[0] for r in results)
+    assert "big" not in cache and len(cache) == 0
+    assert cache._key_locks == {}
+
+
+def test_failed_build_is_not_cached():
+    cache = _sized(100)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    try:
+        cache.get_or_build("k", fail)
+    except RuntimeError:
+        pass
+    assert "k" not in cache and cache._key_locks == {}
+    assert cache.get_or_build("k", lambda: {"size": 1}) == {"size": 1}
+
+
+def test_cached_none_is_a_hit():
+    cache = LRUCache(1000, sizeof=lambda value: 1)
+    builds = []
+
+    def build():   # 결과가 없는 위젯 조합 등 — None을 반환
+        builds.append(1)
+
+    assert cache.get_or_build("k", build) is None
+    assert cache.get_or_build("k", build) is None
+    assert len(builds) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.get("k", "없음") is None
+    assert cache.get("x", "없음") == "없음"
@@ -0,0 +1,27 @@
+"""패키지 지연 import(hr_core/__init__.py)"""
+import importlib
+import os
+import subprocess
+import sys
+
+import hr_core
+
+ROOT = os.path.join(os.path.dirname(__file__), os.pardir)
+
+
+def test_import_does_not_load_pandas_or_numpy():
+    code = (
+        "import sys, hr_core\n"
+        "print(','.join(m for m in ('pandas', 'numpy', 'hr_core.analysis') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == ""
+
+
+def test_all_matches_lazy_exports():
+    assert hr_core.__all__ == sorted(hr_core._EXPORTS)
+    for name, module in hr_core._EXPORTS.items():
+        assert getattr(hr_core, name) is getattr(importlib.import_module(module), name)
+    assert set(hr_core.__all__) <= set(dir(hr_core))
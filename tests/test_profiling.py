@@ -0,0 +1,92 @@
+"""단계별 소요 시간 계측(hr_core.profiling)"""
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+from hr_core import profiling, warmup
+
+WORKBOOK = os.path.join(os.path.dirname(__file__), os.pardir, "company_hr_data.xlsx")
+
+
+def _sleep_stage(profiler, name, seconds, **kwargs):
+    with profiler.stage(name, **kwargs) as rec:
+        time.sleep(seconds)
+        rec["rows"] = 1
+    return rec
+
+
+def test_records_named_stages_in_order():
+    profiler = profiling.StageProfiler(enabled=True)
+    names = ["parse", "normalize", "analyze", "format", "render"]
+    for name in names:
+        _sleep_stage(profiler, name, 0.01)
+
+    assert [row["단계"] for row in profiler.table()] == names
+    assert all(r["seconds"] >= 0.01 for r in profiler.records)
+    assert profiler.total_seconds() == pytest.approx(sum(r["seconds"] for r in profiler.records))
+    assert [row["행 수"] for row in profiler.table()] == [1] * 5
+
+
+def test_nested_stages_are_counted_once():
+    profiler = profiling.StageProfiler(enabled=True)
+    with profiler.stage("analyze") as outer:
+        time.sleep(0.01)
+        inner = _sleep_stage(profiler, "format", 0.02)
+    render = _sleep_stage(profiler, "render", 0.01)
+
+    assert (outer["depth"], inner["depth"], render["depth"]) == (0, 1, 0)
+    assert outer["seconds"] >= inner["seconds"] + 0.01
+    assert profiler.total_seconds() == pytest.approx(outer["seconds"] + render["seconds"])
+    assert [row["단계"] for row in profiler.table()] == ["analyze", "  format", "render"]
+
+
+def test_mark_miss_marks_innermost_cached_stage():
+    profiler = profiling.StageProfiler(enabled=True)
+    # 캐시 단계가 아닌 plain은 건너뛰고 outer에 표시
+    with profiler.stage("outer", cached=True) as outer, profiler.stage("plain") as plain:
+        profiling.mark_miss()
+    with profiler.stage("a", cached=True) as a, profiler.stage("b", cached=True) as b:
+        profiling.mark_miss()
+    assert (outer["cache"], plain["cache"], a["cache"], b["cache"]) == ("miss", "-", "hit", "miss")
+
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    log = tmp_path / "profile.jsonl"
+    profiler = profiling.StageProfiler(enabled=False, log_path=str(log))
+    _sleep_stage(profiler, "parse", 0)
+    profiling.mark_miss()
+    profiler.write_log(page="p")
+    assert profiler.records == [] and profiler.total_seconds() == 0
+    assert not log.exists()
+
+
+def test_snapshot_build_stages_and_log(tmp_path):
+    path = tmp_path / "hr.xlsx"
+    shutil.copy(WORKBOOK, path)
+    snapshot = warmup.build_snapshot(path)
+    log = tmp_path / "profile.jsonl"
+
+    for _ in range(2):   # 같은 스냅샷을 쓰는 두 번의 실행
+        profiler = profiling.StageProfiler(enabled=True, log_path=str(log))
+        profiler.record_build(snapshot.version, snapshot.stages, snapshot.build_seconds, snapshot.built_at)
+        with profiler.stage("분석 · 부서 리스크", built="department") as rec:
+            pass
+        _sleep_stage(profiler, "표 렌더링 · 리스크 표", 0)
+        profiler.write_log(page="p")
+
+    # 파싱(load) → 정규화(schema) → 분석 단계 순서로 빌드 시간이 남음
+    build_stages = [row["단계"] for row in profiler.build_table()]
+    assert build_stages[:3] == ["fingerprint", "load", "schema"]
+    assert {"headcount", "department", "retention"} <= set(build_stages)
+    assert rec["cache"] == "snapshot"
+    assert rec["build_seconds"] == snapshot.stages["department"]
+
+    lines = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+    builds = [line for line in lines if line.get("kind") == "build"]
+    runs = [line for line in lines if line.get("kind") != "build"]
+    assert [b["stage"] for b in builds] == [*snapshot.stages, "total"]   # 버전마다 한 번
+    assert len(runs) == 4 and {r["page"] for r in runs} == {"p"}
+    assert len({r["run"] for r in runs}) == 2
@@ -0,0 +1,39 @@
+"""잔존율 급락 구간(hr_core.retention) — 변경 전 구현과 비교"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from hr_core import analysis, retention, schema, synthetic
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_drops_and_comment_match_legacy(legacy, seed):
+    raw = synthetic.make_retention(cohorts=8, cohort_months=48, seed=seed)
+    raw = raw.sample(frac=1, random_state=seed).reset_index(drop=True)   # 정렬되지 않은 입력
+    expected_comment, expected = legacy.analyze_retention(raw)
+    comment, drops_df, _ = analysis.analyze_retention(schema.normalize_retention(raw))
+
+    assert comment == expected_comment
+    key = ["입사연도", "경과개월"]
+    ours = drops_df.sort_values(key).reset_index(drop=True)
+    theirs = expected.sort_values(key).reset_index(drop=True)
+    pd.testing.assert_frame_equal(ours, theirs, check_dtype=False)
+    # 기본 정렬은 변화량 오름차순 (가장 크게 떨어진 구간이 첫 행)
+    assert drops_df["변화량"].is_monotonic_increasing
+
+
+def test_worst_drop_per_cohort():
+    df = pd.DataFrame(
+        {
+            "입사연도": [2020] * 4 + [2021] * 3 + [2022],
+            "경과개월": [0, 6, 12, 18, 0, 6, 12, 0],
+            "잔존율": [100, 90, 70, 69, 100, 100, 100, 100],
+        }
+    )
+    drops, worst = retention.cohort_drops(df)
+    assert drops[["입사연도", "경과개월"]].values.tolist() == [[2020, 12], [2020, 6]]
+    assert worst["입사연도"].tolist() == [2020, 2021, 2022]
+    assert worst["최대낙폭"].iloc[0] == -20
+    assert worst["최대낙폭개월"].iloc[0] == 12
+    assert np.isnan(worst["최대낙폭"].iloc[1:]).all()
+    assert worst["최대낙폭개월"].iloc[1:].isna().all()
@@ -0,0 +1,53 @@
+"""부서 리스크 스코어·등급(hr_core.risk) — 변경 전 구현과 비교"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from hr_core import analysis, risk, schema, synthetic
+
+
+def _legacy_pair(legacy, df_turnover, year):
+    """legacy 구현에 (직전 연도, 해당 연도) 두 해만 넣어 얻은 리스크 표"""
+    prev = df_turnover["연도"][df_turnover["연도"] < year].max()
+    _, risk_df = legacy.analyze_department_turnover(df_turnover[df_turnover["연도"].isin([prev, year])])
+    return risk_df
+
+
+def _assert_same_risk(rows, expected):
+    """부서별 스코어·등급 비교 (rows: department_risk 결과, expected: legacy 리스크 표)"""
+    rows = rows.set_index(rows["부서"].astype(object))
+    expected = expected.set_index("부서").loc[rows.index]
+    for col in ["전년대비스코어", "절대규모스코어", "최종리스크스코어"]:
+        np.testing.assert_allclose(rows[col], expected[col], equal_nan=True)
+    assert rows["리스크등급"].tolist() == expected["리스크등급"].tolist()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_latest_risk_matches_legacy(legacy, seed):
+    raw = synthetic.make_turnover(years=6, depts=12, seed=seed)
+    raw.iloc[-2, 3] = 0   # 직전 연도 0명 → 전년대비스코어 NaN 경로
+    expected_comment, expected = legacy.analyze_department_turnover(raw)
+    comment, risk_df = analysis.analyze_department_turnover(schema.normalize_turnover(raw))
+
+    assert comment == expected_comment
+    pd.testing.assert_frame_equal(
+        risk_df.reset_index(drop=True), expected.reset_index(drop=True), check_dtype=False
+    )
+
+
+def test_ties_and_grade_caps_match_legacy(legacy):
+    # 동점 스코어와 1.2 이상 부서가 2개를 넘는 경우 (High는 상위 2개까지)
+    raw = pd.DataFrame(
+        {"연도": [2024, 2025], "A": [10, 20], "B": [10, 20], "C": [10, 20], "D": [10, 10], "E": [0, 0]}
+    )
+    _, expected = legacy.analyze_department_turnover(raw)
+    latest = risk.department_risk(schema.normalize_turnover(raw), latest_only=True)
+    assert latest["리스크등급"].tolist() == ["High", "High", "Medium", "Low", "Low"]
+    _assert_same_risk(latest, expected)
+
+
+def test_all_year_pairs_match_legacy_per_pair(legacy):
+    raw = synthetic.make_turnover(years=5, depts=8, seed=11)
+    history = risk.department_risk(schema.normalize_turnover(raw))
+    for year, rows in history.groupby("연도"):
+        _assert_same_risk(rows, _legacy_pair(legacy, raw, year))
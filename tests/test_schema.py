@@ -0,0 +1,143 @@
+"""시트 스키마 검증·정규화(hr_core.schema) — 오류 경로와 정규화 후 dtype"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from hr_core import schema
+
+
+def _change(**overrides):
+    df = pd.DataFrame(
+        {
+            "월": ["2025-01", "2025-02", "2025-03"],
+            "입사자": [3, 2, 5],
+            "퇴사자": [1, 4, 0],
+            "총원": [100, 98, 103],
+            "비고": ["", "x", ""],
+        }
+    )
+    for col, values in overrides.items():
+        df[col] = values
+    return df
+
+
+def test_change_dtypes():
+    df = schema.normalize_change(_change())
+    assert df["월"].dtype == pd.PeriodDtype("M")
+    assert df[["입사자", "퇴사자", "총원"]].dtypes.tolist() == [np.dtype("int32")] * 3
+    assert list(df.columns) == ["월", "입사자", "퇴사자", "총원", "비고"]   # 나머지 컬럼은 그대로
+    # 이미 정규화된 시트를 다시 넣어도 같은 결과
+    pd.testing.assert_frame_equal(schema.normalize_change(df), df)
+
+
+def test_change_accepts_excel_dates_and_float_counts():
+    raw = _change(월=pd.to_datetime(["2025-01-01", "2025-02-01", "2025-03-15"]), 입사자=[3.0, 2.0, 5.0])
+    df = schema.normalize_change(raw)
+    assert df["월"].astype(str).tolist() == ["2025-01", "2025-02", "2025-03"]
+    assert df["입사자"].dtype == np.int32
+
+
+def test_missing_column():
+    with pytest.raises(schema.SchemaError, match=r"필요한 컬럼이 없습니다: \['총원'\]"):
+        schema.normalize_change(_change().drop(columns="총원"))
+
+
+def test_unparseable_month():
+    with pytest.raises(schema.SchemaError, match="'월' 컬럼을 연-월로 읽을 수 없습니다"):
+        schema.normalize_change(_change(월=["2025-01", "내년 2월", "2025-03"]))
+
+
+def test_empty_month_reports_excel_row():
+    with pytest.raises(schema.SchemaError, match="'월' 컬럼의 3행: 값이 비어 있습니다"):
+        schema.normalize_change(_change(월=["2025-01", None, "2025-03"]))
+
+
+@pytest.mark.parametrize(
+    "values, message",
+    [
+        ([3, 2.5, 5], "'입사자' 컬럼의 3행: 정수가 아닌 값이 있습니다"),
+        ([3, "두 명", 5], "'입사자' 컬럼의 3행: 숫자가 아닌 값이 있습니다"),
+        ([3, None, 5], "'입사자' 컬럼의 3행: 값이 비어 있습니다"),
+        ([3, 2, 2**31], "'입사자' 컬럼의 4행: int32 범위를 벗어난 값이 있습니다"),
+    ],
+)
+def test_non_integer_counts(values, message):
+    with pytest.raises(schema.SchemaError, match=message):
+        schema.normalize_change(_change(입사자=values))
+
+
+def test_error_lists_at_most_five_rows():
+    raw = pd.DataFrame({"월": ["2025-01"] * 8, "입사자": [0.5] * 8, "퇴사자": [0] * 8, "총원": [1] * 8})
+    with pytest.raises(schema.SchemaError, match="2, 3, 4, 5, 6행 외 3개"):
+        schema.normalize_change(raw)
+
+
+def test_turnover_dtypes():
+    raw = pd.DataFrame(
+        {
+            "연도": [2024.0, 2025.0],
+            "개발": [3, 4],
+            "영업": [1.0, np.nan],      # 해당 연도에 없던 부서 — 빈 칸 허용
+            "인사": ["2", "5"],         # 문자로 들어온 숫자
+        }
+    )
+    df = schema.normalize_turnover(raw)
+    assert df.dtypes.to_dict() == {
+        "연도": np.dtype("int16"),
+        "개발": np.dtype("int32"),
+        "영업": np.dtype("float64"),
+        "인사": np.dtype("int32"),
+    }
+    assert list(df.columns) == ["연도", "개발", "영업", "인사"]
+
+
+@pytest.mark.parametrize(
+    "column, values, message",
+    [
+        ("연도", [2024, None], "'연도' 컬럼의 3행: 값이 비어 있습니다"),
+        ("연도", [2024, 40000], "'연도' 컬럼의 3행: int16 범위를 벗어난 값이 있습니다"),
+        ("개발", [1, 1.5], "'개발' 컬럼의 3행: 정수가 아닌 값이 있습니다"),
+        ("인사", ["2", "다섯"], "'인사' 컬럼의 3행: 숫자가 아닌 값이 있습니다"),
+    ],
+)
+def test_turnover_errors(column, values, message):
+    raw = pd.DataFrame({"연도": [2024, 2025], "개발": [3, 4], "인사": ["2", "5"]})
+    raw[column] = values
+    with pytest.raises(schema.SchemaError, match=message):
+        schema.normalize_turnover(raw)
+
+
+def test_retention_dtypes_and_trailing_empty_rows():
+    raw = pd.DataFrame(
+        {"입사연도": [2024, 2024, None], "경과개월": [0, 6, None], "잔존율": [100, 91.5, None]}
+    )
+    df = schema.normalize_retention(raw)
+    assert len(df) == 2
+    assert df.dtypes.tolist() == [np.dtype("int16"), np.dtype("int16"), np.dtype("float64")]
+    with pytest.raises(schema.SchemaError, match="'잔존율' 컬럼의 2행: 숫자가 아닌 값이 있습니다"):
+        schema.normalize_retention(raw.assign(잔존율=["높음", 90, None]))
+
+
+def test_unit_change_category_and_errors():
+    raw = _change().drop(columns="비고")
+    raw.insert(0, "부서", ["개발", "영업", "개발"])
+    df = schema.normalize_unit_change(raw)
+    assert isinstance(df["부서"].dtype, pd.CategoricalDtype)
+    assert df["총원"].dtype == np.int32
+    assert schema.normalize_unit_change(None) is None
+
+    with pytest.raises(schema.SchemaError, match="조직 단위"):
+        schema.normalize_unit_change(raw.drop(columns="부서"))
+    with pytest.raises(schema.SchemaError, match="'부서' 컬럼의 2행: 값이 비어 있습니다"):
+        schema.normalize_unit_change(raw.assign(부서=[None, "영업", "개발"]))
+
+
+def test_normalize_sheets_leaves_unknown_sheets():
+    tenure = pd.DataFrame({"구분": ["재직자 평균 근속"], "근속년수": [3.2]})
+    out = schema.normalize_sheets({"인원변동": _change(), "근속": tenure})
+    assert out["근속"] is tenure
+    assert out["인원변동"]["총원"].dtype == np.int32
+
+
+def test_schema_error_is_value_error():
+    assert issubclass(schema.SchemaError, ValueError)
@@ -0,0 +1,88 @@
+"""Kaplan–Meier 곡선 검증 (lifelines 결과와 비교) 및 근속 시트 오류 처리"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from hr_core import survival
+from hr_core.schema import SchemaError
+
+
+def _random_tenure(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "근속개월": rng.integers(0, 120, n),
+            "퇴사": rng.random(n) < 0.55,
+            "입사연도": rng.choice([2018, 2019, 2020, 2021], n),
+        }
+    )
+
+
+# seed 1은 2018년 입사자 그룹이 마지막 시점에 모두 퇴사해 생존율이 0이 되는 경우 포함
+@pytest.mark.parametrize("seed, n", [(0, 3000), (1, 500)])
+def test_kaplan_meier_matches_lifelines(seed, n):
+    lifelines = pytest.importorskip("lifelines")
+    records = _random_tenure(n, seed)
+    curves = survival.survival_curves(records, "입사연도")
+
+    for year, group in records.groupby("입사연도"):
+        fitter = lifelines.KaplanMeierFitter(alpha=survival.ALPHA)
+        fitter.fit(group["근속개월"], group["퇴사"])
+        ours = curves[curves["그룹"] == year].set_index("근속개월")
+        expected = fitter.survival_function_.iloc[:, 0].reindex(ours.index)
+        ci = fitter.confidence_interval_survival_function_.reindex(ours.index)
+        table = fitter.event_table.reindex(ours.index)
+
+        np.testing.assert_allclose(ours["생존율"], expected, rtol=1e-10, atol=1e-12)
+        # 생존율 0 이후 구간은 lifelines가 NaN으로 두고 여기서는 0으로 표시
+        positive = (expected > 0).to_numpy()
+        np.testing.assert_allclose(ours["하한"][positive], ci.iloc[:, 0][positive], rtol=1e-8)
+        np.testing.assert_allclose(ours["상한"][positive], ci.iloc[:, 1][positive], rtol=1e-8)
+        np.testing.assert_array_equal(ours["위험인원"], table["at_risk"])
+        np.testing.assert_array_equal(ours["퇴사인원"], table["observed"])
+        np.testing.assert_array_equal(ours["중도절단"], table["censored"])
+
+
+def test_groups_do_not_leak_into_each_other():
+    records = _random_tenure(n=500, seed=1)
+    curves = survival.survival_curves(records, "입사연도")
+    for year, group in records.groupby("입사연도"):
+        alone = survival.kaplan_meier(group["근속개월"], group["퇴사"])
+        ours = curves[curves["그룹"] == year].reset_index(drop=True)
+        np.testing.assert_allclose(ours["생존율"], alone["생존율"])
+        assert ours["위험인원"].iloc[0] == len(group)
+
+
+def test_tenure_records_from_dates():
+    df = pd.DataFrame(
+        {
+            "입사일": ["2020-01-15", "2020-03-01", "2021-06-30"],
+            "퇴사일": ["2020-07-14", None, None],
+            "부서": ["개발", "영업", "개발"],
+        }
+    )
+    records = survival.tenure_records(df, as_of="2021-12-31")
+    assert records["근속개월"].tolist() == [5, 21, 6]
+    assert records["퇴사"].tolist() == [True, False, False]
+    assert records["입사연도"].tolist() == [2020, 2020, 2021]
+
+
+def test_tenure_records_rejects_termination_before_hire():
+    df = pd.DataFrame(
+        {
+            "입사일": ["2020-01-01", "2020-05-01", "2021-01-01"],
+            "퇴사일": ["2020-06-01", "2020-02-01", None],
+        }
+    )
+    with pytest.raises(SchemaError, match="3행"):
+        survival.tenure_records(df)
+
+
+def test_kaplan_meier_rejects_negative_durations():
+    with pytest.raises(ValueError):
+        survival.kaplan_meier([3, -1, 5], [True, True, False])
+
+
+def test_summary_sheet_returns_none():
+    df = pd.DataFrame({"구분": ["재직자 평균 근속", "퇴사자 평균 근속"], "근속년수": [3.2, 1.8]})
+    assert survival.tenure_records(df) is None
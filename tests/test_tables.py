@@ -0,0 +1,33 @@
+"""표 정렬·필터·페이지 나누기(hr_core.tables)"""
+import pandas as pd
+
+from hr_core import tables
+
+
+def _risk_table():
+    return pd.DataFrame(
+        {"부서": ["A", "B", "C", "D"], "리스크등급": ["Low", "High", "Medium", "High"], "점수": [1, 4, 2, 3]}
+    )
+
+
+def test_empty_selection_returns_empty_table():
+    view = tables.filter_sort(_risk_table(), {"리스크등급": []})
+    assert view.empty
+    assert list(view.columns) == list(_risk_table().columns)
+
+
+def test_none_filter_keeps_all_rows():
+    assert len(tables.filter_sort(_risk_table(), {"리스크등급": None})) == 4
+    assert len(tables.filter_sort(_risk_table(), None)) == 4
+
+
+def test_grade_sort_uses_risk_order_and_is_stable():
+    view = tables.filter_sort(_risk_table(), {"리스크등급": ["High", "Low"]}, "리스크등급")
+    assert view["부서"].tolist() == ["B", "D", "A"]
+
+
+def test_page_slice_clamps_to_last_page():
+    df = pd.DataFrame({"x": range(120)})
+    assert tables.page_count(len(df)) == 3
+    assert tables.page_slice(df, 9)["x"].tolist() == list(range(100, 120))
+    assert tables.page_count(0) == 1
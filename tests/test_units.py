@@ -0,0 +1,66 @@
+"""조직 단위 일괄 요약(hr_core.units) — 구간 경계와 단위별 analyze_headcount 일치 확인"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from hr_core import schema, synthetic, units
+
+
+@pytest.mark.parametrize(
+    "pct, label",
+    [
+        (-40.1, "급감"), (-40.0, "감소"), (-20.1, "감소"), (-20.0, "소폭 감소"),
+        (-5.1, "소폭 감소"), (-5.0, "안정"), (0.0, "안정"), (5.0, "안정"),
+        (5.1, "소폭 증가"), (20.0, "소폭 증가"), (20.1, "증가"), (40.0, "증가"), (40.1, "급증"),
+    ],
+)
+def test_trend_band_edges_match_headcount_insights(pct, label):
+    # headcount_insights의 if/elif: "> 40"은 급증, "< -40"은 급감 (경계값은 한 단계 안쪽)
+    code = units.trend_bands(np.array([pct]))[0]
+    assert units.TREND_LABELS[code] == label
+
+
+def test_trend_bands_without_sharp_drop_and_nan():
+    codes = units.trend_bands(np.array([-60.0, -30.0, np.nan]), sharp_drop=False)
+    assert codes.tolist() == [1, 1, -1]
+
+
+def _unit_frame(seed=0):
+    df = synthetic.make_unit_change(months=14, depts=6, seed=seed)
+    # 단위마다 길이를 다르게 — 2개월(제외), 3개월(직전 = 최근), 4·5·6개월, 전체
+    lengths = [2, 3, 4, 5, 6, 14]
+    parts = [g.tail(n) for n, (_, g) in zip(lengths, df.groupby("부서", sort=True))]
+    return pd.concat(parts, ignore_index=True)
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_unit_summary_matches_per_unit_analyze_headcount(legacy, shuffle):
+    raw = _unit_frame()
+    if shuffle:
+        raw = raw.sample(frac=1, random_state=0).reset_index(drop=True)
+    df = schema.normalize_unit_change(raw)
+    summary = units.unit_headcount_summary(df)
+
+    sizes = raw.groupby("부서").size()
+    assert sorted(summary.index) == sorted(sizes[sizes >= 3].index)
+    for unit in summary.index:
+        expected = legacy.analyze_headcount(raw[raw["부서"] == unit])
+        assert units.unit_comment(summary, unit) == expected
+
+
+def test_unit_summary_windows_stop_at_unit_boundaries():
+    # 앞 단위의 값이 뒤 단위 창에 섞이면 합계가 달라지도록 크기가 다른 값 사용
+    raw = pd.DataFrame(
+        {
+            "부서": ["A"] * 6 + ["B"] * 4,
+            "월": [f"2025-{m:02d}" for m in range(1, 7)] + [f"2025-{m:02d}" for m in range(3, 7)],
+            "입사자": [100, 100, 100, 100, 100, 100, 1, 2, 3, 4],
+            "퇴사자": [0] * 6 + [1, 1, 1, 1],
+            "총원": [100, 200, 300, 400, 500, 600, 10, 11, 13, 16],
+        }
+    )
+    summary = units.unit_headcount_summary(schema.normalize_unit_change(raw))
+    b = summary.loc["B"]
+    assert (b["최근3개월_입사자"], b["직전3개월_입사자"]) == (9, 1)
+    assert b["총원_변화"] == 6
+    assert summary.loc["A", "직전3개월_입사자"] == 300
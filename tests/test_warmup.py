@@ -0,0 +1,100 @@
+"""워크북 감시·스냅샷 교체(hr_core.warmup.WorkbookWatcher) — 임시 워크북으로 확인"""
+import os
+import shutil
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from hr_core import cache, warmup
+
+WORKBOOK = os.path.join(os.path.dirname(__file__), os.pardir, "company_hr_data.xlsx")
+
+
+def _until(cond, timeout=20):
+    deadline = time.monotonic() + timeout
+    while not cond():
+        if time.monotonic() > deadline:
+            raise AssertionError("시간 안에 조건이 만족되지 않았습니다.")
+        time.sleep(0.01)
+
+
+def _edited_copy(src, dst):
+    """총원 한 칸만 바꾼 워크북 사본"""
+    sheets = pd.read_excel(src, sheet_name=None)
+    sheets["인원변동"].loc[sheets["인원변동"].index[-1], "총원"] += 1
+    with pd.ExcelWriter(dst) as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+
+
+@pytest.fixture
+def watched(tmp_path, monkeypatch):
+    """(워크북 경로, 감시 스레드, 이벤트 기록) — 폴링·빌드 순서를 기록"""
+    path = tmp_path / "hr.xlsx"
+    shutil.copy(WORKBOOK, path)
+    events = []
+    lock = threading.Lock()
+
+    def signature(p):
+        sig = os.stat(p).st_size, os.stat(p).st_mtime_ns
+        with lock:
+            events.append(("poll", sig))
+        return sig
+
+    def build(p):
+        with lock:
+            events.append(("build", events[-1][1]))
+        return warmup.build_snapshot(p)
+
+    monkeypatch.setattr(warmup, "_file_signature", signature)
+    watcher = warmup.WorkbookWatcher(str(path), build=build, interval=0.05).start()
+    yield path, watcher, events
+    watcher.stop()
+
+
+def _builds(events):
+    return [sig for kind, sig in events if kind == "build"]
+
+
+def test_change_is_debounced_then_swapped(watched, tmp_path):
+    path, watcher, events = watched
+    first = watcher.wait(20)
+    assert first.version == cache.file_sha256(path)
+
+    # 수정 시각만 바뀐 경우: 다시 빌드하지만 내용이 같으므로 스냅샷은 그대로
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    _until(lambda: len(_builds(events)) == 2)
+    assert watcher.snapshot is first
+
+    _edited_copy(WORKBOOK, tmp_path / "edited.xlsx")
+    shutil.copy(tmp_path / "edited.xlsx", path)
+    _until(lambda: watcher.snapshot is not first)
+    second = watcher.snapshot
+    assert second.version == cache.file_sha256(path) != first.version
+    assert second.sheets["인원변동"]["총원"].iloc[-1] == first.sheets["인원변동"]["총원"].iloc[-1] + 1
+    assert first.version == cache.file_sha256(WORKBOOK)   # 이전 스냅샷은 바뀌지 않음
+
+    # 첫 빌드 이후의 빌드는 같은 파일 상태를 두 번 연속 본 뒤에만 실행
+    for i, (kind, sig) in enumerate(events):
+        if kind == "build" and i > 1:
+            polls = [s for k, s in events[:i] if k == "poll"]
+            assert polls[-1] == polls[-2] == sig
+    assert _builds(events)[-1] == (os.stat(path).st_size, os.stat(path).st_mtime_ns)
+
+
+def test_corrupt_write_keeps_last_good_snapshot(watched):
+    path, watcher, _ = watched
+    good = watcher.wait(20)
+
+    path.write_bytes(b"not a workbook")
+    _until(lambda: watcher.error is not None)
+    assert watcher.snapshot is good
+    assert watcher.wait(0) is good
+
+    # 정상 워크북으로 되돌리면 오류가 지워지고 다시 같은 버전으로 돌아옴
+    shutil.copy(WORKBOOK, path)
+    _until(lambda: watcher.error is None)
+    assert watcher.snapshot.version == good.version